@@ -1,11 +1,19 @@
-from fastapi import APIRouter, HTTPException, status
-from ..schemas.admin import AdminLogin, TokenResponse
+from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Dict
+from ..schemas.admin import AdminLogin, RefreshRequest, TokenResponse
 from ..services.auth_service import AuthService
+from ..services.session_service import SessionService
+from ..utils.password_handler import PasswordHasherBusy
+from .dependencies import get_current_admin, rate_limit
 
 router = APIRouter(prefix="/admin", tags=["Admin Authentication"])
 
 
-@router.post("/login", response_model=TokenResponse)
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(rate_limit("login_ip", "login_email"))],
+)
 async def admin_login(credentials: AdminLogin):
     try:
         admin = await AuthService.authenticate_admin(
@@ -20,18 +28,46 @@ async def admin_login(credentials: AdminLogin):
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        access_token = AuthService.create_admin_token(admin)
-
-        return TokenResponse(
-            access_token=access_token,
-            token_type="bearer",
-            admin_email=admin["email"],
-            organization_name=admin["organization_name"],
-        )
+        return TokenResponse(**await SessionService.open_session(admin))
     except HTTPException:
         raise
+    except PasswordHasherBusy as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e),
         )
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh_token(payload: RefreshRequest):
+    # Renewal checks the session, not the password, so it skips PBKDF2 entirely.
+    try:
+        tokens = await SessionService.refresh(payload.refresh_token)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    if tokens is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return TokenResponse(**tokens)
+
+
+@router.post("/logout")
+async def logout(current_admin: Dict = Depends(get_current_admin)):
+    session_id = current_admin.get("sid")
+    if not session_id:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Token is not bound to a session")
+    try:
+        await SessionService.revoke_sessions([session_id])
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+    return {"message": "Logged out successfully"}
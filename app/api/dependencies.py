@@ -1,9 +1,18 @@
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from typing import Dict
+import hmac
+import math
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import APIKeyHeader, HTTPBearer, HTTPAuthorizationCredentials
+from typing import Dict, Optional
+from ..config import get_settings
 from ..services.auth_service import AuthService
+from ..services.revocation_list import revocation_list
+from ..services.usage_tracker import QuotaExceeded, usage_tracker
+from ..utils.rate_limiter import RateLimiter
+
+settings = get_settings()
 
 security = HTTPBearer()
+operator_key = APIKeyHeader(name="X-Operator-Key", auto_error=False)
 
 
 async def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict:
@@ -17,4 +26,78 @@ async def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Tokens issued before sessions existed carry no sid and simply run to expiry.
+    session_id = payload.get("sid")
+    if session_id and revocation_list.is_revoked(session_id):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    # Counted and checked in memory; usage reaches the database in batched flushes.
+    organization_id = payload.get("organization_id")
+    if organization_id:
+        try:
+            usage_tracker.record(organization_id, payload.get("organization_name"))
+        except QuotaExceeded as e:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=str(e),
+                headers={"Retry-After": str(usage_tracker.seconds_until_reset())},
+            )
+
     return payload
+
+
+async def get_operator(api_key: Optional[str] = Depends(operator_key)) -> None:
+    # Routes that span tenants take the operator key, not an admin token: anyone
+    # can sign up an organization and log in as its admin. Unset, they are closed.
+    expected = settings.OPERATOR_API_KEY
+    if not expected or not api_key or not hmac.compare_digest(api_key.encode(), expected.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Operator API key required")
+
+
+async def check_storage_quota(current_admin: Dict = Depends(get_current_admin)) -> None:
+    try:
+        usage_tracker.check_storage(current_admin.get("organization_id", ""))
+    except QuotaExceeded as e:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(e))
+
+
+def _client_ip(request: Request) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def _enforce_rate_limit(scope: str, key: str) -> None:
+    retry_after = await RateLimiter.check(scope, key)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests, retry later",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
+def rate_limit(ip_scope: str, email_scope: Optional[str] = None):
+    # Sub-dependencies run before the body is validated, so a throttled request
+    # costs one JSON parse and a dict lookup: no hashing and no database work.
+    async def dependency(request: Request) -> None:
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        await _enforce_rate_limit(ip_scope, _client_ip(request))
+        if email_scope:
+            try:
+                body = await request.json()
+            except ValueError:
+                # Empty or malformed bodies are left to body validation (422).
+                return
+            email = body.get("email") if isinstance(body, dict) else None
+            if isinstance(email, str):
+                await _enforce_rate_limit(email_scope, email.strip().lower())
+
+    return dependency
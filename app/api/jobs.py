@@ -0,0 +1,20 @@
+from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi.responses import ORJSONResponse
+from typing import Dict
+from ..services.job_service import JobService
+from .dependencies import get_current_admin
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str, current_admin: Dict = Depends(get_current_admin)):
+    try:
+        job = await JobService.get_job(job_id)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    # Jobs of other tenants are reported as missing rather than forbidden.
+    if not job or job["organization_id"] != current_admin.get("organization_id"):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    return ORJSONResponse(content=JobService.serialize(job))
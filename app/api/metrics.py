@@ -0,0 +1,106 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from ..database import db
+from ..services.health_monitor import health_monitor
+from ..services.name_index import name_index
+from ..services.organization_service import OrganizationService
+from ..services.usage_tracker import usage_tracker
+from ..utils.jwt_handler import JWTHandler
+from ..utils.metrics import registry
+from ..utils.password_handler import PasswordHandler
+from ..utils.rate_limiter import RateLimiter
+
+router = APIRouter(tags=["Monitoring"])
+
+
+CACHES = (("organization", OrganizationService.cache_stats), ("token", JWTHandler.cache_stats))
+# Pool state at scrape time; every other pool_stats() entry is a running total.
+POOL_GAUGES = ("connections_open", "checked_out", "waiting", "checkout_wait_seconds_max")
+
+
+def _cache_stat(key: str):
+    return lambda: {(cache,): stats()[key] for cache, stats in CACHES}
+
+
+def _pool_stats(gauges: bool):
+    return {
+        (key.removesuffix("_total"),): value
+        for key, value in db.pool_stats().items()
+        if (key in POOL_GAUGES) == gauges
+    }
+
+
+registry.gauge_callback(
+    "app_cache_size",
+    "Entries held by each in-process cache.",
+    ("cache",),
+    _cache_stat("size"),
+)
+for stat in ("hits", "misses", "evictions"):
+    registry.counter_callback(
+        f"app_cache_{stat}_total",
+        f"In-process cache {stat} since start.",
+        ("cache",),
+        _cache_stat(stat),
+    )
+registry.gauge_callback(
+    "mongo_pool",
+    "MongoDB connection pool current state.",
+    ("stat",),
+    lambda: _pool_stats(gauges=True),
+)
+registry.counter_callback(
+    "mongo_pool_events_total",
+    "MongoDB connection pool events and checkout wait seconds since start.",
+    ("event",),
+    lambda: _pool_stats(gauges=False),
+)
+registry.gauge_callback(
+    "password_hash_pending",
+    "Password hash/verify calls queued or running on the pool.",
+    (),
+    lambda: {(): PasswordHandler.pending()},
+)
+NAME_FILTERS = (name_index.organizations, name_index.admin_emails)
+
+registry.gauge_callback(
+    "name_filter_false_positive_rate",
+    "Share of absent names the Bloom filter could not rule out.",
+    ("filter",),
+    lambda: {(name_filter.name,): name_filter.false_positive_rate() for name_filter in NAME_FILTERS},
+)
+registry.counter_callback(
+    "name_filter_rejections_total",
+    "Lookups answered as missing by the Bloom filter without a database read.",
+    ("filter",),
+    lambda: {(name_filter.name,): name_filter.bloom_rejections for name_filter in NAME_FILTERS},
+)
+registry.gauge_callback(
+    "rate_limit_keys",
+    "Keys tracked by the rate-limit backend.",
+    (),
+    lambda: {(): RateLimiter.stats()["keys"]},
+)
+registry.gauge_callback(
+    "usage_unflushed_requests",
+    "Tenant requests counted in memory and not yet flushed to the usage collection.",
+    (),
+    lambda: {(): usage_tracker.unflushed_requests()},
+)
+registry.gauge_callback(
+    "mongo_up",
+    "1 if the last MongoDB health ping succeeded.",
+    (),
+    lambda: {(): int(health_monitor.database_ok)},
+)
+registry.gauge_callback(
+    "event_loop_lag_seconds",
+    "Most recent event-loop scheduling lag.",
+    (),
+    lambda: {(): health_monitor.loop_lag_ms / 1000},
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
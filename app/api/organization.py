@@ -1,18 +1,34 @@
-from fastapi import APIRouter, HTTPException, status, Depends
-from typing import Dict
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Dict, Optional
+from datetime import datetime
+import orjson
+from ..config import get_settings
 from ..schemas.organization import (
+    OrganizationBulkCreate,
     OrganizationCreate,
     OrganizationResponse,
     OrganizationGet,
+    OrganizationList,
     OrganizationUpdate,
 )
 from ..services.organization_service import OrganizationService
-from .dependencies import get_current_admin
+from ..utils.password_handler import PasswordHasherBusy
+from .dependencies import get_current_admin, get_operator, rate_limit
 
+settings = get_settings()
+
+# Handlers return ORJSONResponse directly: response_model stays for the OpenAPI
+# schema, but FastAPI skips re-validating a Response, so each body is built once.
 router = APIRouter(prefix="/org", tags=["Organizations"])
 
 
-@router.post("/create", response_model=OrganizationResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/create",
+    response_model=OrganizationResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(rate_limit("create_ip", "create_email"))],
+)
 async def create_organization(org_data: OrganizationCreate):
     try:
         result = await OrganizationService.create_organization(
@@ -21,12 +37,21 @@ async def create_organization(org_data: OrganizationCreate):
             password=org_data.password,
         )
 
-        return OrganizationResponse(
-            organization_name=result["organization_name"],
-            collection_name=result["collection_name"],
-            admin_email=result["admin_email"],
-            created_at=result["created_at"],
-            message="Organization created successfully",
+        return ORJSONResponse(
+            status_code=status.HTTP_201_CREATED,
+            content={
+                "organization_name": result["organization_name"],
+                "collection_name": result["collection_name"],
+                "admin_email": result["admin_email"],
+                "created_at": result["created_at"],
+                "message": "Organization created successfully",
+            },
+        )
+    except PasswordHasherBusy as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -34,10 +59,30 @@ async def create_organization(org_data: OrganizationCreate):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.post("/bulk-create", dependencies=[Depends(rate_limit("bulk_create_ip"))])
+async def bulk_create_organizations(bulk_data: OrganizationBulkCreate):
+    if len(bulk_data.organizations) > settings.BULK_CREATE_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BULK_CREATE_MAX_ITEMS} organizations per request",
+        )
+
+    items = [item.model_dump() for item in bulk_data.organizations]
+
+    async def stream_results():
+        try:
+            async for result in OrganizationService.bulk_create_organizations(items):
+                yield orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE)
+        except Exception as e:
+            yield orjson.dumps({"status": "error", "detail": str(e)}, option=orjson.OPT_APPEND_NEWLINE)
+
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
 @router.get("/get", response_model=OrganizationGet)
-async def get_organization(organization_name: str):
+async def get_organization(organization_name: str = Query(..., min_length=3, max_length=100)):
     try:
-        org = await OrganizationService.get_organization(organization_name)
+        org = await OrganizationService.get_organization_view(organization_name)
 
         if not org:
             raise HTTPException(
@@ -45,13 +90,48 @@ async def get_organization(organization_name: str):
                 detail="Organization not found",
             )
 
-        return OrganizationGet(**org)
+        return ORJSONResponse(content=org)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
 
+@router.get("/list", response_model=OrganizationList, dependencies=[Depends(get_operator)])
+async def list_organizations(
+    limit: int = Query(100, ge=1, le=settings.ORG_LIST_MAX_PAGE_SIZE),
+    page_token: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    admin_email: Optional[str] = None,
+    response_format: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
+):
+    filters = {
+        "page_token": page_token,
+        "fields": [field.strip() for field in fields.split(",") if field.strip()] if fields else None,
+        "created_after": created_after,
+        "created_before": created_before,
+        "admin_email": admin_email,
+    }
+
+    try:
+        if response_format == "ndjson":
+            organizations = OrganizationService.iter_organizations(**filters)
+
+            async def stream_organizations():
+                async for org in organizations:
+                    yield orjson.dumps(org, option=orjson.OPT_APPEND_NEWLINE)
+
+            return StreamingResponse(stream_organizations(), media_type="application/x-ndjson")
+
+        return ORJSONResponse(content=await OrganizationService.list_organizations(limit=limit, **filters))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
 @router.put("/update", response_model=OrganizationResponse)
 async def update_organization(
     old_organization_name: str,
@@ -67,14 +147,27 @@ async def update_organization(
             email=org_data.email,
             password=org_data.password,
             admin_email=admin_email,
+            keep_session_id=current_admin.get("sid"),
         )
 
-        return OrganizationResponse(
-            organization_name=result["organization_name"],
-            collection_name=result["collection_name"],
-            admin_email=result["admin_email"],
-            created_at=result["created_at"],
-            message="Organization updated successfully",
+        # A pending job means tenant data is still being moved in the background.
+        job_id = result.get("job_id")
+        return ORJSONResponse(
+            status_code=status.HTTP_202_ACCEPTED if job_id else status.HTTP_200_OK,
+            content={
+                "organization_name": result["organization_name"],
+                "collection_name": result["collection_name"],
+                "admin_email": result["admin_email"],
+                "created_at": result["created_at"],
+                "message": "Organization updated successfully",
+                "job_id": job_id,
+            },
+        )
+    except PasswordHasherBusy as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "1"},
         )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -90,18 +183,26 @@ async def delete_organization(
     try:
         admin_email = current_admin["sub"]
 
-        success = await OrganizationService.delete_organization(
+        result = await OrganizationService.delete_organization(
             organization_name=organization_name,
             admin_email=admin_email,
+            keep_session_id=current_admin.get("sid"),
         )
 
-        if not success:
+        if not result["deleted"]:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Organization not found",
             )
 
-        return {"message": "Organization deleted successfully", "organization_name": organization_name}
+        return ORJSONResponse(
+            status_code=status.HTTP_202_ACCEPTED if result["job_id"] else status.HTTP_200_OK,
+            content={
+                "message": "Organization deleted successfully",
+                "organization_name": organization_name,
+                "job_id": result["job_id"],
+            },
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except HTTPException:
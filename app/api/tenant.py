@@ -0,0 +1,143 @@
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from typing import Any, Dict, List, Optional
+from ..config import get_settings
+from ..schemas.tenant import TenantDocumentList, TenantDocumentsCreate, TenantDocumentsCreated
+from ..services.tenant_service import TenantService
+from .dependencies import check_storage_quota, get_current_admin
+
+settings = get_settings()
+
+router = APIRouter(prefix="/tenant", tags=["Tenant Data"])
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(",") if field.strip()]
+
+
+@router.post(
+    "/documents",
+    response_model=TenantDocumentsCreated,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(check_storage_quota)],
+)
+async def insert_documents(
+    payload: TenantDocumentsCreate,
+    current_admin: Dict = Depends(get_current_admin),
+):
+    if len(payload.documents) > settings.TENANT_MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.TENANT_MAX_BATCH_SIZE} documents per request",
+        )
+
+    try:
+        inserted_ids = await TenantService.insert_documents(
+            current_admin["organization_name"],
+            current_admin.get("organization_id", ""),
+            payload.documents,
+        )
+        return TenantDocumentsCreated(inserted_ids=inserted_ids, inserted_count=len(inserted_ids))
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/documents", response_model=TenantDocumentList)
+async def list_documents(
+    limit: int = Query(100, ge=1, le=settings.TENANT_MAX_PAGE_SIZE),
+    page_token: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+    current_admin: Dict = Depends(get_current_admin),
+):
+    try:
+        return await TenantService.list_documents(
+            current_admin["organization_name"],
+            current_admin.get("organization_id", ""),
+            limit=limit,
+            page_token=page_token,
+            fields=_parse_fields(fields),
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get("/documents/{document_id}")
+async def get_document(
+    document_id: str,
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return"),
+    current_admin: Dict = Depends(get_current_admin),
+):
+    try:
+        document = await TenantService.get_document(
+            current_admin["organization_name"],
+            current_admin.get("organization_id", ""),
+            document_id,
+            _parse_fields(fields),
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    if not document:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+    return document
+
+
+@router.put("/documents/{document_id}", dependencies=[Depends(check_storage_quota)])
+async def replace_document(
+    document_id: str,
+    document: Dict[str, Any],
+    current_admin: Dict = Depends(get_current_admin),
+):
+    try:
+        replaced = await TenantService.replace_document(
+            current_admin["organization_name"],
+            current_admin.get("organization_id", ""),
+            document_id,
+            document,
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    if not replaced:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+    return {"message": "Document updated successfully", "id": document_id}
+
+
+@router.delete("/documents/{document_id}")
+async def delete_document(
+    document_id: str,
+    current_admin: Dict = Depends(get_current_admin),
+):
+    try:
+        deleted = await TenantService.delete_document(
+            current_admin["organization_name"],
+            current_admin.get("organization_id", ""),
+            document_id,
+        )
+    except LookupError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+    if not deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Document not found")
+    return {"message": "Document deleted successfully", "id": document_id}
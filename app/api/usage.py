@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
+from typing import Dict
+from ..services.usage_tracker import usage_tracker
+from .dependencies import get_current_admin
+
+router = APIRouter(prefix="/usage", tags=["Usage"])
+
+
+@router.get("")
+async def get_usage(current_admin: Dict = Depends(get_current_admin)):
+    # Served from memory: counts from other processes lag by up to one flush interval.
+    return ORJSONResponse(content=usage_tracker.usage(current_admin.get("organization_id", "")))
@@ -0,0 +1,152 @@
+"""Suggest password-hash parameters for a target verify latency on this machine.
+
+    python -m app.calibrate                                  # current scheme, 250ms target
+    python -m app.calibrate --target-ms 100 --scheme argon2 --memory-kib 65536
+    python -m app.calibrate --scheme all                     # compare every scheme
+
+Each verify is timed on one core, the median of --samples runs. pbkdf2_sha256
+and argon2 cost grows linearly with rounds (iterations, time_cost), so rounds are
+extrapolated from a probe and then corrected with a second measurement. scrypt
+rounds are log2(N) and double the cost per step, so each step is measured. The
+suggestion is printed as PASSWORD_HASH_* settings; with PASSWORD_REHASH_ON_LOGIN
+existing hashes move to it as admins log in.
+"""
+import argparse
+import statistics
+import time
+from typing import Dict, List, Tuple
+from .config import get_settings
+from .utils.password_handler import HASH_SCHEMES, build_context
+
+settings = get_settings()
+
+PASSWORD = "calibration-password-123"
+# Below this an attacker's guess is cheap whatever the latency target says.
+MIN_ROUNDS = {"pbkdf2_sha256": 100000, "argon2": 1, "scrypt": 14}
+PROBE_ROUNDS = {"pbkdf2_sha256": 50000, "argon2": 1, "scrypt": 12}
+# argon2 memory is halved down to this when time_cost=1 is still over the target.
+MIN_ARGON2_MEMORY_KIB = 19456
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target-ms", type=float, default=250.0, help="verify latency to aim for")
+    parser.add_argument("--scheme", default=settings.PASSWORD_HASH_SCHEME, choices=[*HASH_SCHEMES, "all"])
+    parser.add_argument("--memory-kib", type=int, default=settings.PASSWORD_HASH_MEMORY_KIB or 65536, help="argon2 memory_cost")
+    parser.add_argument("--parallelism", type=int, default=settings.PASSWORD_HASH_PARALLELISM or 1, help="argon2/scrypt lanes")
+    parser.add_argument("--samples", type=int, default=5)
+    return parser.parse_args()
+
+
+def measure_verify(scheme: str, rounds: int, memory_kib: int, parallelism: int, samples: int) -> float:
+    context = build_context(scheme, rounds, memory_kib, parallelism)
+    hashed = context.hash(PASSWORD)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.verify(PASSWORD, hashed)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def calibrate_linear(scheme: str, target: float, memory_kib: int, parallelism: int, samples: int) -> Tuple[int, float, List]:
+    probe = PROBE_ROUNDS[scheme]
+    elapsed = measure_verify(scheme, probe, memory_kib, parallelism, samples)
+    trace = [(probe, elapsed)]
+    rounds = probe
+    for _ in range(2):
+        rounds = max(MIN_ROUNDS[scheme], int(rounds * target / elapsed))
+        if scheme == "pbkdf2_sha256":
+            rounds = max(MIN_ROUNDS[scheme], rounds // 1000 * 1000)
+        elapsed = measure_verify(scheme, rounds, memory_kib, parallelism, samples)
+        trace.append((rounds, elapsed))
+    # Timing noise can leave the last step over the target when an earlier one fit.
+    fitting = [entry for entry in trace if entry[1] <= target and entry[0] >= MIN_ROUNDS[scheme]]
+    if elapsed > target and fitting:
+        rounds, elapsed = max(fitting)
+    return rounds, elapsed, trace
+
+
+def calibrate_scrypt(target: float, parallelism: int, samples: int) -> Tuple[int, float, List]:
+    trace = []
+    rounds = PROBE_ROUNDS["scrypt"]
+    while rounds <= 22:
+        elapsed = measure_verify("scrypt", rounds, 0, parallelism, samples)
+        trace.append((rounds, elapsed))
+        if elapsed > target:
+            break
+        rounds += 1
+    fitting = [entry for entry in trace if entry[1] <= target and entry[0] >= MIN_ROUNDS["scrypt"]]
+    if fitting:
+        return (*fitting[-1], trace)
+    rounds = MIN_ROUNDS["scrypt"]
+    elapsed = dict(trace).get(rounds) or measure_verify("scrypt", rounds, 0, parallelism, samples)
+    return rounds, elapsed, trace
+
+
+def calibrate(args, scheme: str) -> Dict:
+    target = args.target_ms / 1000
+    memory_kib = args.memory_kib if scheme == "argon2" else 0
+    parallelism = args.parallelism if scheme != "pbkdf2_sha256" else 0
+
+    if scheme == "scrypt":
+        rounds, elapsed, trace = calibrate_scrypt(target, parallelism, args.samples)
+        # scrypt memory is 128 * r * N bytes with passlib's r=8.
+        memory_kib = 128 * 8 * 2 ** rounds // 1024
+    else:
+        rounds, elapsed, trace = calibrate_linear(scheme, target, memory_kib, parallelism, args.samples)
+        while scheme == "argon2" and rounds == 1 and elapsed > target and memory_kib // 2 >= MIN_ARGON2_MEMORY_KIB:
+            memory_kib //= 2
+            elapsed = measure_verify(scheme, rounds, memory_kib, parallelism, args.samples)
+            trace.append((f"1 @ {memory_kib}KiB", elapsed))
+
+    return {"scheme": scheme, "rounds": rounds, "memory_kib": memory_kib, "parallelism": parallelism, "verify": elapsed, "trace": trace}
+
+
+def report(result: Dict) -> None:
+    scheme = result["scheme"]
+    print(f"\n{scheme}")
+    print(f"  {'rounds':>16} {'verify ms':>10}")
+    for rounds, elapsed in result["trace"]:
+        print(f"  {rounds!s:>16} {elapsed * 1000:>10.1f}")
+
+    verify_ms = result["verify"] * 1000
+    workers = max(settings.PASSWORD_HASH_WORKERS, 1)
+    print(f"  suggested, verify {verify_ms:.1f}ms:")
+    print(f"    PASSWORD_HASH_SCHEME={scheme}")
+    print(f"    PASSWORD_HASH_ROUNDS={result['rounds']}")
+    if scheme == "argon2":
+        print(f"    PASSWORD_HASH_MEMORY_KIB={result['memory_kib']}")
+    if scheme != "pbkdf2_sha256":
+        print(f"    PASSWORD_HASH_PARALLELISM={result['parallelism']}")
+    print(f"  about {1000 / verify_ms:.1f} logins/s per hashing thread, {workers * 1000 / verify_ms:.1f}/s per server worker "
+          f"with PASSWORD_HASH_WORKERS={workers} (if that many cores are free)")
+    if result["memory_kib"]:
+        print(f"  {result['memory_kib'] / 1024:.0f}MiB per hash, up to {workers * result['memory_kib'] / 1024:.0f}MiB per server worker")
+
+
+def main(args) -> int:
+    current = measure_verify(
+        settings.PASSWORD_HASH_SCHEME,
+        settings.PASSWORD_HASH_ROUNDS,
+        settings.PASSWORD_HASH_MEMORY_KIB,
+        settings.PASSWORD_HASH_PARALLELISM,
+        args.samples,
+    )
+    print(f"current policy: {settings.PASSWORD_HASH_SCHEME}, verify {current * 1000:.1f}ms; target {args.target_ms:.0f}ms")
+
+    schemes = HASH_SCHEMES if args.scheme == "all" else (args.scheme,)
+    for scheme in schemes:
+        try:
+            result = calibrate(args, scheme)
+        except RuntimeError as e:
+            print(f"\n{scheme}: skipped ({e})")
+            continue
+        report(result)
+        if result["verify"] > args.target_ms / 1000 * 1.5:
+            print("  the minimum safe parameters already exceed the target on this machine")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(parse_args()))
@@ -1,13 +1,106 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Optional
 
 
 class Settings(BaseSettings):
     MONGODB_URL: str
     MASTER_DB_NAME: str
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 0
+    MONGODB_MAX_IDLE_TIME_MS: Optional[int] = None
+    MONGODB_WAIT_QUEUE_TIMEOUT_MS: Optional[int] = None
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 30000
+    MONGODB_COMPRESSORS: str = ""
+    MONGODB_READ_PREFERENCE: str = "primary"
+    MONGODB_WARMUP_CONNECTIONS: int = 1
+    MONGODB_RETRY_WRITES: bool = True
+    MONGODB_USE_TRANSACTIONS: Optional[bool] = None
+    MONGODB_LAZY_CONNECT: bool = False
+    FAST_STARTUP: bool = False
+    RECONCILE_ENABLED: bool = True
+    RECONCILE_INTERVAL_SECONDS: float = 300.0
+    RECONCILE_BATCH_SIZE: int = 200
+    RECONCILE_GRACE_SECONDS: float = 600.0
+    CACHE_WATCH_ENABLED: bool = True
+    CACHE_WATCH_MODE: str = "auto"
+    CACHE_WATCH_RETRY_SECONDS: float = 1.0
+    CACHE_POLL_INTERVAL_SECONDS: float = 2.0
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 5.0
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+    HEALTH_LATENCY_WINDOW: int = 120
+    HEALTH_LOOP_LAG_INTERVAL_SECONDS: float = 0.5
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    JWT_BACKEND: str = "jose"
+    OPERATOR_API_KEY: Optional[str] = None
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_MAX_KEYS: int = 100000
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False
+    RATE_LIMIT_LOGIN_PER_IP: str = "20/minute"
+    RATE_LIMIT_LOGIN_PER_EMAIL: str = "5/minute"
+    RATE_LIMIT_CREATE_PER_IP: str = "10/minute"
+    RATE_LIMIT_CREATE_PER_EMAIL: str = "5/hour"
+    RATE_LIMIT_BULK_CREATE_PER_IP: str = "2/minute"
+    JWT_CACHE_MAX_SIZE: int = 10000
+    ORG_CACHE_MAX_SIZE: int = 10000
+    ORG_CACHE_TTL_SECONDS: float = 60.0
+    NEGATIVE_CACHE_MAX_SIZE: int = 10000
+    NEGATIVE_CACHE_TTL_SECONDS: float = 5.0
+    NAME_FILTER_ENABLED: bool = True
+    NAME_FILTER_ERROR_RATE: float = 0.01
+    NAME_FILTER_MIN_CAPACITY: int = 100000
+    NAME_FILTER_SYNC_SECONDS: float = 5.0
+    NAME_FILTER_REBUILD_SECONDS: float = 3600.0
+    TENANT_HANDLE_CACHE_SIZE: int = 10000
+    TENANT_MAX_BATCH_SIZE: int = 500
+    TENANT_MAX_PAGE_SIZE: int = 500
+    TENANT_SHARDS: str = ""
+    TENANT_PLACEMENT: str = "hash"
+    TENANT_PLACEMENT_REFRESH_SECONDS: float = 60.0
+    MIGRATION_BATCH_SIZE: int = 1000
+    JOBS_ENABLED: bool = True
+    JOB_WORKERS: int = 2
+    JOB_MAX_RUNNING: int = 8
+    JOB_MAX_PER_TENANT: int = 1
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_HEARTBEAT_SECONDS: float = 5.0
+    JOB_STALE_SECONDS: float = 60.0
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETENTION_SECONDS: int = 604800
+    JOB_DRAIN_SECONDS: float = 20.0
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    REVOCATION_SYNC_SECONDS: float = 5.0
+    USAGE_TRACKING_ENABLED: bool = True
+    USAGE_FLUSH_INTERVAL_SECONDS: float = 10.0
+    USAGE_STATS_INTERVAL_SECONDS: float = 60.0
+    USAGE_STATS_BATCH_SIZE: int = 100
+    USAGE_DAILY_REQUEST_QUOTA: int = 0
+    USAGE_STORAGE_QUOTA_BYTES: int = 0
+    MIGRATION_MAX_INFLIGHT_BATCHES: int = 2
+    PASSWORD_HASH_SCHEME: str = "pbkdf2_sha256"
+    PASSWORD_HASH_ROUNDS: int = 0
+    PASSWORD_HASH_MEMORY_KIB: int = 0
+    PASSWORD_HASH_PARALLELISM: int = 0
+    PASSWORD_REHASH_ON_LOGIN: bool = True
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_LOOP: str = "uvloop"
+    SERVER_HTTP: str = "httptools"
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: float = 30.0
+    SERVER_ACCESS_LOG: bool = True
+    BULK_CREATE_MAX_ITEMS: int = 1000
+    BULK_CREATE_CHUNK_SIZE: int = 50
+    ORG_LIST_MAX_PAGE_SIZE: int = 500
+    ORG_LIST_BATCH_SIZE: int = 500
 
     class Config:
         env_file = ".env"
@@ -1,31 +1,218 @@
 from motor.motor_asyncio import AsyncIOMotorClient
-from typing import Optional
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import PyMongoError
+from pymongo.uri_parser import parse_uri
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import re
 from .config import get_settings
+from .utils.pool_metrics import pool_metrics
+from .utils.command_metrics import command_metrics
 
 settings = get_settings()
 
+MASTER_INDEXES: Dict[str, List[IndexModel]] = {
+    "organizations": [
+        IndexModel([("organization_name", ASCENDING)], name="organization_name_unique", unique=True),
+        IndexModel([("collection_name", ASCENDING)], name="collection_name_unique", unique=True),
+        IndexModel([("admin_email", ASCENDING), ("_id", ASCENDING)], name="admin_email_id"),
+        IndexModel([("updated_at", ASCENDING)], name="updated_at"),
+        IndexModel([("migrating_from", ASCENDING)], name="migrating_from", sparse=True),
+        IndexModel([("shard", ASCENDING)], name="shard"),
+        IndexModel([("moving_to_shard", ASCENDING)], name="moving_to_shard", sparse=True),
+    ],
+    "admins": [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+        IndexModel([("email", ASCENDING), ("organization_name", ASCENDING)], name="email_organization_name"),
+    ],
+    "jobs": [
+        IndexModel([("status", ASCENDING), ("created_at", ASCENDING)], name="status_created_at"),
+        IndexModel([("organization_id", ASCENDING), ("status", ASCENDING)], name="organization_id_status"),
+        IndexModel(
+            [("params.collection_names", ASCENDING)],
+            name="drop_collection_names",
+            partialFilterExpression={"type": "drop_collections"},
+        ),
+        IndexModel([("finished_at", ASCENDING)], name="finished_at_ttl", expireAfterSeconds=settings.JOB_RETENTION_SECONDS),
+    ],
+    "sessions": [
+        IndexModel([("organization_id", ASCENDING)], name="organization_id"),
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+    "revoked_sessions": [
+        IndexModel([("revoked_at", ASCENDING)], name="revoked_at"),
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+    "usage": [
+        IndexModel([("day", ASCENDING), ("updated_at", ASCENDING)], name="day_updated_at"),
+    ],
+}
+
+# Organizations without a shard field predate placement and live in the master database.
+DEFAULT_SHARD = "default"
+
+
+def parse_tenant_shards(spec: str) -> Dict[str, Tuple[Optional[str], str]]:
+    # "a=tenants_a,b=mongodb://host:27017/tenants_b" -> {name: (client URI or None, database)}.
+    # A bare database name lives on the MONGODB_URL cluster.
+    shards = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, target = entry.partition("=")
+        if not name or not target:
+            raise ValueError(f"Invalid TENANT_SHARDS entry '{entry}'")
+        if "://" in target:
+            database = parse_uri(target)["database"] or settings.MASTER_DB_NAME
+            shards[name] = (re.sub(r"(://[^/?]+)/?[^?]*", r"\1/", target), database)
+        else:
+            shards[name] = (None, target)
+    return shards
+
 
 class Database:
     client: Optional[AsyncIOMotorClient] = None
+    shards: Dict[str, Tuple[Optional[str], str]] = parse_tenant_shards(settings.TENANT_SHARDS)
+    shard_clients: Dict[str, AsyncIOMotorClient] = {}
+    index_status: Dict[str, str] = {}
+    # None until detected: by warm_up, or by the first transaction with MONGODB_LAZY_CONNECT.
+    supports_transactions: Optional[bool] = None
+
+    @staticmethod
+    def _client_options() -> Dict:
+        options = {
+            "maxPoolSize": settings.MONGODB_MAX_POOL_SIZE,
+            "minPoolSize": settings.MONGODB_MIN_POOL_SIZE,
+            "serverSelectionTimeoutMS": settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            "readPreference": settings.MONGODB_READ_PREFERENCE,
+            "retryWrites": settings.MONGODB_RETRY_WRITES,
+            "event_listeners": [pool_metrics, command_metrics],
+        }
+        if settings.MONGODB_MAX_IDLE_TIME_MS is not None:
+            options["maxIdleTimeMS"] = settings.MONGODB_MAX_IDLE_TIME_MS
+        if settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS is not None:
+            options["waitQueueTimeoutMS"] = settings.MONGODB_WAIT_QUEUE_TIMEOUT_MS
+        if settings.MONGODB_COMPRESSORS:
+            options["compressors"] = settings.MONGODB_COMPRESSORS
+        return options
 
     @classmethod
     async def connect_db(cls):
-        cls.client = AsyncIOMotorClient(settings.MONGODB_URL)
-        print("Connected to MongoDB")
+        cls.client = AsyncIOMotorClient(settings.MONGODB_URL, **cls._client_options())
+        # Shards on the same cluster share one client, and so one connection pool.
+        for uri, _ in cls.shards.values():
+            if uri and uri not in cls.shard_clients:
+                cls.shard_clients[uri] = AsyncIOMotorClient(uri, **cls._client_options())
+        print(f"Connected to MongoDB ({1 + len(cls.shard_clients)} clusters)")
+
+    @classmethod
+    async def warm_up(cls):
+        connections = max(settings.MONGODB_WARMUP_CONNECTIONS, settings.MONGODB_MIN_POOL_SIZE, 1)
+        clients = [cls.client, *cls.shard_clients.values()]
+        try:
+            await asyncio.gather(*(
+                client.admin.command("ping")
+                for client in clients
+                for _ in range(connections)
+            ))
+        except PyMongoError as e:
+            print(f"MongoDB pool warm-up failed: {e}")
+            return
+        print(f"Warmed MongoDB connection pool ({connections} connections)")
+        await cls.detect_transactions()
+
+    @classmethod
+    async def detect_transactions(cls) -> bool:
+        if settings.MONGODB_USE_TRANSACTIONS is not None:
+            cls.supports_transactions = settings.MONGODB_USE_TRANSACTIONS
+        else:
+            hello = await cls.client.admin.command("hello")
+            cls.supports_transactions = "setName" in hello or hello.get("msg") == "isdbgrid"
+        print(f"MongoDB transactions {'enabled' if cls.supports_transactions else 'unavailable'}")
+        return cls.supports_transactions
+
+    @classmethod
+    async def run_in_transaction(cls, *writes: Callable[..., Awaitable]) -> List:
+        # Each write is called with the session (or None) and must pass it on.
+        # Without transaction support the writes still run one at a time in the
+        # given order, and the first failure stops the rest: later writes (an
+        # admin moved to a renamed organization) depend on the earlier ones.
+        if cls.supports_transactions is None:
+            await cls.detect_transactions()
+        if not cls.supports_transactions:
+            return [await write(None) for write in writes]
+
+        async def callback(session):
+            return [await write(session) for write in writes]
+
+        async with await cls.client.start_session(causal_consistency=True) as session:
+            return await session.with_transaction(callback)
+
+    @classmethod
+    def pool_stats(cls) -> Dict:
+        return pool_metrics.snapshot()
 
     @classmethod
     async def close_db(cls):
+        for client in cls.shard_clients.values():
+            client.close()
+        cls.shard_clients = {}
         if cls.client:
             cls.client.close()
             print("Closed MongoDB connection")
 
+    @classmethod
+    async def ensure_indexes(cls) -> Dict[str, str]:
+        master_db = cls.get_master_db()
+        for collection_name, indexes in MASTER_INDEXES.items():
+            for index in indexes:
+                cls.index_status[f"{collection_name}.{index.document['name']}"] = "building"
+
+            try:
+                await master_db[collection_name].create_indexes(indexes)
+                status = "ready"
+            except PyMongoError as e:
+                status = f"failed: {e}"
+                print(f"Index build failed on {collection_name}: {e}")
+
+            for index in indexes:
+                cls.index_status[f"{collection_name}.{index.document['name']}"] = status
+
+        print("MongoDB indexes ensured")
+        return cls.index_status
+
     @classmethod
     def get_master_db(cls):
         return cls.client[settings.MASTER_DB_NAME]
 
     @classmethod
-    def get_org_collection(cls, collection_name: str):
-        return cls.client[settings.MASTER_DB_NAME][collection_name]
+    def shard_names(cls) -> List[str]:
+        # Every shard that can hold tenant collections, including the legacy default.
+        return list(dict.fromkeys([*cls.shards, DEFAULT_SHARD]))
+
+    @classmethod
+    def placement_shards(cls) -> List[str]:
+        # Shards that receive new tenants.
+        return list(cls.shards) or [DEFAULT_SHARD]
+
+    @classmethod
+    def shard_location(cls, shard: Optional[str] = None) -> Tuple[Optional[str], str]:
+        # Shard names are aliases; two names may point at the same database.
+        return cls.shards.get(shard or DEFAULT_SHARD, (None, settings.MASTER_DB_NAME))
+
+    @classmethod
+    def get_shard_db(cls, shard: Optional[str] = None):
+        shard = shard or DEFAULT_SHARD
+        if shard not in cls.shards:
+            if shard != DEFAULT_SHARD:
+                raise RuntimeError(f"Tenant shard '{shard}' is not configured")
+            return cls.get_master_db()
+
+        uri, database = cls.shards[shard]
+        client = cls.shard_clients[uri] if uri else cls.client
+        return client[database]
+
+    @classmethod
+    def get_org_collection(cls, collection_name: str, shard: Optional[str] = None):
+        return cls.get_shard_db(shard)[collection_name]
 
 
 db = Database()
@@ -1,16 +1,69 @@
+import asyncio
+import time
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+from .config import get_settings
 from .database import db
-from .api import organization, admin
+from .utils.password_handler import PasswordHandler
+from .utils.jwt_handler import JWTHandler
+from .utils.metrics_middleware import MetricsMiddleware
+from .utils.rate_limiter import RateLimiter
+from .api import organization, admin, jobs, metrics, tenant, usage
+from .services.auth_service import AuthService
+from .services.organization_service import OrganizationService
+from .services.cache_watcher import cache_watcher
+from .services.health_monitor import health_monitor
+from .services.job_worker import job_worker
+from .services.name_index import name_index
+from .services.reconciler import reconciler
+from .services.revocation_list import revocation_list
+from .services.usage_tracker import usage_tracker
+
+settings = get_settings()
+
+
+async def prepare_lookups():
+    await db.ensure_indexes()
+    await name_index.start()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    started = time.perf_counter()
     await db.connect_db()
-    print("Application started successfully")
+    if not settings.MONGODB_LAZY_CONNECT:
+        await db.warm_up()
+    await health_monitor.start()
+    reconciler.start()
+    # FAST_STARTUP serves requests while indexes and name filters are prepared;
+    # until the filters are built, lookups fall through to the database.
+    deferred = asyncio.create_task(prepare_lookups()) if settings.FAST_STARTUP else None
+    if deferred is None:
+        await prepare_lookups()
+        # Fails on an unknown PASSWORD_HASH_SCHEME or a missing backend before serving.
+        PasswordHandler.context()
+    cache_watcher.start()
+    job_worker.start()
+    usage_tracker.start()
+    # Awaited even with FAST_STARTUP: serving before it loads would accept revoked tokens.
+    await revocation_list.start()
+    print(f"Application started successfully in {(time.perf_counter() - started) * 1000:.0f}ms")
     yield
+    await usage_tracker.stop()
+    await revocation_list.stop()
+    if deferred is not None:
+        deferred.cancel()
+        await asyncio.gather(deferred, return_exceptions=True)
+    await job_worker.stop(settings.JOB_DRAIN_SECONDS)
+    await AuthService.wait_for_rehashes()
+    await cache_watcher.stop()
+    await name_index.stop()
+    await reconciler.stop()
+    await health_monitor.stop()
     await db.close_db()
+    PasswordHandler.shutdown_executor()
     print("Application shutdown completed")
 
 
@@ -28,9 +81,14 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(organization.router)
 app.include_router(admin.router)
+app.include_router(tenant.router)
+app.include_router(jobs.router)
+app.include_router(usage.router)
+app.include_router(metrics.router)
 
 
 @app.get("/", tags=["Health Check"])
@@ -45,7 +103,30 @@ async def root():
 @app.get("/health", tags=["Health Check"])
 async def health_check():
     return {
-        "status": "healthy",
-        "database": "connected",
+        "status": "healthy" if health_monitor.is_ready() else "degraded",
+        "database": "connected" if health_monitor.database_ok else "disconnected",
         "service": "operational",
+        "indexes": db.index_status,
+        "connection_pool": db.pool_stats(),
+        "organization_cache": OrganizationService.cache_stats(),
+        "token_cache": JWTHandler.cache_stats(),
+        "rate_limiter": RateLimiter.stats(),
+        "reconciler": reconciler.stats(),
+        "name_filter": name_index.stats(),
+        "cache_watcher": cache_watcher.stats(),
+        "jobs": job_worker.stats(),
+        "usage": usage_tracker.stats(),
+        "revocations": revocation_list.stats(),
     }
+
+
+@app.get("/health/live", tags=["Health Check"])
+async def liveness_check():
+    return health_monitor.liveness()
+
+
+@app.get("/health/ready", tags=["Health Check"])
+async def readiness_check():
+    report = health_monitor.readiness()
+    status_code = 200 if report["status"] == "ready" else 503
+    return JSONResponse(content=report, status_code=status_code)
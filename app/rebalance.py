@@ -0,0 +1,80 @@
+"""Move tenant collections between shards with the streaming copy.
+
+    python -m app.rebalance                          # print the plan and shard loads
+    python -m app.rebalance --apply --limit 100      # execute up to 100 planned moves
+    python -m app.rebalance --org TechCorp --to b    # move one tenant
+
+Shards come from TENANT_SHARDS and the plan follows TENANT_PLACEMENT. Each move
+blocks the tenant's data routes for ORG_CACHE_TTL_SECONDS plus the copy time.
+"""
+import argparse
+import asyncio
+from .database import db
+from .services.organization_service import OrganizationService
+from .services.placement_service import PlacementService
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--apply", action="store_true", help="execute the plan instead of printing it")
+    parser.add_argument("--limit", type=int, help="maximum number of tenants to move")
+    parser.add_argument("--concurrency", type=int, default=4, help="tenants moved at the same time")
+    parser.add_argument("--org", help="move a single organization (requires --to)")
+    parser.add_argument("--to", help="target shard for --org")
+    parser.add_argument("--settle-seconds", type=float, help="wait for other processes' caches (default ORG_CACHE_TTL_SECONDS)")
+    args = parser.parse_args()
+    if bool(args.org) != bool(args.to):
+        parser.error("--org and --to must be used together")
+    return args
+
+
+async def move(organization_name: str, target_shard: str, settle_seconds) -> bool:
+    def progress(copied: int) -> None:
+        print(f"  {organization_name}: {copied} documents copied")
+
+    try:
+        copied = await OrganizationService.move_to_shard(
+            organization_name,
+            target_shard,
+            settle_seconds=settle_seconds,
+            progress_callback=progress,
+        )
+    except ValueError as e:
+        print(f"  {organization_name}: skipped ({e})")
+        return False
+    print(f"  {organization_name}: moved to {target_shard} ({copied} documents)")
+    return True
+
+
+async def main(args) -> int:
+    await db.connect_db()
+    try:
+        if args.org:
+            return 0 if await move(args.org, args.to, args.settle_seconds) else 1
+
+        print("Tenants per shard:")
+        for shard, tenants in (await PlacementService.shard_loads()).items():
+            print(f"  {shard:<20} {tenants:>8}")
+
+        planned = [entry async for entry in PlacementService.plan_rebalance(limit=args.limit)]
+        print(f"{len(planned)} moves planned")
+        for entry in planned:
+            print(f"  {entry['organization_name']}: {entry['from']} -> {entry['to']}")
+        if not args.apply:
+            return 0
+
+        semaphore = asyncio.Semaphore(max(1, args.concurrency))
+
+        async def bounded_move(entry) -> bool:
+            async with semaphore:
+                return await move(entry["organization_name"], entry["to"], args.settle_seconds)
+
+        moved = await asyncio.gather(*(bounded_move(entry) for entry in planned))
+        print(f"{sum(moved)} of {len(planned)} tenants moved")
+        return 0
+    finally:
+        await db.close_db()
+
+
+if __name__ == "__main__":
+    raise SystemExit(asyncio.run(main(parse_args())))
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field
+from typing import Optional
 
 
 class AdminLogin(BaseModel):
@@ -14,18 +15,26 @@ class AdminLogin(BaseModel):
         }
 
 
+class RefreshRequest(BaseModel):
+    refresh_token: str = Field(..., min_length=1, max_length=200)
+
+
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
     admin_email: str
     organization_name: str
+    refresh_token: Optional[str] = None
+    expires_in: Optional[int] = None
 
     class Config:
         json_schema_extra = {
             "example": {
                 "access_token": "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9...",
-            "token_type": "bearer",
-            "admin_email": "admin@techcorp.com",
-            "organization_name": "TechCorp"
+                "token_type": "bearer",
+                "admin_email": "admin@techcorp.com",
+                "organization_name": "TechCorp",
+                "refresh_token": "c2Vzc2lvbg.cmVmcmVzaC1zZWNyZXQ",
+                "expires_in": 1800
             }
         }
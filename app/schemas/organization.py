@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 
 class OrganizationCreate(BaseModel):
@@ -17,6 +18,10 @@ class OrganizationCreate(BaseModel):
         }
 
 
+class OrganizationBulkCreate(BaseModel):
+    organizations: List[OrganizationCreate] = Field(..., min_length=1)
+
+
 class OrganizationUpdate(BaseModel):
     organization_name: str = Field(..., min_length=3, max_length=100)
     email: EmailStr
@@ -29,6 +34,7 @@ class OrganizationResponse(BaseModel):
     admin_email: str
     created_at: datetime
     message: str = "Success"
+    job_id: Optional[str] = None
 
     class Config:
         json_schema_extra = {
@@ -48,3 +54,8 @@ class OrganizationGet(BaseModel):
     admin_email: str
     created_at: datetime
     updated_at: datetime
+
+
+class OrganizationList(BaseModel):
+    organizations: List[Dict[str, Any]]
+    next_page_token: Optional[str] = None
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
+
+
+class TenantDocumentsCreate(BaseModel):
+    documents: List[Dict[str, Any]] = Field(..., min_length=1)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "documents": [
+                    {"type": "project", "name": "Website redesign", "status": "active"},
+                    {"type": "project", "name": "Mobile app", "status": "planned"}
+                ]
+            }
+        }
+
+
+class TenantDocumentsCreated(BaseModel):
+    inserted_ids: List[str]
+    inserted_count: int
+
+
+class TenantDocumentList(BaseModel):
+    documents: List[Dict[str, Any]]
+    next_page_token: Optional[str] = None
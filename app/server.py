@@ -0,0 +1,177 @@
+"""Production entry point: pre-forked uvicorn workers sharing one listening socket.
+
+    python -m app.server                           # SERVER_WORKERS workers (0 = one per available core)
+    python -m app.server --workers 4 --port 8080
+    python -m app.server --workers 1               # single process, no supervisor
+
+The parent binds the socket and imports the application once, then forks the
+workers. No database client exists before the fork: each worker opens its own
+in its lifespan. On SIGTERM or SIGINT the parent forwards SIGTERM to every
+worker and closes its copy of the socket. Each worker stops accepting, lets
+in-flight requests finish for up to SERVER_GRACEFUL_TIMEOUT_SECONDS, then gives
+running background jobs JOB_DRAIN_SECONDS before handing them back to the queue.
+Workers still alive after both timeouts are killed. A worker that exits on its
+own is replaced.
+"""
+import argparse
+import math
+import os
+import signal
+import socket
+import time
+from importlib.util import find_spec
+from typing import Dict, Optional
+import uvicorn
+from .config import get_settings
+
+settings = get_settings()
+
+# Extra time the supervisor allows on top of the configured drain timeouts.
+KILL_MARGIN_SECONDS = 10.0
+# Workers that exit sooner than this after starting are restarted with a delay.
+MIN_WORKER_UPTIME_SECONDS = 5.0
+
+
+def available_cpus() -> int:
+    # Counts CPUs this process may run on, capped by a cgroup v2 CPU quota (containers).
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, math.ceil(int(quota) / int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS, help="0 = one per available core")
+    return parser.parse_args()
+
+
+def build_config(host: str, port: int) -> uvicorn.Config:
+    # uvloop and httptools are optional C extensions; fall back to the pure Python ones.
+    loop = settings.SERVER_LOOP
+    if loop == "uvloop" and find_spec("uvloop") is None:
+        print("uvloop is not installed, using asyncio")
+        loop = "asyncio"
+    http = settings.SERVER_HTTP
+    if http == "httptools" and find_spec("httptools") is None:
+        print("httptools is not installed, using h11")
+        http = "h11"
+
+    return uvicorn.Config(
+        "app.main:app",
+        host=host,
+        port=port,
+        loop=loop,
+        http=http,
+        lifespan="on",
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        access_log=settings.SERVER_ACCESS_LOG,
+    )
+
+
+# Forks and watches the workers. Signals only set flags and forward SIGTERM;
+# reaping happens in run(), which polls waitpid so the kill deadline is honoured.
+class WorkerSupervisor:
+    def __init__(self, config: uvicorn.Config, sock: socket.socket, workers: int):
+        self.config = config
+        self.sock = sock
+        self.workers = workers
+        self.children: Dict[int, float] = {}
+        self.stopping = False
+        self.deadline: Optional[float] = None
+
+    def spawn(self) -> None:
+        pid = os.fork()
+        if pid:
+            self.children[pid] = time.monotonic()
+            return
+
+        # A process group of its own keeps a terminal's Ctrl+C from reaching the
+        # worker twice (directly and forwarded), which uvicorn treats as force quit.
+        os.setpgid(0, 0)
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, signal.SIG_DFL)
+        code = 0
+        try:
+            uvicorn.Server(self.config).run(sockets=[self.sock])
+        except BaseException as e:
+            print(f"Worker {os.getpid()} crashed: {e}")
+            code = 1
+        finally:
+            os._exit(code)
+
+    def handle_signal(self, sig, frame) -> None:
+        if self.stopping:
+            return
+        self.stopping = True
+        drain = settings.SERVER_GRACEFUL_TIMEOUT_SECONDS + settings.JOB_DRAIN_SECONDS
+        self.deadline = time.monotonic() + drain + KILL_MARGIN_SECONDS
+        print(f"Received {signal.Signals(sig).name}, draining {len(self.children)} workers")
+        self.sock.close()
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self) -> int:
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self.handle_signal)
+        for _ in range(self.workers):
+            self.spawn()
+        print(f"Started {self.workers} workers (pids {', '.join(map(str, self.children))})")
+
+        while self.children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                if self.deadline is not None and time.monotonic() > self.deadline:
+                    print(f"Killing {len(self.children)} workers that did not drain in time")
+                    for child in self.children:
+                        os.kill(child, signal.SIGKILL)
+                    self.deadline = None
+                time.sleep(0.1)
+                continue
+
+            started = self.children.pop(pid, None)
+            if started is None or self.stopping:
+                continue
+            print(f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}, restarting")
+            if time.monotonic() - started < MIN_WORKER_UPTIME_SECONDS:
+                time.sleep(1.0)
+            if not self.stopping:
+                self.spawn()
+        print("All workers stopped")
+        return 0
+
+
+def main(args) -> int:
+    workers = args.workers or available_cpus()
+    config = build_config(args.host, args.port)
+    if workers == 1:
+        uvicorn.Server(config).run()
+        return 0
+
+    sock = config.bind_socket()
+    # Importing before the fork shares the loaded modules copy-on-write.
+    config.load()
+    from .database import db
+
+    if db.client is not None:
+        raise RuntimeError("A MongoDB client was created before forking workers")
+    return WorkerSupervisor(config, sock, workers).run()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(parse_args()))
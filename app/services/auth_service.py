@@ -1,14 +1,23 @@
-from typing import Optional, Dict
+import asyncio
+from typing import Any, Optional, Dict
 from datetime import timedelta
+from pymongo.errors import PyMongoError
 from ..database import db
-from ..utils.password_handler import PasswordHandler
+from ..utils.metrics import PASSWORD_REHASHES
+from ..utils.password_handler import PasswordHandler, PasswordHasherBusy
 from ..utils.jwt_handler import JWTHandler
 from ..config import get_settings
 
 settings = get_settings()
 
 
+# A successful login holds the plain password, which is the only chance to move
+# a hash to the current PASSWORD_HASH_* policy. The rehash runs after the
+# response on the hashing pool, at most once per admin at a time, and the write
+# is conditional on the old hash so a password changed meanwhile is kept.
 class AuthService:
+    _rehashes: Dict[Any, asyncio.Task] = {}
+
     @staticmethod
     async def authenticate_admin(email: str, password: str) -> Optional[Dict]:
         master_db = db.get_master_db()
@@ -16,21 +25,56 @@ class AuthService:
         if not admin:
             return None
 
-        if not PasswordHandler.verify_password(password, admin["hashed_password"]):
+        if not await PasswordHandler.verify_password_async(password, admin["hashed_password"]):
             return None
 
         if not admin.get("is_active", True):
             return None
 
+        if settings.PASSWORD_REHASH_ON_LOGIN and PasswordHandler.needs_rehash(admin["hashed_password"]):
+            AuthService.schedule_rehash(admin, password)
         return admin
 
+    @classmethod
+    def schedule_rehash(cls, admin: Dict, password: str) -> None:
+        if admin["_id"] in cls._rehashes:
+            return
+        task = asyncio.create_task(cls.rehash_password(admin, password))
+        cls._rehashes[admin["_id"]] = task
+        task.add_done_callback(lambda _: cls._rehashes.pop(admin["_id"], None))
+
+    @staticmethod
+    async def rehash_password(admin: Dict, password: str) -> bool:
+        try:
+            hashed_password = await PasswordHandler.hash_password_async(password)
+            result = await db.get_master_db().admins.update_one(
+                {"_id": admin["_id"], "hashed_password": admin["hashed_password"]},
+                {"$set": {"hashed_password": hashed_password}},
+            )
+        except PasswordHasherBusy:
+            # Logins have priority on the pool; the next login tries again.
+            PASSWORD_REHASHES.inc(("deferred",))
+            return False
+        except PyMongoError as e:
+            PASSWORD_REHASHES.inc(("failed",))
+            print(f"Password rehash for {admin['email']} failed: {e}")
+            return False
+        PASSWORD_REHASHES.inc(("upgraded" if result.modified_count else "superseded",))
+        return result.modified_count > 0
+
+    @classmethod
+    async def wait_for_rehashes(cls) -> None:
+        await asyncio.gather(*cls._rehashes.values(), return_exceptions=True)
+
     @staticmethod
-    def create_admin_token(admin: Dict) -> str:
+    def create_admin_token(admin: Dict, session_id: Optional[str] = None) -> str:
         token_data = {
             "sub": admin["email"],
             "organization_name": admin["organization_name"],
             "organization_id": admin.get("organization_id", ""),
         }
+        if session_id:
+            token_data["sid"] = session_id
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token = JWTHandler.create_access_token(
             data=token_data,
@@ -0,0 +1,154 @@
+import asyncio
+import time
+from typing import Dict, Optional
+from pymongo import DESCENDING
+from pymongo.errors import OperationFailure, PyMongoError
+from ..config import get_settings
+from ..database import db
+from .name_index import name_index
+from .organization_service import OrganizationService
+
+settings = get_settings()
+
+WATCHED_COLLECTIONS = ["organizations", "admins"]
+
+
+# Keeps this process's organization caches coherent with writes made by other
+# workers. Change streams on the master database are preferred; a rename carries
+# renamed_from so both names are evicted, an admin write evicts the admin's
+# organization, and a delete (which only reports _id) flushes the organization
+# caches. Where change streams are unavailable the watcher polls a cheap version
+# of organizations (newest updated_at plus document count) and, when it moves,
+# flushes and syncs the name filters.
+class CacheWatcher:
+    def __init__(self):
+        self._task = None
+        self._resume_token = None
+        self._version = None
+        self.mode: Optional[str] = None
+        self.events = 0
+        self.evictions = 0
+        self.flushes = 0
+        self.restarts = 0
+        self.last_event_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def _flush(self) -> None:
+        OrganizationService.clear_caches()
+        self.flushes += 1
+
+    def apply_change(self, change: Dict) -> None:
+        self.events += 1
+        self.last_event_at = time.time()
+        document = change.get("fullDocument")
+
+        if change["ns"]["coll"] == "admins":
+            if document and document.get("email"):
+                name_index.admin_emails.add(document["email"])
+            if document and document.get("organization_name"):
+                OrganizationService._invalidate_organization(document["organization_name"])
+                self.evictions += 1
+            return
+
+        if change["operationType"] not in ("insert", "update", "replace") or not document:
+            self._flush()
+            return
+
+        names = {document["organization_name"], document.get("renamed_from")}
+        names.discard(None)
+        OrganizationService._invalidate_organization(*names)
+        name_index.add([document["organization_name"]], [document["admin_email"]] if document.get("admin_email") else [])
+        self.evictions += len(names)
+
+    async def _watch(self) -> None:
+        stream = db.get_master_db().watch(
+            [{"$match": {"ns.coll": {"$in": WATCHED_COLLECTIONS}}}],
+            full_document="updateLookup",
+            resume_after=self._resume_token,
+        )
+        async with stream:
+            self.mode = "change_stream"
+            async for change in stream:
+                self.apply_change(change)
+                self._resume_token = stream.resume_token
+
+    async def _run_change_stream(self) -> None:
+        while True:
+            try:
+                await self._watch()
+            except OperationFailure as e:
+                # The token can no longer be resumed (history lost, stream
+                # invalidated); start over from a clean cache.
+                self.last_error = str(e)
+                self._resume_token = None
+                self._flush()
+            except PyMongoError as e:
+                self.last_error = str(e)
+            self.restarts += 1
+            await asyncio.sleep(settings.CACHE_WATCH_RETRY_SECONDS)
+
+    async def _collection_version(self):
+        organizations = db.get_master_db().organizations
+        newest = await organizations.find({}, {"_id": 0, "updated_at": 1}).sort("updated_at", DESCENDING).limit(1).to_list(1)
+        count = await organizations.estimated_document_count()
+        return (newest[0].get("updated_at") if newest else None, count)
+
+    async def poll_once(self) -> None:
+        version = await self._collection_version()
+        if self._version is not None and version != self._version:
+            self._flush()
+            # Without change events the name filters only learn of other
+            # workers' creates here; until then they would reject the names.
+            await name_index.sync()
+        self._version = version
+
+    async def _run_polling(self) -> None:
+        self.mode = "poll"
+        while True:
+            try:
+                await self.poll_once()
+            except PyMongoError as e:
+                self.last_error = str(e)
+            await asyncio.sleep(settings.CACHE_POLL_INTERVAL_SECONDS)
+
+    async def _run(self) -> None:
+        if settings.CACHE_WATCH_MODE == "poll":
+            await self._run_polling()
+            return
+
+        try:
+            await self._watch()
+        except Exception as e:
+            self.last_error = str(e)
+            # A stream that never opened means this deployment has no change streams.
+            if self.mode is None and settings.CACHE_WATCH_MODE == "auto":
+                print(f"Change streams unavailable, polling for cache coherence: {e}")
+                await self._run_polling()
+                return
+        self.restarts += 1
+        await asyncio.sleep(settings.CACHE_WATCH_RETRY_SECONDS)
+        await self._run_change_stream()
+
+    def start(self) -> None:
+        if settings.CACHE_WATCH_ENABLED:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict:
+        return {
+            "mode": self.mode,
+            "events": self.events,
+            "evictions": self.evictions,
+            "flushes": self.flushes,
+            "restarts": self.restarts,
+            "last_event_at": self.last_event_at,
+            "last_error": self.last_error,
+        }
+
+
+cache_watcher = CacheWatcher()
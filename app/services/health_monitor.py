@@ -0,0 +1,118 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+from ..config import get_settings
+from ..database import db
+
+settings = get_settings()
+
+
+def _percentile(ordered, pct: float) -> float:
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+class HealthMonitor:
+    def __init__(self):
+        self._latencies: Deque[float] = deque(maxlen=settings.HEALTH_LATENCY_WINDOW)
+        self._tasks = []
+        self.database_ok = False
+        self.last_success: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.consecutive_failures = 0
+        self.loop_lag_ms = 0.0
+        self.loop_lag_max_ms = 0.0
+        self._latency_report: Dict = {}
+
+    async def check_database(self) -> None:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(
+                db.client.admin.command("ping"),
+                timeout=settings.HEALTH_CHECK_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            self.database_ok = False
+            self.consecutive_failures += 1
+            self.last_error = str(e) or e.__class__.__name__
+            return
+
+        self._latencies.append((time.perf_counter() - start) * 1000)
+        self.database_ok = True
+        self.consecutive_failures = 0
+        self.last_error = None
+        self.last_success = time.time()
+
+        ordered = sorted(self._latencies)
+        self._latency_report = {
+            "samples": len(ordered),
+            "last_ms": round(self._latencies[-1], 3),
+            "p50_ms": round(_percentile(ordered, 50), 3),
+            "p95_ms": round(_percentile(ordered, 95), 3),
+            "p99_ms": round(_percentile(ordered, 99), 3),
+        }
+
+    async def _ping_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.HEALTH_CHECK_INTERVAL_SECONDS)
+            await self.check_database()
+
+    async def _loop_lag_sampler(self) -> None:
+        interval = settings.HEALTH_LOOP_LAG_INTERVAL_SECONDS
+        while True:
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            lag_ms = max(0.0, (time.perf_counter() - expected) * 1000)
+            self.loop_lag_ms = round(lag_ms, 3)
+            self.loop_lag_max_ms = round(max(self.loop_lag_max_ms, lag_ms), 3)
+
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._ping_loop()),
+            asyncio.create_task(self._loop_lag_sampler()),
+        ]
+        # With a lazy connection the first ping must not hold up startup; readiness
+        # reports unavailable until it succeeds.
+        if settings.MONGODB_LAZY_CONNECT:
+            self._tasks.append(asyncio.create_task(self.check_database()))
+        else:
+            await self.check_database()
+        print("Health monitor started")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def is_ready(self) -> bool:
+        if not self.database_ok or self.last_success is None:
+            return False
+        stale_after = settings.HEALTH_CHECK_INTERVAL_SECONDS * 3 + settings.HEALTH_CHECK_TIMEOUT_SECONDS
+        return time.time() - self.last_success <= stale_after
+
+    def liveness(self) -> Dict:
+        return {
+            "status": "alive",
+            "event_loop_lag_ms": self.loop_lag_ms,
+            "event_loop_lag_max_ms": self.loop_lag_max_ms,
+        }
+
+    def readiness(self) -> Dict:
+        return {
+            "status": "ready" if self.is_ready() else "unavailable",
+            "database": {
+                "status": "connected" if self.database_ok else "disconnected",
+                "last_success": self.last_success,
+                "last_error": self.last_error,
+                "consecutive_failures": self.consecutive_failures,
+                "round_trip": self._latency_report,
+            },
+            "connection_pool": db.pool_stats(),
+            "event_loop_lag_ms": self.loop_lag_ms,
+        }
+
+
+health_monitor = HealthMonitor()
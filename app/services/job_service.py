@@ -0,0 +1,101 @@
+import asyncio
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Set
+from bson import ObjectId
+from bson.errors import InvalidId
+from ..database import db
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+ACTIVE_STATUSES = [JOB_QUEUED, JOB_RUNNING]
+# A failed drop leaves the collection behind with the old tenant's data, so its
+# name stays reserved until the job expires (the reconciler drops the collection).
+DROP_RESERVED_STATUSES = [JOB_QUEUED, JOB_RUNNING, JOB_FAILED]
+
+
+class JobService:
+    # Set on enqueue so this process's workers pick the job up without waiting for a poll.
+    wakeup = asyncio.Event()
+
+    @staticmethod
+    def _jobs():
+        return db.get_master_db().jobs
+
+    @staticmethod
+    def build(job_type: str, organization_id: str, organization_name: str, params: Dict) -> Dict:
+        now = datetime.utcnow()
+        return {
+            "_id": ObjectId(),
+            "type": job_type,
+            "organization_id": organization_id,
+            "organization_name": organization_name,
+            "params": params,
+            "status": JOB_QUEUED,
+            "progress": {"done": 0, "total": None},
+            "attempts": 0,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    @classmethod
+    def insert(cls, job: Dict):
+        # Returns a write for Database.run_in_transaction, so a job commits with
+        # the metadata change that requires it.
+        return lambda session: cls._jobs().insert_one(job, session=session)
+
+    @classmethod
+    async def enqueue(cls, job_type: str, organization_id: str, organization_name: str, params: Dict) -> str:
+        job = cls.build(job_type, organization_id, organization_name, params)
+        await cls.insert(job)(None)
+        cls.wakeup.set()
+        return str(job["_id"])
+
+    @classmethod
+    async def get_job(cls, job_id: str) -> Optional[Dict]:
+        try:
+            object_id = ObjectId(job_id)
+        except (InvalidId, TypeError):
+            return None
+        return await cls._jobs().find_one({"_id": object_id}, {"params": 0, "owner": 0})
+
+    @classmethod
+    async def has_active_job(cls, organization_id: str) -> bool:
+        job = await cls._jobs().find_one(
+            {"organization_id": organization_id, "status": {"$in": ACTIVE_STATUSES}},
+            {"_id": 1},
+        )
+        return job is not None
+
+    @classmethod
+    async def pending_drops(cls, collection_names: Iterable[str]) -> Set[str]:
+        names = set(collection_names)
+        pending = set()
+        async for job in cls._jobs().find(
+            {
+                "type": "drop_collections",
+                "status": {"$in": DROP_RESERVED_STATUSES},
+                "params.collection_names": {"$in": list(names)},
+            },
+            {"params.collection_names": 1},
+        ):
+            pending.update(job["params"]["collection_names"])
+        return pending & names
+
+    @staticmethod
+    def serialize(job: Dict) -> Dict:
+        return {
+            "id": str(job["_id"]),
+            "type": job["type"],
+            "organization_id": job["organization_id"],
+            "organization_name": job["organization_name"],
+            "status": job["status"],
+            "progress": job.get("progress"),
+            "attempts": job.get("attempts", 0),
+            "error": job.get("error"),
+            "created_at": job["created_at"],
+            "started_at": job.get("started_at"),
+            "finished_at": job.get("finished_at"),
+        }
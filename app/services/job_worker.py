@@ -0,0 +1,235 @@
+import asyncio
+import os
+import socket
+import time
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional
+from bson import ObjectId
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import PyMongoError
+from ..config import get_settings
+from ..database import db
+from .job_service import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JobService
+from .organization_service import OrganizationService
+
+settings = get_settings()
+
+JobHandler = Callable[[Dict, Dict], Awaitable[None]]
+
+
+async def move_collection_job(job: Dict, progress: Dict) -> None:
+    params = job["params"]
+    org = await db.get_master_db().organizations.find_one(
+        {"_id": ObjectId(job["organization_id"]), "migrating_from": params["old_collection_name"]},
+        {"_id": 1},
+    )
+    if not org:
+        # Deleted (or already completed by the reconciler) since the job was queued.
+        return
+
+    source = db.get_org_collection(params["old_collection_name"], params.get("shard"))
+    progress["total"] = await source.estimated_document_count()
+
+    def on_progress(copied: int) -> None:
+        progress["done"] = copied
+
+    await OrganizationService.complete_collection_move(
+        params["organization_name"],
+        params["old_collection_name"],
+        params["new_collection_name"],
+        on_progress,
+        shard=params.get("shard"),
+    )
+
+
+async def drop_collections_job(job: Dict, progress: Dict) -> None:
+    params = job["params"]
+    progress["total"] = len(params["collection_names"])
+    organizations = db.get_master_db().organizations
+    for collection_name in params["collection_names"]:
+        # Creates refuse names with a pending drop, so a reference here means the
+        # name was reused some other way; its data is not this job's to drop.
+        referenced = await organizations.find_one(
+            {"$or": [{"collection_name": collection_name}, {"migrating_from": collection_name}]},
+            {"_id": 1},
+        )
+        if referenced:
+            print(f"Job {job['_id']}: {collection_name} is referenced by an organization, not dropping it")
+        else:
+            await db.get_org_collection(collection_name, params.get("shard")).drop()
+        progress["done"] += 1
+
+
+JOB_HANDLERS: Dict[str, JobHandler] = {
+    "move_collection": move_collection_job,
+    "drop_collections": drop_collections_job,
+}
+
+
+# Jobs live in the master database, so any process can run any job. A claim is
+# one find_one_and_update; the per-tenant limit is checked before and after it
+# because two processes may claim for the same tenant at once. Running jobs
+# heartbeat, and jobs whose owner stopped heartbeating are requeued.
+class JobWorker:
+    def __init__(self):
+        self.worker_id = None
+        self.draining = False
+        self._tasks = []
+        self.running = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    @staticmethod
+    def _jobs():
+        return db.get_master_db().jobs
+
+    async def claim(self) -> Optional[Dict]:
+        jobs = self._jobs()
+        if await jobs.count_documents({"status": JOB_RUNNING}) >= settings.JOB_MAX_RUNNING:
+            return None
+
+        busy = [row["_id"] async for row in jobs.aggregate([
+            {"$match": {"status": JOB_RUNNING}},
+            {"$group": {"_id": "$organization_id", "running": {"$sum": 1}}},
+            {"$match": {"running": {"$gte": settings.JOB_MAX_PER_TENANT}}},
+        ])]
+        now = datetime.utcnow()
+        job = await jobs.find_one_and_update(
+            {"status": JOB_QUEUED, "organization_id": {"$nin": busy}},
+            {
+                "$set": {"status": JOB_RUNNING, "owner": self.worker_id, "started_at": now, "heartbeat_at": now},
+                "$inc": {"attempts": 1},
+            },
+            sort=[("created_at", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+        if job is None:
+            return None
+
+        running = await jobs.count_documents({"organization_id": job["organization_id"], "status": JOB_RUNNING})
+        if running > settings.JOB_MAX_PER_TENANT:
+            await jobs.update_one(
+                {"_id": job["_id"], "owner": self.worker_id},
+                {"$set": {"status": JOB_QUEUED, "owner": None}, "$inc": {"attempts": -1}},
+            )
+            return None
+        return job
+
+    async def run_job(self, job: Dict) -> None:
+        jobs = self._jobs()
+        owned = {"_id": job["_id"], "owner": self.worker_id}
+        progress = {"done": 0, "total": None}
+
+        async def heartbeat():
+            while True:
+                await asyncio.sleep(settings.JOB_HEARTBEAT_SECONDS)
+                await jobs.update_one(owned, {"$set": {"heartbeat_at": datetime.utcnow(), "progress": dict(progress)}})
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        self.running += 1
+        try:
+            await JOB_HANDLERS[job["type"]](job, progress)
+            update = {"status": JOB_SUCCEEDED, "error": None}
+            self.succeeded += 1
+        except Exception as e:
+            retry = job["attempts"] < settings.JOB_MAX_ATTEMPTS
+            update = {"status": JOB_QUEUED if retry else JOB_FAILED, "error": str(e) or e.__class__.__name__}
+            if retry:
+                update["owner"] = None
+            self.failed += 1
+            print(f"Job {job['_id']} ({job['type']}) failed on attempt {job['attempts']}: {e}")
+        except asyncio.CancelledError:
+            # Handed back right away instead of waiting JOB_STALE_SECONDS, and
+            # the interrupted attempt does not count against JOB_MAX_ATTEMPTS.
+            try:
+                await jobs.update_one(owned, {
+                    "$set": {"status": JOB_QUEUED, "owner": None, "progress": progress, "updated_at": datetime.utcnow()},
+                    "$inc": {"attempts": -1},
+                })
+            except PyMongoError as e:
+                print(f"Job {job['_id']} could not be requeued: {e}")
+            raise
+        finally:
+            heartbeat_task.cancel()
+            self.running -= 1
+
+        now = datetime.utcnow()
+        update.update({"progress": progress, "updated_at": now})
+        if update["status"] != JOB_QUEUED:
+            update["finished_at"] = now
+        await jobs.update_one(owned, {"$set": update})
+
+    async def requeue_stale_jobs(self) -> None:
+        jobs = self._jobs()
+        stale = {"status": JOB_RUNNING, "heartbeat_at": {"$lt": datetime.utcnow() - timedelta(seconds=settings.JOB_STALE_SECONDS)}}
+        await jobs.update_many(
+            {**stale, "attempts": {"$gte": settings.JOB_MAX_ATTEMPTS}},
+            {"$set": {"status": JOB_FAILED, "error": "Worker stopped responding", "finished_at": datetime.utcnow()}},
+        )
+        await jobs.update_many(stale, {"$set": {"status": JOB_QUEUED, "owner": None}})
+
+    async def _work_loop(self) -> None:
+        while not self.draining:
+            # Cleared before claiming so an enqueue that races the claim still wakes us.
+            JobService.wakeup.clear()
+            try:
+                job = await self.claim()
+            except PyMongoError as e:
+                print(f"Job claim failed: {e}")
+                job = None
+
+            if job is None:
+                # asyncio.wait rather than wait_for: on 3.11 wait_for drops a cancel
+                # that lands as the shared event fires, and stop() would hang.
+                waiter = asyncio.ensure_future(JobService.wakeup.wait())
+                try:
+                    await asyncio.wait([waiter], timeout=settings.JOB_POLL_INTERVAL_SECONDS)
+                finally:
+                    waiter.cancel()
+                continue
+
+            try:
+                await self.run_job(job)
+            except PyMongoError as e:
+                print(f"Job {job['_id']} status update failed: {e}")
+
+    async def _reap_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.JOB_STALE_SECONDS / 2)
+            try:
+                await self.requeue_stale_jobs()
+            except PyMongoError as e:
+                print(f"Stale job check failed: {e}")
+
+    def start(self) -> None:
+        if not settings.JOBS_ENABLED or settings.JOB_WORKERS <= 0:
+            return
+        # Taken at start, not import: pre-forked server workers share the import.
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.draining = False
+        self._tasks = [asyncio.create_task(self._work_loop()) for _ in range(settings.JOB_WORKERS)]
+        self._tasks.append(asyncio.create_task(self._reap_loop()))
+
+    async def stop(self, drain_seconds: float = 0.0) -> None:
+        # Loops stop claiming at once; running jobs get drain_seconds to finish
+        # before they are cancelled and requeued.
+        self.draining = True
+        deadline = time.monotonic() + drain_seconds
+        while self.running and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def stats(self) -> Dict:
+        return {
+            "worker_id": self.worker_id,
+            "workers": max(0, len(self._tasks) - 1),
+            "running": self.running,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+        }
+
+
+job_worker = JobWorker()
@@ -0,0 +1,105 @@
+import asyncio
+from typing import Callable, List, Optional, Set
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import OperationFailure
+from ..config import get_settings
+
+settings = get_settings()
+
+NAMESPACE_NOT_FOUND = 26
+NAMESPACE_EXISTS = 48
+
+ProgressCallback = Callable[[int], None]
+
+
+class MigrationService:
+    @staticmethod
+    def _same_database(source: AsyncIOMotorCollection, target: AsyncIOMotorCollection) -> bool:
+        return (
+            source.database.client is target.database.client
+            and source.database.name == target.database.name
+        )
+
+    @staticmethod
+    async def copy_collection(
+        source: AsyncIOMotorCollection,
+        target: AsyncIOMotorCollection,
+        batch_size: Optional[int] = None,
+        max_inflight_batches: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> int:
+        batch_size = batch_size or settings.MIGRATION_BATCH_SIZE
+        max_inflight_batches = max(1, max_inflight_batches or settings.MIGRATION_MAX_INFLIGHT_BATCHES)
+
+        copied = 0
+        inflight: Set[asyncio.Task] = set()
+
+        async def flush(batch: List[dict]) -> None:
+            nonlocal copied
+            await target.insert_many(batch, ordered=False)
+            copied += len(batch)
+            if progress_callback:
+                progress_callback(copied)
+
+        try:
+            buffer: List[dict] = []
+            async for document in source.find(batch_size=batch_size):
+                buffer.append(document)
+                if len(buffer) < batch_size:
+                    continue
+
+                if len(inflight) >= max_inflight_batches:
+                    done, inflight = await asyncio.wait(inflight, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+
+                inflight.add(asyncio.create_task(flush(buffer)))
+                buffer = []
+
+            if buffer:
+                inflight.add(asyncio.create_task(flush(buffer)))
+
+            if inflight:
+                done, inflight = await asyncio.wait(inflight)
+                for task in done:
+                    task.result()
+        finally:
+            for task in inflight:
+                task.cancel()
+
+        return copied
+
+    @classmethod
+    async def move_collection(
+        cls,
+        source: AsyncIOMotorCollection,
+        target: AsyncIOMotorCollection,
+        batch_size: Optional[int] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> int:
+        if source.full_name == target.full_name:
+            return 0
+
+        if cls._same_database(source, target):
+            try:
+                count = await source.estimated_document_count()
+                await source.rename(target.name)
+                if progress_callback:
+                    progress_callback(count)
+                return count
+            except OperationFailure as e:
+                if e.code == NAMESPACE_NOT_FOUND:
+                    return 0
+                if e.code == NAMESPACE_EXISTS:
+                    # Copying into it would merge someone else's leftover data into this tenant.
+                    raise RuntimeError(f"Target collection {target.name} already exists") from e
+                raise
+
+        copied = await cls.copy_collection(
+            source,
+            target,
+            batch_size=batch_size,
+            progress_callback=progress_callback,
+        )
+        await source.drop()
+        return copied
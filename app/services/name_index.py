@@ -0,0 +1,180 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+from ..config import get_settings
+from ..database import db
+from ..utils.bloom import BloomFilter
+from ..utils.cache import TTLCache
+
+settings = get_settings()
+
+
+class NameFilter:
+    def __init__(self, name: str):
+        self.name = name
+        self.bloom: Optional[BloomFilter] = None
+        self._negative = TTLCache(
+            max_size=settings.NEGATIVE_CACHE_MAX_SIZE,
+            ttl_seconds=settings.NEGATIVE_CACHE_TTL_SECONDS,
+        )
+        self.bloom_rejections = 0
+        self.false_positives = 0
+
+    def might_exist(self, key: str) -> bool:
+        if self._negative.get(key) is not None:
+            return False
+        if self.bloom is not None and key not in self.bloom:
+            self.bloom_rejections += 1
+            return False
+        return True
+
+    def record_lookup(self, key: str, found: bool) -> None:
+        if found:
+            self.add(key)
+            return
+
+        self._negative.set(key, True)
+        if self.bloom is not None and key in self.bloom:
+            self.false_positives += 1
+
+    def add(self, key: str) -> None:
+        self._negative.invalidate(key)
+        if self.bloom is not None:
+            self.bloom.add(key)
+
+    def forget_misses(self) -> None:
+        self._negative.clear()
+
+    def false_positive_rate(self) -> float:
+        # Share of absent keys the filter could not rule out.
+        absent = self.false_positives + self.bloom_rejections
+        return self.false_positives / absent if absent else 0.0
+
+    def stats(self) -> Dict:
+        return {
+            "bloom": self.bloom.stats() if self.bloom is not None else None,
+            "negative_cache": self._negative.stats(),
+            "bloom_rejections": self.bloom_rejections,
+            "false_positives": self.false_positives,
+            "false_positive_rate": self.false_positive_rate(),
+        }
+
+
+# Bloom filters of organization names and admin emails, built from a projected
+# scan of organizations (admin_email mirrors the admin's email). Another worker's
+# writes reach this process through the updated_at sync every
+# NAME_FILTER_SYNC_SECONDS, so a name created elsewhere may read as missing for
+# that long; unique indexes still reject duplicate creates. Filters cannot
+# forget deleted names and are rebuilt every NAME_FILTER_REBUILD_SECONDS.
+class NameIndex:
+    def __init__(self):
+        self.organizations = NameFilter("organization_name")
+        self.admin_emails = NameFilter("admin_email")
+        self._task = None
+        self._building: Optional[List[tuple]] = None
+        self._synced_at: Optional[datetime] = None
+        self.last_build: Optional[float] = None
+        self.build_seconds: Optional[float] = None
+
+    def add(self, organization_names: Iterable[str] = (), emails: Iterable[str] = ()) -> None:
+        organization_names, emails = tuple(organization_names), tuple(emails)
+        for name in organization_names:
+            self.organizations.add(name)
+        for email in emails:
+            self.admin_emails.add(email)
+        if self._building is not None:
+            self._building.append((organization_names, emails))
+
+    async def build(self) -> None:
+        start = time.perf_counter()
+        synced_at = datetime.utcnow()
+        organizations = db.get_master_db().organizations
+        capacity = max(settings.NAME_FILTER_MIN_CAPACITY, 2 * await organizations.estimated_document_count())
+        names = BloomFilter(capacity, settings.NAME_FILTER_ERROR_RATE)
+        emails = BloomFilter(capacity, settings.NAME_FILTER_ERROR_RATE)
+
+        # Writes made while the scan runs are replayed into the new filters.
+        self._building = []
+        try:
+            async for org in organizations.find(
+                {},
+                {"_id": 0, "organization_name": 1, "admin_email": 1},
+                batch_size=settings.ORG_LIST_BATCH_SIZE,
+            ):
+                names.add(org["organization_name"])
+                if org.get("admin_email"):
+                    emails.add(org["admin_email"])
+            for added_names, added_emails in self._building:
+                for name in added_names:
+                    names.add(name)
+                for email in added_emails:
+                    emails.add(email)
+        finally:
+            self._building = None
+
+        self.organizations.bloom = names
+        self.admin_emails.bloom = emails
+        self._synced_at = synced_at
+        self.last_build = time.time()
+        self.build_seconds = time.perf_counter() - start
+        print(f"Built name filters for {names.count} organizations in {self.build_seconds:.2f}s")
+
+    async def sync(self) -> None:
+        # Pick up organizations written by other processes since the last pass.
+        if self._synced_at is None:
+            # No filters were built, so cached misses are the only stale state.
+            self.organizations.forget_misses()
+            self.admin_emails.forget_misses()
+            return
+        synced_at = datetime.utcnow()
+        since = self._synced_at - timedelta(seconds=settings.NAME_FILTER_SYNC_SECONDS)
+        async for org in db.get_master_db().organizations.find(
+            {"updated_at": {"$gte": since}},
+            {"_id": 0, "organization_name": 1, "admin_email": 1},
+        ):
+            self.organizations.add(org["organization_name"])
+            if org.get("admin_email"):
+                self.admin_emails.add(org["admin_email"])
+        self._synced_at = synced_at
+
+    async def _loop(self) -> None:
+        next_build = time.monotonic() + settings.NAME_FILTER_REBUILD_SECONDS
+        while True:
+            await asyncio.sleep(settings.NAME_FILTER_SYNC_SECONDS)
+            try:
+                if time.monotonic() >= next_build:
+                    await self.build()
+                    next_build = time.monotonic() + settings.NAME_FILTER_REBUILD_SECONDS
+                else:
+                    await self.sync()
+            except Exception as e:
+                print(f"Name filter refresh failed: {e}")
+
+    async def start(self) -> None:
+        if not settings.NAME_FILTER_ENABLED:
+            return
+        try:
+            await self.build()
+        except Exception as e:
+            print(f"Name filter build failed, falling back to database lookups: {e}")
+            return
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict:
+        return {
+            "enabled": self.organizations.bloom is not None,
+            "last_build": self.last_build,
+            "build_seconds": self.build_seconds,
+            "organizations": self.organizations.stats(),
+            "admin_emails": self.admin_emails.stats(),
+        }
+
+
+name_index = NameIndex()
@@ -1,104 +1,440 @@
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Callable, AsyncIterator
 from datetime import datetime
+import asyncio
+from bson import ObjectId
+from pymongo import ASCENDING
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 from ..database import db
 from ..utils.password_handler import PasswordHandler
+from ..utils.cache import TTLCache
+from ..utils.pagination import decode_page_token, encode_page_token
+from .job_service import JobService
+from .migration_service import MigrationService
+from .name_index import name_index
+from .placement_service import PlacementService
+from .session_service import SessionService
+from ..config import get_settings
 import re
 
+settings = get_settings()
+
+LISTABLE_FIELDS = ["organization_name", "collection_name", "shard", "admin_email", "created_at", "updated_at"]
+VIEW_FIELDS = ["organization_name", "collection_name", "admin_email", "created_at", "updated_at"]
+
 
 class OrganizationService:
+    _org_cache = TTLCache(
+        max_size=settings.ORG_CACHE_MAX_SIZE,
+        ttl_seconds=settings.ORG_CACHE_TTL_SECONDS,
+    )
+    _collection_cache = TTLCache(
+        max_size=settings.TENANT_HANDLE_CACHE_SIZE,
+        ttl_seconds=settings.ORG_CACHE_TTL_SECONDS,
+    )
+    _view_cache = TTLCache(
+        max_size=settings.ORG_CACHE_MAX_SIZE,
+        ttl_seconds=settings.ORG_CACHE_TTL_SECONDS,
+    )
+
     @staticmethod
     def _generate_collection_name(org_name: str) -> str:
         clean_name = re.sub(r"[^a-zA-Z0-9]", "_", org_name.lower())
         return f"org_{clean_name}"
 
-    @staticmethod
-    async def organization_exists(organization_name: str) -> bool:
+    @classmethod
+    def cache_stats(cls) -> Dict[str, int]:
+        return cls._org_cache.stats()
+
+    @classmethod
+    def _invalidate_organization(cls, *organization_names: str) -> None:
+        cls._org_cache.invalidate(*organization_names)
+        cls._collection_cache.invalidate(*organization_names)
+        cls._view_cache.invalidate(*organization_names)
+
+    @classmethod
+    def clear_caches(cls) -> None:
+        cls._org_cache.clear()
+        cls._collection_cache.clear()
+        cls._view_cache.clear()
+
+    @classmethod
+    async def organization_exists(cls, organization_name: str) -> bool:
+        if cls._org_cache.get(organization_name) is not None:
+            return True
+        if not name_index.organizations.might_exist(organization_name):
+            return False
+
         master_db = db.get_master_db()
-        org = await master_db.organizations.find_one({"organization_name": organization_name})
+        org = await master_db.organizations.find_one(
+            {"organization_name": organization_name},
+            {"_id": 0, "organization_name": 1},
+        )
+        name_index.organizations.record_lookup(organization_name, org is not None)
         return org is not None
 
+    @staticmethod
+    async def collection_name_taken(collection_name: str) -> bool:
+        # A deleted tenant's collection keeps its name until the drop job removes it;
+        # reusing it earlier would expose the old data and lose the new tenant's.
+        master_db = db.get_master_db()
+        org, pending_drops = await asyncio.gather(
+            master_db.organizations.find_one(
+                {"$or": [{"collection_name": collection_name}, {"migrating_from": collection_name}]},
+                {"_id": 1},
+            ),
+            JobService.pending_drops([collection_name]),
+        )
+        return org is not None or bool(pending_drops)
+
     @staticmethod
     async def admin_exists(email: str) -> bool:
+        if not name_index.admin_emails.might_exist(email):
+            return False
+
+        master_db = db.get_master_db()
+        admin = await master_db.admins.find_one({"email": email}, {"_id": 0, "email": 1})
+        name_index.admin_emails.record_lookup(email, admin is not None)
+        return admin is not None
+
+    @staticmethod
+    async def admin_belongs_to(email: str, organization_name: str) -> bool:
         master_db = db.get_master_db()
-        admin = await master_db.admins.find_one({"email": email})
+        admin = await master_db.admins.find_one(
+            {"email": email, "organization_name": organization_name},
+            {"_id": 0, "email": 1},
+        )
         return admin is not None
 
     @classmethod
     async def create_organization(cls, organization_name: str, email: str, password: str) -> Dict:
-        if await cls.organization_exists(organization_name):
+        collection_name = cls._generate_collection_name(organization_name)
+        org_taken, collection_taken, admin_taken = await asyncio.gather(
+            cls.organization_exists(organization_name),
+            cls.collection_name_taken(collection_name),
+            cls.admin_exists(email),
+        )
+        if org_taken or collection_taken:
             raise ValueError("Organization already exists")
 
-        if await cls.admin_exists(email):
+        if admin_taken:
             raise ValueError("Admin email already registered")
 
         master_db = db.get_master_db()
-        collection_name = cls._generate_collection_name(organization_name)
-        hashed_password = PasswordHandler.hash_password(password)
+        hashed_password, shard = await asyncio.gather(
+            PasswordHandler.hash_password_async(password),
+            PlacementService.assign_shard(collection_name),
+        )
 
+        # IDs are generated client-side so the three inserts can be issued together.
+        org_id = ObjectId()
+        now = datetime.utcnow()
         org_data = {
+            "_id": org_id,
             "organization_name": organization_name,
             "collection_name": collection_name,
+            "shard": shard,
             "admin_email": email,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow(),
+            "created_at": now,
+            "updated_at": now,
         }
-
-        org_result = await master_db.organizations.insert_one(org_data)
-        org_id = str(org_result.inserted_id)
-
         admin_data = {
+            "_id": ObjectId(),
             "email": email,
             "hashed_password": hashed_password,
             "organization_name": organization_name,
-            "organization_id": org_id,
-            "created_at": datetime.utcnow(),
+            "organization_id": str(org_id),
+            "created_at": now,
             "is_active": True,
         }
-
-        await master_db.admins.insert_one(admin_data)
-
-        org_collection = db.get_org_collection(collection_name)
-        await org_collection.insert_one({
+        metadata = {
+            "_id": ObjectId(),
             "type": "metadata",
             "organization_name": organization_name,
-            "initialized_at": datetime.utcnow(),
+            "initialized_at": now,
             "description": "Organization data collection",
-        })
+        }
+
+        org_collection = db.get_org_collection(collection_name, shard)
+        writes = [
+            (master_db.organizations, org_data, "Organization already exists"),
+            (master_db.admins, admin_data, "Admin email already registered"),
+            (org_collection, metadata, None),
+        ]
+        results = await asyncio.gather(
+            *(collection.insert_one(document) for collection, document, _ in writes),
+            return_exceptions=True,
+        )
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            await asyncio.gather(*(
+                collection.delete_one({"_id": document["_id"]})
+                for (collection, document, _), result in zip(writes, results)
+                if not isinstance(result, Exception)
+            ), return_exceptions=True)
+            for (_, _, duplicate_message), result in zip(writes, results):
+                if duplicate_message and isinstance(result, DuplicateKeyError):
+                    raise ValueError(duplicate_message)
+            raise errors[0]
 
-        org_data["_id"] = org_id
+        org_data["_id"] = str(org_id)
+        cls._invalidate_organization(organization_name)
+        name_index.add([organization_name], [email])
         return org_data
 
     @staticmethod
-    async def get_organization(organization_name: str) -> Optional[Dict]:
+    async def _insert_many_unordered(collection, documents: List[Dict]) -> Dict[int, str]:
+        if not documents:
+            return {}
+        try:
+            await collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            return {error["index"]: error.get("errmsg", "Write failed") for error in e.details.get("writeErrors", [])}
+        return {}
+
+    @classmethod
+    async def bulk_create_organizations(cls, items: List[Dict]) -> AsyncIterator[Dict]:
+        master_db = db.get_master_db()
+        for index, item in enumerate(items):
+            item["index"] = index
+            item["collection_name"] = cls._generate_collection_name(item["organization_name"])
+
+        names = [item["organization_name"] for item in items]
+        collection_names = [item["collection_name"] for item in items]
+        emails = [item["email"] for item in items]
+
+        taken_names, taken_collections, taken_emails = set(), set(), set()
+        async for org in master_db.organizations.find(
+            {"$or": [
+                {"organization_name": {"$in": names}},
+                {"collection_name": {"$in": collection_names}},
+                {"migrating_from": {"$in": collection_names}},
+            ]},
+            {"_id": 0, "organization_name": 1, "collection_name": 1, "migrating_from": 1},
+        ):
+            taken_names.add(org["organization_name"])
+            taken_collections.add(org["collection_name"])
+            taken_collections.add(org.get("migrating_from"))
+        taken_collections |= await JobService.pending_drops(collection_names)
+        async for admin in master_db.admins.find({"email": {"$in": emails}}, {"_id": 0, "email": 1}):
+            taken_emails.add(admin["email"])
+
+        accepted = []
+        for item in items:
+            if item["organization_name"] in taken_names or item["collection_name"] in taken_collections:
+                error = "Organization already exists"
+            elif item["email"] in taken_emails:
+                error = "Admin email already registered"
+            else:
+                error = None
+
+            if error:
+                yield {"index": item["index"], "organization_name": item["organization_name"], "status": "error", "detail": error}
+                continue
+
+            taken_names.add(item["organization_name"])
+            taken_collections.add(item["collection_name"])
+            taken_emails.add(item["email"])
+            accepted.append(item)
+
+        chunk_size = max(1, settings.BULK_CREATE_CHUNK_SIZE)
+        for start in range(0, len(accepted), chunk_size):
+            async for result in cls._bulk_create_chunk(accepted[start:start + chunk_size]):
+                yield result
+
+    @classmethod
+    async def _bulk_create_chunk(cls, chunk: List[Dict]) -> AsyncIterator[Dict]:
+        master_db = db.get_master_db()
+        hashes = await asyncio.gather(
+            *(PasswordHandler.hash_password_async(item["password"]) for item in chunk),
+            return_exceptions=True,
+        )
+
+        failures: Dict[int, str] = {}
+        pending = []
+        for item, hashed_password in zip(chunk, hashes):
+            if isinstance(hashed_password, Exception):
+                failures[item["index"]] = str(hashed_password)
+            else:
+                item["hashed_password"] = hashed_password
+                pending.append(item)
+
+        shards = await PlacementService.assign_shards([item["collection_name"] for item in pending])
+        now = datetime.utcnow()
+        org_docs = [{
+            "organization_name": item["organization_name"],
+            "collection_name": item["collection_name"],
+            "shard": shard,
+            "admin_email": item["email"],
+            "created_at": now,
+            "updated_at": now,
+        } for item, shard in zip(pending, shards)]
+        org_errors = await cls._insert_many_unordered(master_db.organizations, org_docs)
+
+        created = []
+        for position, (item, org_doc) in enumerate(zip(pending, org_docs)):
+            if position in org_errors:
+                failures[item["index"]] = "Organization already exists"
+            else:
+                item["org_doc"] = org_doc
+                created.append(item)
+
+        admin_docs = [{
+            "email": item["email"],
+            "hashed_password": item["hashed_password"],
+            "organization_name": item["organization_name"],
+            "organization_id": str(item["org_doc"]["_id"]),
+            "created_at": now,
+            "is_active": True,
+        } for item in created]
+        admin_errors = await cls._insert_many_unordered(master_db.admins, admin_docs)
+        for item, admin_doc in zip(created, admin_docs):
+            item["admin_id"] = admin_doc["_id"]
+
+        if admin_errors:
+            orphaned = [created[position]["org_doc"]["_id"] for position in admin_errors]
+            await master_db.organizations.delete_many({"_id": {"$in": orphaned}})
+            for position in admin_errors:
+                failures[created[position]["index"]] = "Admin email already registered"
+            created = [item for position, item in enumerate(created) if position not in admin_errors]
+
+        metadata_results = await asyncio.gather(*(
+            db.get_org_collection(item["collection_name"], item["org_doc"]["shard"]).insert_one({
+                "type": "metadata",
+                "organization_name": item["organization_name"],
+                "initialized_at": now,
+                "description": "Organization data collection",
+            })
+            for item in created
+        ), return_exceptions=True)
+
+        # As in create_organization, a tenant whose collection could not be
+        # initialized is rolled back and reported on its own.
+        metadata_errors = {
+            position: result for position, result in enumerate(metadata_results) if isinstance(result, Exception)
+        }
+        if metadata_errors:
+            failed = [created[position] for position in metadata_errors]
+            await asyncio.gather(
+                master_db.organizations.delete_many({"_id": {"$in": [item["org_doc"]["_id"] for item in failed]}}),
+                master_db.admins.delete_many({"_id": {"$in": [item["admin_id"] for item in failed]}}),
+                return_exceptions=True,
+            )
+            for position, error in metadata_errors.items():
+                failures[created[position]["index"]] = str(error)
+            created = [item for position, item in enumerate(created) if position not in metadata_errors]
+
+        cls._invalidate_organization(*(item["organization_name"] for item in created))
+        name_index.add((item["organization_name"] for item in created), (item["email"] for item in created))
+
+        created_by_index = {item["index"]: item for item in created}
+        for item in chunk:
+            if item["index"] in created_by_index:
+                yield {
+                    "index": item["index"],
+                    "organization_name": item["organization_name"],
+                    "status": "created",
+                    "collection_name": item["collection_name"],
+                    "admin_email": item["email"],
+                    "created_at": now,
+                }
+            else:
+                yield {
+                    "index": item["index"],
+                    "organization_name": item["organization_name"],
+                    "status": "error",
+                    "detail": failures.get(item["index"], "Organization was not created"),
+                }
+
+    @classmethod
+    async def get_organization(cls, organization_name: str) -> Optional[Dict]:
+        cached = cls._org_cache.get(organization_name)
+        if cached is not None:
+            return dict(cached)
+
         master_db = db.get_master_db()
         org = await master_db.organizations.find_one({"organization_name": organization_name})
         if org:
             org["_id"] = str(org["_id"])
+            cls._org_cache.set(organization_name, dict(org))
+        return org
+
+    @classmethod
+    async def get_organization_view(cls, organization_name: str) -> Optional[Dict]:
+        # Public fields only, read with a matching projection. The cached dict is
+        # shared between requests and must not be modified.
+        cached = cls._view_cache.get(organization_name)
+        if cached is not None:
+            return cached
+        if not name_index.organizations.might_exist(organization_name):
+            return None
+
+        master_db = db.get_master_db()
+        org = await master_db.organizations.find_one(
+            {"organization_name": organization_name},
+            {"_id": 0, **{field: 1 for field in VIEW_FIELDS}},
+        )
+        name_index.organizations.record_lookup(organization_name, org is not None)
+        if org:
+            cls._view_cache.set(organization_name, org)
         return org
 
     @classmethod
-    async def update_organization(cls, old_org_name: str, new_org_name: str, email: str, password: str, admin_email: str) -> Dict:
+    async def get_tenant_collection(cls, organization_name: str, organization_id: str):
+        # The name comes from a token that may predate a rename or delete; the
+        # organization now holding that name is only used if its _id matches.
+        cached = cls._collection_cache.get(organization_name)
+        if cached is not None:
+            cached_id, collection = cached
+            return collection if cached_id == organization_id else None
+
+        org = await cls.get_organization(organization_name)
+        if not org or str(org["_id"]) != organization_id:
+            return None
+        if org.get("migrating_from") or org.get("moving_to_shard"):
+            raise ValueError("Organization data is being migrated, retry shortly")
+
+        collection = db.get_org_collection(org["collection_name"], org.get("shard"))
+        cls._collection_cache.set(organization_name, (organization_id, collection))
+        return collection
+
+    @classmethod
+    async def update_organization(
+        cls,
+        old_org_name: str,
+        new_org_name: str,
+        email: str,
+        password: str,
+        admin_email: str,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        keep_session_id: Optional[str] = None,
+    ) -> Dict:
         master_db = db.get_master_db()
-        old_org = await master_db.organizations.find_one({"organization_name": old_org_name})
+        new_collection_name = cls._generate_collection_name(new_org_name)
+        old_org, is_admin, name_taken, collection_taken = await asyncio.gather(
+            cls.get_organization(old_org_name),
+            cls.admin_belongs_to(admin_email, old_org_name),
+            cls.organization_exists(new_org_name),
+            cls.collection_name_taken(new_collection_name),
+        )
         if not old_org:
             raise ValueError("Organization not found")
 
-        admin = await master_db.admins.find_one({"email": admin_email, "organization_name": old_org_name})
-        if not admin:
+        if not is_admin:
             raise ValueError("Unauthorized: Admin does not belong to this organization")
 
-        if old_org_name != new_org_name and await cls.organization_exists(new_org_name):
+        if old_org.get("migrating_from") or old_org.get("moving_to_shard"):
+            raise ValueError("Organization data is being migrated, retry shortly")
+
+        if old_org_name != new_org_name and name_taken:
             raise ValueError("New organization name already exists")
 
-        new_collection_name = cls._generate_collection_name(new_org_name)
         old_collection_name = old_org["collection_name"]
+        collection_moves = new_collection_name != old_collection_name
+        if collection_moves and collection_taken:
+            raise ValueError("New organization name already exists")
 
-        old_collection = db.get_org_collection(old_collection_name)
-        documents = await old_collection.find().to_list(length=None)
-
-        if documents:
-            new_collection = db.get_org_collection(new_collection_name)
-            await new_collection.insert_many(documents)
+        hashed_password = await PasswordHandler.hash_password_async(password)
 
         updated_data = {
             "organization_name": new_org_name,
@@ -106,51 +442,329 @@ class OrganizationService:
             "admin_email": email,
             "updated_at": datetime.utcnow(),
         }
+        org_update = {"$set": dict(updated_data)}
+        if old_org_name != new_org_name:
+            # Lets other processes evict the old name from their caches.
+            org_update["$set"]["renamed_from"] = old_org_name
+        if collection_moves:
+            # Recorded in the same transaction so the reconciler can finish an interrupted move.
+            org_update["$set"]["migrating_from"] = old_collection_name
 
-        await master_db.organizations.update_one(
-            {"organization_name": old_org_name},
-            {"$set": updated_data},
-        )
+        # The admin follows the organization, so it is only moved once the rename
+        # has matched. Without a transaction a failed admin write undoes the rename.
+        restored_fields = ("organization_name", "collection_name", "admin_email", "updated_at")
+        restore = {"$set": {field: old_org[field] for field in restored_fields}, "$unset": {"migrating_from": ""}}
+        if old_org.get("renamed_from"):
+            restore["$set"]["renamed_from"] = old_org["renamed_from"]
+        else:
+            restore["$unset"]["renamed_from"] = ""
 
-        hashed_password = PasswordHandler.hash_password(password)
-        await master_db.admins.update_one(
-            {"email": admin_email},
-            {"$set": {
-                "email": email,
-                "hashed_password": hashed_password,
+        async def rename_organization(session):
+            result = await master_db.organizations.update_one(
+                {"_id": ObjectId(old_org["_id"]), "organization_name": old_org_name},
+                org_update,
+                session=session,
+            )
+            if result.matched_count != 1:
+                raise ValueError("Organization not found")
+            return result
+
+        async def move_admin(session):
+            try:
+                result = await master_db.admins.update_one(
+                    {"email": admin_email, "organization_name": old_org_name},
+                    {"$set": {
+                        "email": email,
+                        "hashed_password": hashed_password,
+                        "organization_name": new_org_name,
+                    }},
+                    session=session,
+                )
+                if result.matched_count != 1:
+                    raise ValueError("Unauthorized: Admin does not belong to this organization")
+                return result
+            except (PyMongoError, ValueError):
+                if session is None:
+                    await master_db.organizations.update_one({"_id": ObjectId(old_org["_id"])}, restore)
+                raise
+
+        writes = [rename_organization, move_admin]
+        job = None
+        if collection_moves and settings.JOBS_ENABLED:
+            job = JobService.build("move_collection", old_org["_id"], new_org_name, {
                 "organization_name": new_org_name,
-            }},
-        )
+                "old_collection_name": old_collection_name,
+                "new_collection_name": new_collection_name,
+                "shard": old_org.get("shard"),
+            })
+            writes.append(JobService.insert(job))
 
-        if old_org_name != new_org_name:
-            await old_collection.drop()
+        try:
+            await db.run_in_transaction(*writes)
+        except DuplicateKeyError as e:
+            # Taken by a concurrent request after the checks above.
+            if "email" in (e.details or {}).get("keyPattern", {}):
+                raise ValueError("Admin email already registered")
+            raise ValueError("New organization name already exists")
+        cls._invalidate_organization(old_org_name, new_org_name)
+        name_index.add([new_org_name], [email])
+        # The credentials changed, so only the session that changed them stays signed in.
+        await SessionService.revoke_organization_sessions(str(old_org["_id"]), keep_session_id)
+
+        if job:
+            JobService.wakeup.set()
+            updated_data["job_id"] = str(job["_id"])
+        elif collection_moves:
+            await cls.complete_collection_move(
+                new_org_name,
+                old_collection_name,
+                new_collection_name,
+                progress_callback,
+                shard=old_org.get("shard"),
+            )
 
         updated_data["created_at"] = old_org["created_at"]
         return updated_data
 
     @staticmethod
-    async def delete_organization(organization_name: str, admin_email: str) -> bool:
+    async def complete_collection_move(
+        organization_name: str,
+        old_collection_name: str,
+        new_collection_name: str,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        shard: Optional[str] = None,
+    ) -> None:
+        await MigrationService.move_collection(
+            db.get_org_collection(old_collection_name, shard),
+            db.get_org_collection(new_collection_name, shard),
+            progress_callback=progress_callback,
+        )
+        await db.get_master_db().organizations.update_one(
+            {"organization_name": organization_name, "migrating_from": old_collection_name},
+            {"$unset": {"migrating_from": ""}},
+        )
+
+    @classmethod
+    async def delete_organization(
+        cls,
+        organization_name: str,
+        admin_email: str,
+        keep_session_id: Optional[str] = None,
+    ) -> Dict:
         master_db = db.get_master_db()
-        org = await master_db.organizations.find_one({"organization_name": organization_name})
+        org, is_admin = await asyncio.gather(
+            cls.get_organization(organization_name),
+            cls.admin_belongs_to(admin_email, organization_name),
+        )
         if not org:
             raise ValueError("Organization not found")
 
-        admin = await master_db.admins.find_one({"email": admin_email, "organization_name": organization_name})
-        if not admin:
+        if not is_admin:
             raise ValueError("Unauthorized: Admin does not belong to this organization")
 
-        collection_name = org["collection_name"]
-        org_collection = db.get_org_collection(collection_name)
-        await org_collection.drop()
+        # Collections cannot be dropped inside a transaction; if the drop is
+        # interrupted, the reconciler removes the unreferenced collection later.
+        collection_names = [name for name in (org["collection_name"], org.get("migrating_from")) if name]
+        async def delete_organization_record(session):
+            result = await master_db.organizations.delete_one(
+                {"_id": ObjectId(org["_id"]), "organization_name": organization_name},
+                session=session,
+            )
+            if result.deleted_count != 1:
+                raise LookupError("Organization not found")
+            return result
 
-        await master_db.admins.delete_many({"organization_name": organization_name})
-        result = await master_db.organizations.delete_one({"organization_name": organization_name})
-        return result.deleted_count > 0
+        # The admins are only removed once the organization itself was deleted.
+        writes = [
+            delete_organization_record,
+            lambda session: master_db.admins.delete_many({"organization_name": organization_name}, session=session),
+        ]
+        job = None
+        if settings.JOBS_ENABLED:
+            job = JobService.build("drop_collections", org["_id"], organization_name, {
+                "collection_names": collection_names,
+                "shard": org.get("shard"),
+            })
+            writes.append(JobService.insert(job))
+
+        try:
+            await db.run_in_transaction(*writes)
+        except LookupError:
+            # Deleted or renamed by another request since it was read.
+            cls._invalidate_organization(organization_name)
+            return {"deleted": False, "job_id": None}
+        cls._invalidate_organization(organization_name)
+        # The caller's access token stays valid so it can follow the drop job; it
+        # cannot be refreshed because the admin no longer exists.
+        await SessionService.revoke_organization_sessions(str(org["_id"]), keep_session_id)
+
+        if job:
+            JobService.wakeup.set()
+        else:
+            for collection_name in collection_names:
+                await db.get_org_collection(collection_name, org.get("shard")).drop()
+        return {"deleted": True, "job_id": str(job["_id"]) if job else None}
+
+    @classmethod
+    async def move_to_shard(
+        cls,
+        organization_name: str,
+        target_shard: str,
+        settle_seconds: Optional[float] = None,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> int:
+        if target_shard not in db.shard_names():
+            raise ValueError(f"Unknown shard '{target_shard}'")
+
+        organizations = db.get_master_db().organizations
+        claimed = await organizations.find_one_and_update(
+            {"organization_name": organization_name, "moving_to_shard": {"$exists": False}},
+            {"$set": {"moving_to_shard": target_shard, "moving_since": datetime.utcnow()}},
+            projection={"_id": 1},
+        )
+        if not claimed:
+            raise ValueError("Organization not found or already being moved")
+        # Keyed by _id so a rename while the move waits does not lose the marker.
+        marker = {"_id": claimed["_id"], "moving_to_shard": target_shard}
+        cls._invalidate_organization(organization_name)
+
+        async def release():
+            await organizations.update_one(marker, {"$unset": {"moving_to_shard": "", "moving_since": ""}})
+            cls._invalidate_organization(organization_name)
+
+        # Other processes keep serving their cached collection handle until it
+        # expires; waiting it out means nothing writes to the source during the copy.
+        await asyncio.sleep(settings.ORG_CACHE_TTL_SECONDS if settle_seconds is None else settle_seconds)
+
+        org = await organizations.find_one(
+            marker,
+            {"_id": 0, "organization_name": 1, "collection_name": 1, "shard": 1, "migrating_from": 1},
+        )
+        if not org:
+            raise ValueError("Organization was deleted before the move started")
+        organization_name = org["organization_name"]
+        if org.get("migrating_from"):
+            await release()
+            raise ValueError("Organization data is being migrated, retry shortly")
+
+        source_shard = PlacementService.shard_of(org)
+        if db.shard_location(source_shard) == db.shard_location(target_shard):
+            await organizations.update_one(marker, {
+                "$set": {"shard": target_shard},
+                "$unset": {"moving_to_shard": "", "moving_since": ""},
+            })
+            cls._invalidate_organization(organization_name)
+            return 0
+
+        source = db.get_org_collection(org["collection_name"], source_shard)
+        target = db.get_org_collection(org["collection_name"], target_shard)
+
+        async def heartbeat():
+            # Keeps the reconciler from treating a long copy as abandoned.
+            while True:
+                await asyncio.sleep(settings.RECONCILE_GRACE_SECONDS / 4)
+                await organizations.update_one(marker, {"$set": {"moving_since": datetime.utcnow()}})
+
+        heartbeat_task = asyncio.create_task(heartbeat())
+        try:
+            # Leftovers of an abandoned attempt would collide on _id.
+            await target.drop()
+            copied = await MigrationService.copy_collection(source, target, progress_callback=progress_callback)
+        except Exception:
+            await release()
+            raise
+        finally:
+            heartbeat_task.cancel()
+
+        switched = await organizations.update_one(marker, {
+            "$set": {"shard": target_shard, "updated_at": datetime.utcnow()},
+            "$unset": {"moving_to_shard": "", "moving_since": ""},
+        })
+        cls._invalidate_organization(organization_name)
+        if not switched.matched_count:
+            await target.drop()
+            raise ValueError("Organization was deleted during the move")
+
+        await source.drop()
+        return copied
+
+    @classmethod
+    def _list_query(
+        cls,
+        page_token: Optional[str],
+        created_after: Optional[datetime],
+        created_before: Optional[datetime],
+        admin_email: Optional[str],
+    ) -> Dict:
+        query: Dict = {}
+        if page_token:
+            query["_id"] = {"$gt": decode_page_token(page_token)}
+        if admin_email:
+            query["admin_email"] = admin_email
+        if created_after or created_before:
+            query["created_at"] = {}
+            if created_after:
+                query["created_at"]["$gte"] = created_after
+            if created_before:
+                query["created_at"]["$lt"] = created_before
+        return query
 
     @staticmethod
-    async def list_all_organizations() -> List[Dict]:
+    def _list_projection(fields: Optional[List[str]]) -> Dict:
+        fields = fields or LISTABLE_FIELDS
+        unknown = set(fields) - set(LISTABLE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        return {field: 1 for field in fields}
+
+    @classmethod
+    async def list_organizations(
+        cls,
+        limit: int = 100,
+        page_token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        admin_email: Optional[str] = None,
+    ) -> Dict:
         master_db = db.get_master_db()
-        orgs = await master_db.organizations.find().to_list(length=100)
+        query = cls._list_query(page_token, created_after, created_before, admin_email)
+        cursor = (
+            master_db.organizations.find(query, cls._list_projection(fields))
+            .sort("_id", ASCENDING)
+            .limit(limit + 1)
+        )
+        orgs = await cursor.to_list(length=limit + 1)
+
+        next_page_token = None
+        if len(orgs) > limit:
+            orgs = orgs[:limit]
+            next_page_token = encode_page_token(orgs[-1]["_id"])
+
         for org in orgs:
-            org["_id"] = str(org["_id"])
-        return orgs
+            del org["_id"]
+        return {"organizations": orgs, "next_page_token": next_page_token}
+
+    @classmethod
+    def iter_organizations(
+        cls,
+        page_token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        admin_email: Optional[str] = None,
+    ) -> AsyncIterator[Dict]:
+        master_db = db.get_master_db()
+        query = cls._list_query(page_token, created_after, created_before, admin_email)
+        cursor = master_db.organizations.find(
+            query,
+            cls._list_projection(fields),
+            batch_size=settings.ORG_LIST_BATCH_SIZE,
+        ).sort("_id", ASCENDING)
+        return cls._stream_organizations(cursor)
+
+    @classmethod
+    async def _stream_organizations(cls, cursor) -> AsyncIterator[Dict]:
+        async for org in cursor:
+            org["page_token"] = encode_page_token(org.pop("_id"))
+            yield org
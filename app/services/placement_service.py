@@ -0,0 +1,130 @@
+import bisect
+import hashlib
+import math
+import time
+from typing import AsyncIterator, Dict, List, Optional
+from pymongo import ASCENDING
+from ..config import get_settings
+from ..database import db, DEFAULT_SHARD
+
+settings = get_settings()
+
+VIRTUAL_NODES = 64
+
+
+class HashRing:
+    def __init__(self, shards: List[str], virtual_nodes: int = VIRTUAL_NODES):
+        self._ring = sorted(
+            (self._hash(f"{shard}#{replica}"), shard)
+            for shard in shards
+            for replica in range(virtual_nodes)
+        )
+        self._keys = [key for key, _ in self._ring]
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return int.from_bytes(hashlib.md5(value.encode()).digest()[:8], "big")
+
+    def lookup(self, key: str) -> str:
+        index = bisect.bisect(self._keys, self._hash(key)) % len(self._keys)
+        return self._ring[index][1]
+
+
+class PlacementService:
+    _ring: Optional[HashRing] = None
+    _loads: Dict[str, int] = {}
+    _loads_refreshed: Optional[float] = None
+
+    @staticmethod
+    def shard_of(org: Dict) -> str:
+        return org.get("shard") or DEFAULT_SHARD
+
+    @classmethod
+    def ring(cls) -> HashRing:
+        if cls._ring is None:
+            cls._ring = HashRing(db.placement_shards())
+        return cls._ring
+
+    @classmethod
+    async def shard_loads(cls) -> Dict[str, int]:
+        loads = {shard: 0 for shard in db.shard_names()}
+        async for row in db.get_master_db().organizations.aggregate([
+            {"$group": {"_id": "$shard", "tenants": {"$sum": 1}}},
+        ]):
+            shard = row["_id"] or DEFAULT_SHARD
+            loads[shard] = loads.get(shard, 0) + row["tenants"]
+        return loads
+
+    @classmethod
+    async def _current_loads(cls) -> Dict[str, int]:
+        # Counted at most once per refresh interval; assignments in between are tallied locally.
+        now = time.monotonic()
+        if cls._loads_refreshed is None or now - cls._loads_refreshed >= settings.TENANT_PLACEMENT_REFRESH_SECONDS:
+            cls._loads = await cls.shard_loads()
+            cls._loads_refreshed = now
+        return cls._loads
+
+    @classmethod
+    async def assign_shards(cls, collection_names: List[str]) -> List[str]:
+        shards = db.placement_shards()
+        if len(shards) == 1:
+            return [shards[0]] * len(collection_names)
+
+        if settings.TENANT_PLACEMENT == "least_loaded":
+            loads = await cls._current_loads()
+            assigned = []
+            for _ in collection_names:
+                shard = min(shards, key=lambda name: loads.get(name, 0))
+                loads[shard] = loads.get(shard, 0) + 1
+                assigned.append(shard)
+            return assigned
+
+        ring = cls.ring()
+        return [ring.lookup(name) for name in collection_names]
+
+    @classmethod
+    async def assign_shard(cls, collection_name: str) -> str:
+        return (await cls.assign_shards([collection_name]))[0]
+
+    @classmethod
+    async def plan_rebalance(cls, limit: Optional[int] = None) -> AsyncIterator[Dict]:
+        # Yields moves that bring tenants onto their placement shard. Tenants on
+        # shards no longer used for placement (e.g. the legacy default) always move.
+        placement = db.placement_shards()
+        ring = cls.ring()
+        loads = await cls.shard_loads()
+        ideal = math.ceil(sum(loads.values()) / len(placement))
+
+        cursor = db.get_master_db().organizations.find(
+            {"migrating_from": {"$exists": False}, "moving_to_shard": {"$exists": False}},
+            {"_id": 0, "organization_name": 1, "collection_name": 1, "shard": 1},
+            batch_size=settings.ORG_LIST_BATCH_SIZE,
+        ).sort("_id", ASCENDING)
+
+        planned = 0
+        async for org in cursor:
+            if limit is not None and planned >= limit:
+                break
+
+            source = cls.shard_of(org)
+            if settings.TENANT_PLACEMENT == "least_loaded":
+                if source in placement and loads[source] <= ideal:
+                    continue
+                target = min(placement, key=lambda name: loads.get(name, 0))
+                if source in placement and loads[target] + 1 >= loads[source]:
+                    continue
+            else:
+                target = ring.lookup(org["collection_name"])
+
+            if db.shard_location(target) == db.shard_location(source):
+                continue
+
+            loads[source] -= 1
+            loads[target] = loads.get(target, 0) + 1
+            planned += 1
+            yield {
+                "organization_name": org["organization_name"],
+                "collection_name": org["collection_name"],
+                "from": source,
+                "to": target,
+            }
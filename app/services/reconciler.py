@@ -0,0 +1,156 @@
+import asyncio
+import heapq
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+from ..config import get_settings
+from ..database import db
+from .job_service import JobService
+from .organization_service import OrganizationService
+from .placement_service import PlacementService
+
+settings = get_settings()
+
+
+# Each pass checks one batch of org_* collection names per shard database,
+# resuming after the last name it saw, and resolves ownership with indexed $in
+# lookups on organizations. A collection is dropped only after it has stayed
+# unreferenced for RECONCILE_GRACE_SECONDS, so collections of in-flight creates
+# are left alone.
+class TenantReconciler:
+    def __init__(self):
+        self._task = None
+        self._resume_after: Dict[str, str] = {}
+        self._orphan_candidates: Dict[Tuple[str, str], float] = {}
+        self.orphans_dropped = 0
+        self.moves_completed = 0
+        self.shard_moves_abandoned = 0
+        self.last_run = None
+
+    async def _tenant_collection_batch(self, shard: str) -> List[str]:
+        # A filter on name alone is sent with nameOnly, so the server skips
+        # collection metadata and only returns names past the resume point.
+        resume_after = self._resume_after.get(shard, "")
+        names = await db.get_shard_db(shard).list_collection_names(
+            filter={"name": {"$gt": resume_after, "$regex": "^org_"}}
+        )
+        batch = heapq.nsmallest(settings.RECONCILE_BATCH_SIZE, names)
+        self._resume_after[shard] = batch[-1] if len(batch) == settings.RECONCILE_BATCH_SIZE else ""
+        return batch
+
+    async def complete_interrupted_moves(self) -> None:
+        master_db = db.get_master_db()
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.RECONCILE_GRACE_SECONDS)
+        cursor = master_db.organizations.find(
+            {"migrating_from": {"$exists": True}, "updated_at": {"$lt": cutoff}},
+            {"_id": 1, "organization_name": 1, "collection_name": 1, "migrating_from": 1, "shard": 1},
+        ).limit(settings.RECONCILE_BATCH_SIZE)
+
+        async for org in cursor:
+            # Moves still owned by a queued or running job are left to the job worker.
+            if await JobService.has_active_job(str(org["_id"])):
+                continue
+            await OrganizationService.complete_collection_move(
+                org["organization_name"],
+                org["migrating_from"],
+                org["collection_name"],
+                shard=org.get("shard"),
+            )
+            self.moves_completed += 1
+            print(f"Reconciler completed move {org['migrating_from']} -> {org['collection_name']}")
+
+    async def abandon_interrupted_shard_moves(self) -> None:
+        # A shard move whose heartbeat stopped is rolled back; the partial copy on
+        # the target shard is then unreferenced and dropped as an orphan.
+        master_db = db.get_master_db()
+        cutoff = datetime.utcnow() - timedelta(seconds=settings.RECONCILE_GRACE_SECONDS)
+        cursor = master_db.organizations.find(
+            {"moving_to_shard": {"$exists": True}, "moving_since": {"$lt": cutoff}},
+            {"_id": 1, "organization_name": 1, "moving_to_shard": 1, "moving_since": 1},
+        ).limit(settings.RECONCILE_BATCH_SIZE)
+
+        async for org in cursor:
+            result = await master_db.organizations.update_one(
+                {"_id": org["_id"], "moving_since": org["moving_since"]},
+                {"$unset": {"moving_to_shard": "", "moving_since": ""}},
+            )
+            if result.modified_count:
+                OrganizationService._invalidate_organization(org["organization_name"])
+                self.shard_moves_abandoned += 1
+                print(f"Reconciler abandoned move of {org['organization_name']} to shard {org['moving_to_shard']}")
+
+    async def drop_orphaned_collections(self) -> None:
+        # Shard names are aliases, so each physical database is scanned once.
+        locations = {}
+        for shard in db.shard_names():
+            locations.setdefault(db.shard_location(shard), shard)
+        for location, shard in locations.items():
+            await self._drop_orphans_on(shard, location)
+
+    async def _drop_orphans_on(self, shard: str, location) -> None:
+        batch = await self._tenant_collection_batch(shard)
+        if not batch:
+            return
+
+        master_db = db.get_master_db()
+        referenced = set()
+        async for org in master_db.organizations.find(
+            {"$or": [{"collection_name": {"$in": batch}}, {"migrating_from": {"$in": batch}}]},
+            {"_id": 0, "collection_name": 1, "migrating_from": 1, "shard": 1, "moving_to_shard": 1},
+        ):
+            org_locations = {db.shard_location(PlacementService.shard_of(org))}
+            if org.get("moving_to_shard"):
+                org_locations.add(db.shard_location(org["moving_to_shard"]))
+            if location in org_locations:
+                referenced.add(org["collection_name"])
+                referenced.add(org.get("migrating_from"))
+
+        now = time.monotonic()
+        for name in batch:
+            key = (shard, name)
+            if name in referenced:
+                self._orphan_candidates.pop(key, None)
+                continue
+
+            first_seen = self._orphan_candidates.setdefault(key, now)
+            if now - first_seen >= settings.RECONCILE_GRACE_SECONDS:
+                await db.get_org_collection(name, shard).drop()
+                del self._orphan_candidates[key]
+                self.orphans_dropped += 1
+                print(f"Reconciler dropped orphaned collection {name} on shard {shard}")
+
+    async def run_once(self) -> None:
+        await self.complete_interrupted_moves()
+        await self.abandon_interrupted_shard_moves()
+        await self.drop_orphaned_collections()
+        self.last_run = time.time()
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.RECONCILE_INTERVAL_SECONDS)
+            try:
+                await self.run_once()
+            except Exception as e:
+                print(f"Reconciler pass failed: {e}")
+
+    def start(self) -> None:
+        if settings.RECONCILE_ENABLED:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict:
+        return {
+            "last_run": self.last_run,
+            "orphan_candidates": len(self._orphan_candidates),
+            "orphans_dropped": self.orphans_dropped,
+            "moves_completed": self.moves_completed,
+            "shard_moves_abandoned": self.shard_moves_abandoned,
+        }
+
+
+reconciler = TenantReconciler()
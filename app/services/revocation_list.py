@@ -0,0 +1,95 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+from ..config import get_settings
+from ..database import db
+
+settings = get_settings()
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def _epoch_seconds(moment: datetime) -> float:
+    # Stored datetimes are naive UTC; datetime.timestamp() would read them as local time.
+    return (moment - EPOCH).total_seconds()
+
+
+# Revoked session ids, mirrored from the revoked_sessions collection. An entry
+# only has to outlive the access tokens issued for its session, so documents
+# expire through a TTL index ACCESS_TOKEN_EXPIRE_MINUTES after revocation and
+# the in-memory set stays small. Revocations made by another process are picked
+# up by the revoked_at sync every REVOCATION_SYNC_SECONDS.
+class RevocationList:
+    def __init__(self):
+        self._revoked: Dict[str, float] = {}
+        self._synced_at: Optional[datetime] = None
+        self._task = None
+        self.rejections = 0
+        self.last_sync: Optional[float] = None
+
+    @staticmethod
+    def _collection():
+        return db.get_master_db().revoked_sessions
+
+    def add(self, session_ids: Iterable[str], expires_at: datetime) -> None:
+        expires = _epoch_seconds(expires_at)
+        for session_id in session_ids:
+            self._revoked[session_id] = expires
+
+    def is_revoked(self, session_id: str) -> bool:
+        expires = self._revoked.get(session_id)
+        if expires is None:
+            return False
+        if expires < time.time():
+            self._revoked.pop(session_id, None)
+            return False
+        self.rejections += 1
+        return True
+
+    def prune(self) -> None:
+        now = time.time()
+        for session_id in [sid for sid, expires in self._revoked.items() if expires < now]:
+            del self._revoked[session_id]
+
+    async def sync(self) -> None:
+        synced_at = datetime.utcnow()
+        query = {"expires_at": {"$gt": synced_at}}
+        if self._synced_at is not None:
+            query["revoked_at"] = {"$gte": self._synced_at - timedelta(seconds=settings.REVOCATION_SYNC_SECONDS)}
+        async for entry in self._collection().find(query, {"expires_at": 1}):
+            self._revoked[entry["_id"]] = _epoch_seconds(entry["expires_at"])
+        self._synced_at = synced_at
+        self.last_sync = time.time()
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.REVOCATION_SYNC_SECONDS)
+            try:
+                await self.sync()
+                self.prune()
+            except Exception as e:
+                print(f"Revocation list sync failed: {e}")
+
+    async def start(self) -> None:
+        try:
+            await self.sync()
+        except Exception as e:
+            print(f"Revocation list load failed, retrying in the background: {e}")
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> Dict:
+        return {
+            "revoked_sessions": len(self._revoked),
+            "rejections": self.rejections,
+            "last_sync": self.last_sync,
+        }
+
+
+revocation_list = RevocationList()
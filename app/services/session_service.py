@@ -0,0 +1,117 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from pymongo import ReturnDocument, UpdateOne
+from ..config import get_settings
+from ..database import db
+from .auth_service import AuthService
+from .revocation_list import revocation_list
+
+settings = get_settings()
+
+
+def _hash_secret(secret: str) -> str:
+    return hashlib.sha256(secret.encode()).hexdigest()
+
+
+# A login opens a session; its id is the access token's "sid" claim and the
+# prefix of the opaque refresh token ("<sid>.<secret>"). Only a hash of the
+# secret is stored, and every refresh rotates it. Presenting the previous
+# secret again means the token was copied, so the whole session is revoked.
+class SessionService:
+    @staticmethod
+    def _sessions():
+        return db.get_master_db().sessions
+
+    @staticmethod
+    def _tokens(admin: Dict, session_id: str, secret: str) -> Dict:
+        return {
+            "access_token": AuthService.create_admin_token(admin, session_id),
+            "token_type": "bearer",
+            "admin_email": admin["email"],
+            "organization_name": admin["organization_name"],
+            "refresh_token": f"{session_id}.{secret}",
+            "expires_in": settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        }
+
+    @classmethod
+    async def open_session(cls, admin: Dict) -> Dict:
+        session_id = secrets.token_urlsafe(16)
+        secret = secrets.token_urlsafe(32)
+        now = datetime.utcnow()
+        await cls._sessions().insert_one({
+            "_id": session_id,
+            "admin_id": admin["_id"],
+            "organization_id": admin.get("organization_id", ""),
+            "refresh_hash": _hash_secret(secret),
+            "created_at": now,
+            "refreshed_at": now,
+            "expires_at": now + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+        })
+        return cls._tokens(admin, session_id, secret)
+
+    @classmethod
+    async def refresh(cls, refresh_token: str) -> Optional[Dict]:
+        session_id, _, secret = refresh_token.partition(".")
+        if not session_id or not secret:
+            return None
+
+        sessions = cls._sessions()
+        presented = _hash_secret(secret)
+        new_secret = secrets.token_urlsafe(32)
+        now = datetime.utcnow()
+        session = await sessions.find_one_and_update(
+            {"_id": session_id, "refresh_hash": presented, "revoked_at": None, "expires_at": {"$gt": now}},
+            {"$set": {"refresh_hash": _hash_secret(new_secret), "previous_hash": presented, "refreshed_at": now}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if session is None:
+            reused = await sessions.find_one({"_id": session_id, "previous_hash": presented}, {"_id": 1})
+            if reused:
+                print(f"Refresh token reuse detected, revoking session {session_id}")
+                await cls.revoke_sessions([session_id])
+            return None
+
+        # Claims come from the current admin document, so a rename or email change
+        # made with this session is reflected in the new access token.
+        admin = await db.get_master_db().admins.find_one({"_id": session["admin_id"]})
+        if not admin or not admin.get("is_active", True):
+            await cls.revoke_sessions([session_id])
+            return None
+        return cls._tokens(admin, session_id, new_secret)
+
+    @classmethod
+    async def revoke_sessions(cls, session_ids: List[str]) -> None:
+        if not session_ids:
+            return
+        now = datetime.utcnow()
+        # Access tokens outlive revocation by at most their own lifetime.
+        expires_at = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        revocation_list.add(session_ids, expires_at)
+        await db.get_master_db().revoked_sessions.bulk_write([
+            UpdateOne(
+                {"_id": session_id},
+                {"$setOnInsert": {"revoked_at": now, "expires_at": expires_at}},
+                upsert=True,
+            )
+            for session_id in session_ids
+        ], ordered=False)
+        await cls._sessions().update_many(
+            {"_id": {"$in": session_ids}, "revoked_at": None},
+            {"$set": {"revoked_at": now}},
+        )
+
+    @classmethod
+    async def revoke_organization_sessions(cls, organization_id: str, keep_session_id: Optional[str] = None) -> int:
+        now = datetime.utcnow()
+        session_ids = [
+            session["_id"]
+            async for session in cls._sessions().find(
+                {"organization_id": organization_id, "revoked_at": None, "expires_at": {"$gt": now}},
+                {"_id": 1},
+            )
+            if session["_id"] != keep_session_id
+        ]
+        await cls.revoke_sessions(session_ids)
+        return len(session_ids)
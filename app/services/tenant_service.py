@@ -0,0 +1,125 @@
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ASCENDING
+from ..config import get_settings
+from ..utils.pagination import decode_page_token, encode_page_token
+from .organization_service import OrganizationService
+
+settings = get_settings()
+
+# The metadata document written when a tenant is created is not tenant data.
+TENANT_DATA_FILTER = {"type": {"$ne": "metadata"}}
+
+
+class TenantService:
+    @staticmethod
+    def _object_id(document_id: str) -> ObjectId:
+        try:
+            return ObjectId(document_id)
+        except (InvalidId, TypeError):
+            raise ValueError("Invalid document id")
+
+    @staticmethod
+    def _validate_document(document: Dict[str, Any]) -> Dict[str, Any]:
+        for key in document:
+            if key == "_id" or key.startswith("$"):
+                raise ValueError(f"Field '{key}' is reserved")
+        if document.get("type") == "metadata":
+            raise ValueError("Document type 'metadata' is reserved")
+        return document
+
+    @staticmethod
+    def _projection(fields: Optional[List[str]]) -> Optional[Dict[str, int]]:
+        if not fields:
+            return None
+        for field in fields:
+            if field.startswith("$"):
+                raise ValueError(f"Invalid field '{field}'")
+        return {field: 1 for field in fields}
+
+    @staticmethod
+    def _serialize(document: Dict[str, Any]) -> Dict[str, Any]:
+        document["id"] = str(document.pop("_id"))
+        return document
+
+    @staticmethod
+    async def _collection(organization_name: str, organization_id: str):
+        collection = await OrganizationService.get_tenant_collection(organization_name, organization_id)
+        if collection is None:
+            raise LookupError("Organization not found")
+        return collection
+
+    @classmethod
+    async def insert_documents(
+        cls, organization_name: str, organization_id: str, documents: List[Dict[str, Any]]
+    ) -> List[str]:
+        collection = await cls._collection(organization_name, organization_id)
+        now = datetime.utcnow()
+        prepared = []
+        for document in documents:
+            document = dict(cls._validate_document(document))
+            document["_id"] = ObjectId()
+            document["created_at"] = now
+            prepared.append(document)
+
+        await collection.insert_many(prepared, ordered=False)
+        return [str(document["_id"]) for document in prepared]
+
+    @classmethod
+    async def list_documents(
+        cls,
+        organization_name: str,
+        organization_id: str,
+        limit: int = 100,
+        page_token: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict:
+        collection = await cls._collection(organization_name, organization_id)
+        query = dict(TENANT_DATA_FILTER)
+        if page_token:
+            query["_id"] = {"$gt": decode_page_token(page_token)}
+
+        cursor = collection.find(query, cls._projection(fields)).sort("_id", ASCENDING).limit(limit + 1)
+        documents = await cursor.to_list(length=limit + 1)
+
+        next_page_token = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            next_page_token = encode_page_token(documents[-1]["_id"])
+
+        return {
+            "documents": [cls._serialize(document) for document in documents],
+            "next_page_token": next_page_token,
+        }
+
+    @classmethod
+    async def get_document(
+        cls, organization_name: str, organization_id: str, document_id: str, fields: Optional[List[str]] = None
+    ) -> Optional[Dict]:
+        collection = await cls._collection(organization_name, organization_id)
+        document = await collection.find_one(
+            {"_id": cls._object_id(document_id), **TENANT_DATA_FILTER},
+            cls._projection(fields),
+        )
+        return cls._serialize(document) if document else None
+
+    @classmethod
+    async def replace_document(
+        cls, organization_name: str, organization_id: str, document_id: str, document: Dict[str, Any]
+    ) -> bool:
+        collection = await cls._collection(organization_name, organization_id)
+        replacement = dict(cls._validate_document(document))
+        replacement["updated_at"] = datetime.utcnow()
+        result = await collection.replace_one(
+            {"_id": cls._object_id(document_id), **TENANT_DATA_FILTER},
+            replacement,
+        )
+        return result.matched_count > 0
+
+    @classmethod
+    async def delete_document(cls, organization_name: str, organization_id: str, document_id: str) -> bool:
+        collection = await cls._collection(organization_name, organization_id)
+        result = await collection.delete_one({"_id": cls._object_id(document_id), **TENANT_DATA_FILTER})
+        return result.deleted_count > 0
@@ -0,0 +1,270 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from pymongo import ASCENDING, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+from ..config import get_settings
+from ..database import db
+from ..utils.metrics import QUOTA_REJECTIONS
+
+settings = get_settings()
+
+DAY_SECONDS = 86400
+
+
+class QuotaExceeded(Exception):
+    def __init__(self, quota: str, message: str):
+        super().__init__(message)
+        self.quota = quota
+
+
+# Requests are counted in memory per organization_id and UTC day (the id, not
+# the name, so counts survive renames). Every USAGE_FLUSH_INTERVAL_SECONDS the
+# counts are written as one unordered bulk_write of $inc upserts, then usage
+# documents changed by any process since the previous pass are read back. Quota
+# checks therefore see deployment-wide usage at most one interval late and never
+# touch the database. Storage is sampled with $collStats, USAGE_STATS_BATCH_SIZE
+# organizations per pass, resuming after the last _id.
+class UsageTracker:
+    def __init__(self):
+        self._day_number = int(time.time() // DAY_SECONDS)
+        self._day = self._format_day(self._day_number)
+        self._pending: Dict[Tuple[str, str], int] = {}
+        self._names: Dict[str, str] = {}
+        self._synced: Dict[str, int] = {}
+        self._local: Dict[str, int] = {}
+        self._unsynced: Dict[str, int] = {}
+        self._storage: Dict[str, int] = {}
+        self._synced_at: Optional[datetime] = None
+        self._sample_after = None
+        self._tasks = []
+        self.flushes = 0
+        self.flush_failures = 0
+        self.flushed_requests = 0
+        self.storage_samples = 0
+        self.last_flush: Optional[float] = None
+
+    @staticmethod
+    def _usage():
+        return db.get_master_db().usage
+
+    @staticmethod
+    def _format_day(day_number: int) -> str:
+        return time.strftime("%Y-%m-%d", time.gmtime(day_number * DAY_SECONDS))
+
+    def _current_day(self) -> str:
+        day_number = int(time.time() // DAY_SECONDS)
+        if day_number != self._day_number:
+            self._day_number = day_number
+            self._day = self._format_day(day_number)
+            self._synced, self._local, self._unsynced = {}, {}, {}
+            self._synced_at = None
+        return self._day
+
+    @staticmethod
+    def seconds_until_reset() -> int:
+        return int(DAY_SECONDS - time.time() % DAY_SECONDS) + 1
+
+    def requests_today(self, organization_id: str) -> int:
+        self._current_day()
+        return self._synced.get(organization_id, 0) + self._local.get(organization_id, 0)
+
+    def record(self, organization_id: str, organization_name: str) -> None:
+        if not settings.USAGE_TRACKING_ENABLED:
+            return
+        day = self._current_day()
+        quota = settings.USAGE_DAILY_REQUEST_QUOTA
+        if quota and self.requests_today(organization_id) >= quota:
+            QUOTA_REJECTIONS.inc(("requests",))
+            raise QuotaExceeded("requests", "Daily request quota exceeded")
+
+        key = (organization_id, day)
+        self._pending[key] = self._pending.get(key, 0) + 1
+        self._local[organization_id] = self._local.get(organization_id, 0) + 1
+        self._names[organization_id] = organization_name
+
+    def check_storage(self, organization_id: str) -> None:
+        quota = settings.USAGE_STORAGE_QUOTA_BYTES
+        if settings.USAGE_TRACKING_ENABLED and quota and self._storage.get(organization_id, 0) >= quota:
+            QUOTA_REJECTIONS.inc(("storage",))
+            raise QuotaExceeded("storage", "Storage quota exceeded")
+
+    def usage(self, organization_id: str) -> Dict:
+        return {
+            "organization_id": organization_id,
+            "day": self._current_day(),
+            "requests": self.requests_today(organization_id),
+            "request_quota": settings.USAGE_DAILY_REQUEST_QUOTA or None,
+            "storage_bytes": self._storage.get(organization_id),
+            "storage_quota_bytes": settings.USAGE_STORAGE_QUOTA_BYTES or None,
+            "reset_in_seconds": self.seconds_until_reset(),
+        }
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        keys = list(pending)
+        now = datetime.utcnow()
+        operations = [
+            UpdateOne(
+                {"_id": f"{organization_id}:{day}"},
+                {
+                    "$inc": {"requests": pending[(organization_id, day)]},
+                    "$set": {"organization_name": self._names.get(organization_id), "updated_at": now},
+                    "$setOnInsert": {"organization_id": organization_id, "day": day},
+                },
+                upsert=True,
+            )
+            for organization_id, day in keys
+        ]
+        try:
+            await self._usage().bulk_write(operations, ordered=False)
+            failed = set()
+        except BulkWriteError as e:
+            failed = {error["index"] for error in e.details.get("writeErrors", [])}
+        except PyMongoError:
+            failed = set(range(len(keys)))
+
+        # Failed counts go back into pending for the next flush.
+        for index, key in enumerate(keys):
+            count = pending[key]
+            if index in failed:
+                self._pending[key] = self._pending.get(key, 0) + count
+                continue
+            self.flushed_requests += count
+            if key[1] == self._day:
+                self._unsynced[key[0]] = self._unsynced.get(key[0], 0) + count
+
+        self.last_flush = time.time()
+        if failed:
+            self.flush_failures += 1
+            raise RuntimeError(f"{len(failed)} of {len(keys)} usage updates failed")
+        self.flushes += 1
+
+    async def sync(self) -> None:
+        day = self._current_day()
+        synced_at = datetime.utcnow()
+        query = {"day": day}
+        if self._synced_at is not None:
+            query["updated_at"] = {"$gte": self._synced_at - timedelta(seconds=settings.USAGE_FLUSH_INTERVAL_SECONDS)}
+
+        unsynced = self._unsynced
+        async for doc in self._usage().find(query, {"organization_id": 1, "requests": 1, "storage_bytes": 1}):
+            self._synced[doc["organization_id"]] = doc.get("requests", 0)
+            if doc.get("storage_bytes") is not None:
+                self._storage[doc["organization_id"]] = doc["storage_bytes"]
+
+        # Flushed counts are now part of the synced totals.
+        if unsynced is self._unsynced:
+            for organization_id, count in unsynced.items():
+                remaining = self._local.get(organization_id, 0) - count
+                if remaining > 0:
+                    self._local[organization_id] = remaining
+                else:
+                    self._local.pop(organization_id, None)
+            self._unsynced = {}
+            self._synced_at = synced_at
+
+    @staticmethod
+    async def collection_storage(collection_name: str, shard: Optional[str]) -> Dict[str, int]:
+        # One $collStats document per shard on a sharded cluster, so totals are summed.
+        stats = {"documents": 0, "data_bytes": 0, "storage_bytes": 0}
+        collection = db.get_org_collection(collection_name, shard)
+        async for shard_stats in collection.aggregate([{"$collStats": {"storageStats": {}}}]):
+            storage = shard_stats.get("storageStats", {})
+            stats["documents"] += storage.get("count", 0)
+            stats["data_bytes"] += storage.get("size", 0)
+            stats["storage_bytes"] += storage.get("storageSize", 0) + storage.get("totalIndexSize", 0)
+        return stats
+
+    async def sample_storage(self) -> None:
+        # Collections mid-move are skipped and picked up on a later pass.
+        query = {"migrating_from": {"$exists": False}, "moving_to_shard": {"$exists": False}}
+        if self._sample_after is not None:
+            query["_id"] = {"$gt": self._sample_after}
+        batch_size = settings.USAGE_STATS_BATCH_SIZE
+        orgs: List[Dict] = await db.get_master_db().organizations.find(
+            query,
+            {"organization_name": 1, "collection_name": 1, "shard": 1},
+        ).sort("_id", ASCENDING).limit(batch_size).to_list(length=batch_size)
+        self._sample_after = orgs[-1]["_id"] if len(orgs) == batch_size else None
+
+        day = self._current_day()
+        now = datetime.utcnow()
+        operations = []
+        for org in orgs:
+            try:
+                storage = await self.collection_storage(org["collection_name"], org.get("shard"))
+            except PyMongoError as e:
+                print(f"Storage sample of {org['organization_name']} failed: {e}")
+                continue
+            organization_id = str(org["_id"])
+            self._storage[organization_id] = storage["storage_bytes"]
+            operations.append(UpdateOne(
+                {"_id": f"{organization_id}:{day}"},
+                {
+                    "$set": {**storage, "organization_name": org["organization_name"], "sampled_at": now, "updated_at": now},
+                    "$setOnInsert": {"organization_id": organization_id, "day": day, "requests": 0},
+                },
+                upsert=True,
+            ))
+
+        if operations:
+            await self._usage().bulk_write(operations, ordered=False)
+            self.storage_samples += len(operations)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await self.flush()
+                await self.sync()
+            except Exception as e:
+                print(f"Usage flush failed: {e}")
+            await asyncio.sleep(settings.USAGE_FLUSH_INTERVAL_SECONDS)
+
+    async def _sample_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.USAGE_STATS_INTERVAL_SECONDS)
+            try:
+                await self.sample_storage()
+            except Exception as e:
+                print(f"Storage sampling failed: {e}")
+
+    def start(self) -> None:
+        if not settings.USAGE_TRACKING_ENABLED:
+            return
+        self._tasks = [asyncio.create_task(self._flush_loop())]
+        if settings.USAGE_STATS_INTERVAL_SECONDS > 0:
+            self._tasks.append(asyncio.create_task(self._sample_loop()))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        try:
+            await self.flush()
+        except Exception as e:
+            print(f"Final usage flush failed: {e}")
+
+    def stats(self) -> Dict:
+        return {
+            "enabled": settings.USAGE_TRACKING_ENABLED,
+            "day": self._day,
+            "organizations_today": len(self._synced.keys() | self._local.keys()),
+            "unflushed_requests": self.unflushed_requests(),
+            "flushes": self.flushes,
+            "flush_failures": self.flush_failures,
+            "flushed_requests": self.flushed_requests,
+            "last_flush": self.last_flush,
+            "storage_samples": self.storage_samples,
+        }
+
+    def unflushed_requests(self) -> int:
+        return sum(self._pending.values())
+
+
+usage_tracker = UsageTracker()
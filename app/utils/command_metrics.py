@@ -0,0 +1,51 @@
+from typing import Dict, Tuple
+from pymongo import monitoring
+from .metrics import MONGO_COMMAND_DURATION, MONGO_COMMAND_FAILURES, current_request
+
+
+def _collection_label(event: monitoring.CommandStartedEvent) -> str:
+    if event.command_name == "getMore":
+        name = event.command.get("collection")
+    else:
+        name = event.command.get(event.command_name)
+
+    if not isinstance(name, str):
+        return "-"
+    if name.startswith("org_"):
+        return "org_*"
+    return name
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    def __init__(self):
+        self._collections: Dict[Tuple, str] = {}
+
+    @staticmethod
+    def _key(event) -> Tuple:
+        return (event.connection_id, event.request_id)
+
+    def started(self, event):
+        self._collections[self._key(event)] = _collection_label(event)
+
+    def succeeded(self, event):
+        self._record(event, failed=False)
+
+    def failed(self, event):
+        self._record(event, failed=True)
+
+    def _record(self, event, failed: bool) -> None:
+        collection = self._collections.pop(self._key(event), "-")
+        seconds = event.duration_micros / 1_000_000
+        request = current_request.get()
+        route = request.route if request else "-"
+
+        if request is not None:
+            request.db_commands += 1
+            request.db_seconds += seconds
+
+        MONGO_COMMAND_DURATION.observe((route, event.command_name, collection), seconds)
+        if failed:
+            MONGO_COMMAND_FAILURES.inc((event.command_name, collection))
+
+
+command_metrics = MongoCommandMetrics()
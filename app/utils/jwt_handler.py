@@ -1,12 +1,77 @@
-from jose import JWTError, jwt
+import hashlib
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from functools import cached_property
+from typing import Optional, Dict, List
 from ..config import get_settings
+from .cache import TTLCache
+from .metrics import JWT_DECODE_DURATION
 
 settings = get_settings()
 
 
+# Backends import their library on first use: python-jose loads cryptography,
+# which is a noticeable share of import time for requests that never touch a token.
+class JoseBackend:
+    name = "jose"
+
+    @cached_property
+    def _jwt(self):
+        from jose import jwt
+
+        return jwt
+
+    @cached_property
+    def _error(self):
+        from jose import JWTError
+
+        return JWTError
+
+    def encode(self, payload: Dict, key: str, algorithm: str) -> str:
+        return self._jwt.encode(payload, key, algorithm=algorithm)
+
+    def decode(self, token: str, key: str, algorithms: List[str]) -> Optional[Dict]:
+        try:
+            return self._jwt.decode(token, key, algorithms=algorithms)
+        except self._error:
+            return None
+
+
+class PyJWTBackend:
+    name = "pyjwt"
+
+    @cached_property
+    def _jwt(self):
+        import jwt
+
+        return jwt
+
+    @cached_property
+    def _error(self):
+        return self._jwt.PyJWTError
+
+    def encode(self, payload: Dict, key: str, algorithm: str) -> str:
+        return self._jwt.encode(payload, key, algorithm=algorithm)
+
+    def decode(self, token: str, key: str, algorithms: List[str]) -> Optional[Dict]:
+        try:
+            return self._jwt.decode(token, key, algorithms=algorithms)
+        except self._error:
+            return None
+
+
+JWT_BACKENDS = {
+    JoseBackend.name: JoseBackend,
+    PyJWTBackend.name: PyJWTBackend,
+}
+
+
 class JWTHandler:
+    backend = JWT_BACKENDS[settings.JWT_BACKEND]()
+    _token_cache = TTLCache(max_size=settings.JWT_CACHE_MAX_SIZE, ttl_seconds=0)
+    _decode_count = 0
+    _decode_seconds = 0.0
+
     @staticmethod
     def create_access_token(data: Dict, expires_delta: Optional[timedelta] = None) -> str:
         to_encode = data.copy()
@@ -15,13 +80,39 @@ class JWTHandler:
         else:
             expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        encoded_jwt = JWTHandler.backend.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
         return encoded_jwt
 
-    @staticmethod
-    def decode_token(token: str) -> Optional[Dict]:
-        try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-            return payload
-        except JWTError:
+    @classmethod
+    def decode_token(cls, token: str) -> Optional[Dict]:
+        digest = hashlib.sha256(token.encode()).digest()
+        cached = cls._token_cache.get(digest)
+        if cached is not None:
+            return dict(cached)
+
+        start = time.perf_counter()
+        payload = cls.backend.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        elapsed = time.perf_counter() - start
+        JWT_DECODE_DURATION.observe((), elapsed)
+        cls._decode_seconds += elapsed
+        cls._decode_count += 1
+
+        if payload is None:
             return None
+
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)) and exp > time.time():
+            cls._token_cache.set(digest, dict(payload), ttl_seconds=exp - time.time())
+        return payload
+
+    @classmethod
+    def cache_stats(cls) -> Dict:
+        stats = cls._token_cache.stats()
+        avg_decode = cls._decode_seconds / cls._decode_count if cls._decode_count else 0.0
+        stats.update({
+            "backend": cls.backend.name,
+            "decodes": cls._decode_count,
+            "decode_seconds_total": round(cls._decode_seconds, 6),
+            "decode_seconds_saved_estimate": round(avg_decode * stats["hits"], 6),
+        })
+        return stats
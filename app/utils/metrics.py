@@ -0,0 +1,228 @@
+import bisect
+import contextvars
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 50)
+
+Labels = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = list(self._values.items())
+        for labels, value in values:
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values: Dict[Labels, List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Labels, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            values = [(labels, list(state[0]), state[1], state[2]) for labels, state in self._values.items()]
+        for labels, bucket_counts, total, count in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), bucket_counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}"
+
+
+class GaugeCallback:
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], callback: Callable[[], Dict[Labels, float]]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self.callback().items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+# For totals that another component already keeps (cache hits, pool events):
+# read at scrape time like a gauge, but they only grow, so they are exported as
+# counters and named with _total.
+class CounterCallback(GaugeCallback):
+    kind = "counter"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge_callback(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Dict[Labels, float]],
+    ) -> GaugeCallback:
+        return self.register(GaugeCallback(name, documentation, labelnames, callback))
+
+    def counter_callback(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Dict[Labels, float]],
+    ) -> CounterCallback:
+        return self.register(CounterCallback(name, documentation, labelnames, callback))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+class RequestStats:
+    __slots__ = ("scope", "db_commands", "db_seconds")
+
+    def __init__(self, scope: Dict):
+        self.scope = scope
+        self.db_commands = 0
+        self.db_seconds = 0.0
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        return getattr(route, "path", "unmatched")
+
+
+current_request: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar("current_request", default=None)
+
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_MONGO_COMMANDS = registry.histogram(
+    "http_request_mongo_commands",
+    "MongoDB commands issued per HTTP request.",
+    ("route",),
+    buckets=COUNT_BUCKETS,
+)
+HTTP_REQUEST_MONGO_SECONDS = registry.histogram(
+    "http_request_mongo_seconds",
+    "Total MongoDB command time per HTTP request.",
+    ("route",),
+)
+MONGO_COMMAND_DURATION = registry.histogram(
+    "mongo_command_duration_seconds",
+    "MongoDB command latency by route, command and collection.",
+    ("route", "command", "collection"),
+)
+MONGO_COMMAND_FAILURES = registry.counter(
+    "mongo_command_failures_total",
+    "Failed MongoDB commands by command and collection.",
+    ("command", "collection"),
+)
+PASSWORD_HASH_DURATION = registry.histogram(
+    "password_hash_duration_seconds",
+    "Time spent hashing or verifying passwords, excluding pool queueing.",
+    ("operation",),
+)
+PASSWORD_REHASHES = registry.counter(
+    "password_rehashes_total",
+    "Outdated password hashes replaced after login, by result.",
+    ("result",),
+)
+RATE_LIMITED_REQUESTS = registry.counter(
+    "rate_limited_requests_total",
+    "Requests rejected with 429 by rate-limit scope.",
+    ("scope",),
+)
+QUOTA_REJECTIONS = registry.counter(
+    "quota_rejections_total",
+    "Requests rejected because a tenant exceeded its request or storage quota.",
+    ("quota",),
+)
+JWT_DECODE_DURATION = registry.histogram(
+    "jwt_decode_duration_seconds",
+    "Time spent verifying JWT signatures (cache misses only).",
+    buckets=(0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01),
+)
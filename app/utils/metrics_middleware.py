@@ -0,0 +1,39 @@
+import time
+from .metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUEST_MONGO_COMMANDS,
+    HTTP_REQUEST_MONGO_SECONDS,
+    RequestStats,
+    current_request,
+)
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = current_request.set(stats)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            current_request.reset(token)
+            route = stats.route
+            HTTP_REQUEST_DURATION.observe((scope["method"], route, str(status_code)), elapsed)
+            HTTP_REQUEST_MONGO_COMMANDS.observe((route,), stats.db_commands)
+            HTTP_REQUEST_MONGO_SECONDS.observe((route,), stats.db_seconds)
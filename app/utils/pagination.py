@@ -0,0 +1,14 @@
+import base64
+from bson import ObjectId
+from bson.errors import InvalidId
+
+
+def encode_page_token(last_id: ObjectId) -> str:
+    return base64.urlsafe_b64encode(last_id.binary).decode().rstrip("=")
+
+
+def decode_page_token(page_token: str) -> ObjectId:
+    try:
+        return ObjectId(base64.urlsafe_b64decode(page_token + "=" * (-len(page_token) % 4)))
+    except (ValueError, TypeError, InvalidId):
+        raise ValueError("Invalid page token")
@@ -1,14 +1,143 @@
-from passlib.context import CryptContext
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional
+from ..config import get_settings
+from .metrics import PASSWORD_HASH_DURATION
+
+settings = get_settings()
+
+# bcrypt is left out because of its 72-byte password limit. argon2 needs argon2-cffi;
+# scrypt uses hashlib.
+HASH_SCHEMES = ("pbkdf2_sha256", "argon2", "scrypt")
+
+_pwd_context = None
+
+
+def build_context(scheme: str, rounds: int = 0, memory_kib: int = 0, parallelism: int = 0):
+    # rounds is the iteration count for pbkdf2_sha256, time_cost for argon2 and
+    # log2(N) for scrypt; zero keeps passlib's default. Hashes of the other schemes
+    # or below these rounds still verify, but are reported by needs_update().
+    from passlib.context import CryptContext
+    from passlib.registry import get_crypt_handler
+
+    if scheme not in HASH_SCHEMES:
+        raise ValueError(f"Unknown password hash scheme '{scheme}'; choose from {', '.join(HASH_SCHEMES)}")
+    handler = get_crypt_handler(scheme)
+    if hasattr(handler, "has_backend") and not handler.has_backend():
+        raise RuntimeError(f"Password hash scheme '{scheme}' has no backend installed (argon2 needs argon2-cffi)")
+
+    rounds = rounds or handler.default_rounds
+    policy = {f"{scheme}__default_rounds": rounds, f"{scheme}__min_rounds": rounds}
+    if memory_kib and scheme == "argon2":
+        policy["argon2__memory_cost"] = memory_kib
+    if parallelism and scheme != "pbkdf2_sha256":
+        policy[f"{scheme}__parallelism"] = parallelism
+    legacy = [name for name in HASH_SCHEMES if name != scheme]
+    return CryptContext(schemes=[scheme, *legacy], default=scheme, deprecated=legacy, **policy)
+
+
+def get_pwd_context():
+    # Built on first use so importing the app does not load passlib; process-pool
+    # workers build their own copy the same way.
+    global _pwd_context
+    if _pwd_context is None:
+        _pwd_context = build_context(
+            settings.PASSWORD_HASH_SCHEME,
+            settings.PASSWORD_HASH_ROUNDS,
+            settings.PASSWORD_HASH_MEMORY_KIB,
+            settings.PASSWORD_HASH_PARALLELISM,
+        )
+    return _pwd_context
+
+
+def _hash(password: str) -> str:
+    return get_pwd_context().hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return get_pwd_context().verify(plain_password, hashed_password)
+
+
+def _timed(func: Callable, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+class PasswordHasherBusy(Exception):
+    pass
 
 
 class PasswordHandler:
-    # Use pbkdf2_sha256 instead of bcrypt to avoid 72‑byte limit
-    pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+    _executor: Optional[Executor] = None
+    _pending = 0
+
+    @staticmethod
+    def context():
+        return get_pwd_context()
+
+    @staticmethod
+    def configure(scheme: str, rounds: int = 0, memory_kib: int = 0, parallelism: int = 0) -> None:
+        # Replaces the settings-derived policy in this process (process-pool workers keep theirs).
+        global _pwd_context
+        _pwd_context = build_context(scheme, rounds, memory_kib, parallelism)
 
     @classmethod
     def hash_password(cls, password: str) -> str:
-        return cls.pwd_context.hash(password)
+        return _hash(password)
 
     @classmethod
     def verify_password(cls, plain_password: str, hashed_password: str) -> bool:
-        return cls.pwd_context.verify(plain_password, hashed_password)
+        return _verify(plain_password, hashed_password)
+
+    @classmethod
+    def needs_rehash(cls, hashed_password: str) -> bool:
+        return get_pwd_context().needs_update(hashed_password)
+
+    @classmethod
+    def _get_executor(cls) -> Executor:
+        if cls._executor is None:
+            workers = settings.PASSWORD_HASH_WORKERS
+            if settings.PASSWORD_HASH_EXECUTOR == "process":
+                cls._executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                cls._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        return cls._executor
+
+    @classmethod
+    async def _run(cls, operation: str, func: Callable, *args):
+        if settings.PASSWORD_HASH_WORKERS <= 0:
+            result, elapsed = _timed(func, *args)
+            PASSWORD_HASH_DURATION.observe((operation,), elapsed)
+            return result
+
+        if cls._pending >= settings.PASSWORD_HASH_MAX_PENDING:
+            raise PasswordHasherBusy("Password hashing pool is saturated")
+
+        cls._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, elapsed = await loop.run_in_executor(cls._get_executor(), _timed, func, *args)
+        finally:
+            cls._pending -= 1
+        PASSWORD_HASH_DURATION.observe((operation,), elapsed)
+        return result
+
+    @classmethod
+    async def hash_password_async(cls, password: str) -> str:
+        return await cls._run("hash", _hash, password)
+
+    @classmethod
+    async def verify_password_async(cls, plain_password: str, hashed_password: str) -> bool:
+        return await cls._run("verify", _verify, plain_password, hashed_password)
+
+    @classmethod
+    def pending(cls) -> int:
+        return cls._pending
+
+    @classmethod
+    def shutdown_executor(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
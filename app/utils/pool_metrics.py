@@ -0,0 +1,91 @@
+import threading
+import time
+from typing import Dict
+from pymongo import monitoring
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.pools_created = 0
+        self.pools_cleared = 0
+        self.connections_created = 0
+        self.connections_closed = 0
+        self.checkouts_started = 0
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self.checkins = 0
+        self.checkout_wait_seconds = 0.0
+        self.checkout_wait_max_seconds = 0.0
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _finish_wait(self) -> None:
+        started = getattr(self._local, "checkout_started", None)
+        if started is None:
+            return
+        self._local.checkout_started = None
+        waited = time.perf_counter() - started
+        with self._lock:
+            self.checkout_wait_seconds += waited
+            self.checkout_wait_max_seconds = max(self.checkout_wait_max_seconds, waited)
+
+    def pool_created(self, event):
+        self._count("pools_created")
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        self._count("pools_cleared")
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        self._count("connections_created")
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._count("connections_closed")
+
+    def connection_check_out_started(self, event):
+        self._local.checkout_started = time.perf_counter()
+        self._count("checkouts_started")
+
+    def connection_check_out_failed(self, event):
+        self._finish_wait()
+        self._count("checkout_failures")
+
+    def connection_checked_out(self, event):
+        self._finish_wait()
+        self._count("checkouts")
+
+    def connection_checked_in(self, event):
+        self._count("checkins")
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "pools_created": self.pools_created,
+                "pools_cleared": self.pools_cleared,
+                "connections_created": self.connections_created,
+                "connections_closed": self.connections_closed,
+                "connections_open": self.connections_created - self.connections_closed,
+                "checkouts_started": self.checkouts_started,
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "checkins": self.checkins,
+                "checked_out": self.checkouts - self.checkins,
+                "waiting": self.checkouts_started - self.checkouts - self.checkout_failures,
+                "checkout_wait_seconds_total": round(self.checkout_wait_seconds, 6),
+                "checkout_wait_seconds_max": round(self.checkout_wait_max_seconds, 6),
+            }
+
+
+pool_metrics = PoolMetrics()
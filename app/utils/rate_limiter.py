@@ -0,0 +1,83 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from ..config import get_settings
+from .metrics import RATE_LIMITED_REQUESTS
+
+settings = get_settings()
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+def parse_limit(value: str) -> Optional[Tuple[float, float]]:
+    # "10/minute" -> (capacity 10, refill 10/60 tokens per second); "" disables the limit.
+    if not value:
+        return None
+    count, _, period = value.partition("/")
+    if period not in PERIODS or float(count) <= 0:
+        raise ValueError(f"Invalid rate limit '{value}', expected e.g. '10/minute'")
+    return float(count), float(count) / PERIODS[period]
+
+
+class InMemoryRateLimitBackend:
+    name = "memory"
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # key -> (tokens, last refill); least recently used keys are evicted first.
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self.evictions = 0
+
+    async def acquire(self, key: str, capacity: float, refill_per_second: float, cost: float = 1) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated) * refill_per_second)
+
+        retry_after = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            retry_after = (cost - tokens) / refill_per_second
+
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+            self.evictions += 1
+        return retry_after
+
+    def stats(self) -> Dict:
+        return {"backend": self.name, "keys": len(self._buckets), "max_keys": self.max_keys, "evictions": self.evictions}
+
+
+# A shared store only needs acquire() and stats() with the same semantics.
+RATE_LIMIT_BACKENDS = {
+    InMemoryRateLimitBackend.name: InMemoryRateLimitBackend,
+}
+
+
+class RateLimiter:
+    backend = RATE_LIMIT_BACKENDS[settings.RATE_LIMIT_BACKEND](settings.RATE_LIMIT_MAX_KEYS)
+    limits = {
+        "login_ip": parse_limit(settings.RATE_LIMIT_LOGIN_PER_IP),
+        "login_email": parse_limit(settings.RATE_LIMIT_LOGIN_PER_EMAIL),
+        "create_ip": parse_limit(settings.RATE_LIMIT_CREATE_PER_IP),
+        "create_email": parse_limit(settings.RATE_LIMIT_CREATE_PER_EMAIL),
+        "bulk_create_ip": parse_limit(settings.RATE_LIMIT_BULK_CREATE_PER_IP),
+    }
+
+    @classmethod
+    async def check(cls, scope: str, key: str) -> float:
+        # Returns 0 when allowed, otherwise the seconds until a token is available.
+        limit = cls.limits.get(scope)
+        if not settings.RATE_LIMIT_ENABLED or limit is None:
+            return 0.0
+
+        capacity, refill_per_second = limit
+        retry_after = await cls.backend.acquire(f"{scope}:{key}", capacity, refill_per_second)
+        if retry_after:
+            RATE_LIMITED_REQUESTS.inc((scope,))
+        return retry_after
+
+    @classmethod
+    def stats(cls) -> Dict:
+        return cls.backend.stats()
@@ -0,0 +1,126 @@
+import asyncio
+import json
+import math
+import os
+from typing import Dict, List, Optional
+
+# Metrics where a larger value is an improvement; everything else is a cost.
+HIGHER_IS_BETTER = {"throughput_rps", "ops_per_sec"}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    return {
+        "count": len(samples),
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+    }
+
+
+def configure_environment(mongodb_url: Optional[str] = None, master_db_name: str = "bench_master") -> None:
+    # Must run before anything under app/ is imported: settings are read at import time.
+    # Every simulated client shares one address, so rate limits would turn load into 429s.
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    if mongodb_url:
+        os.environ["MONGODB_URL"] = mongodb_url
+        os.environ["MASTER_DB_NAME"] = master_db_name
+
+
+async def use_database(mongodb_url: Optional[str] = None):
+    from app.database import Database
+
+    if mongodb_url:
+        await Database.connect_db()
+        await Database.client.drop_database(Database.get_master_db().name)
+    else:
+        from mongomock_motor import AsyncMongoMockClient
+
+        Database.client = AsyncMongoMockClient()
+        Database.supports_transactions = False
+    await Database.ensure_indexes()
+    return Database.client
+
+
+LATENCY_METHODS = (
+    "bulk_write", "count_documents", "create_indexes", "delete_many", "delete_one", "drop",
+    "estimated_document_count", "find_one", "insert_many", "insert_one", "rename", "update_many", "update_one",
+)
+DATABASE_LATENCY_METHODS = ("command",)
+
+
+def inject_latency(rtt_seconds: float) -> None:
+    # Delays every mongomock collection call and database command by one simulated network round trip.
+    from mongomock_motor import AsyncMongoMockCollection, AsyncMongoMockDatabase
+
+    for cls, names in ((AsyncMongoMockCollection, LATENCY_METHODS), (AsyncMongoMockDatabase, DATABASE_LATENCY_METHODS)):
+        for name in names:
+            original = getattr(cls, name)
+
+            async def delayed(self, *args, _original=original, **kwargs):
+                await asyncio.sleep(rtt_seconds)
+                return await _original(self, *args, **kwargs)
+
+            setattr(cls, name, delayed)
+
+
+def make_client():
+    import httpx
+    from app.main import app
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, float]]) -> None:
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    print(f"Saved baseline to {path}")
+
+
+def compare_to_baseline(path: str, results: Dict[str, Dict[str, float]], threshold_pct: float) -> List[str]:
+    with open(path) as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            before = baseline.get(name, {}).get(metric)
+            if metric == "count" or not before:
+                continue
+            change_pct = (value - before) / before * 100
+            if metric in HIGHER_IS_BETTER:
+                change_pct = -change_pct
+            if change_pct > threshold_pct:
+                regressions.append(f"{name}.{metric}: {before:.3f} -> {value:.3f} ({change_pct:+.1f}% worse)")
+    return regressions
+
+
+def report_baseline(args, results: Dict[str, Dict[str, float]]) -> int:
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+
+    if not args.compare:
+        return 0
+
+    regressions = compare_to_baseline(args.compare, results, args.threshold)
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0f}% against {args.compare}")
+        return 0
+
+    print(f"Regressions beyond {args.threshold:.0f}% against {args.compare}:")
+    for line in regressions:
+        print(f"  {line}")
+    return 1
+
+
+def add_baseline_arguments(parser) -> None:
+    parser.add_argument("--save-baseline", metavar="PATH", help="write results as JSON for later comparison")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a saved baseline; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
@@ -0,0 +1,236 @@
+"""Drive a create/get/update/delete/login mix against the app in-process.
+
+    python -m benchmarks.load --concurrency 16 --duration 10
+    python -m benchmarks.load --mix get=90,login=5,create=5
+    python -m benchmarks.load --mongodb-url mongodb://localhost:27017   # real mongod
+    python -m benchmarks.load --save-baseline bench_load.json
+    python -m benchmarks.load --compare bench_load.json --threshold 15
+
+Without --mongodb-url the app runs against mongomock-motor. With it, a
+throwaway bench_master database is dropped and recreated on that server.
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Dict, List, Optional
+from benchmarks._support import (
+    add_baseline_arguments,
+    configure_environment,
+    report_baseline,
+    summarize,
+)
+
+OPERATIONS = ("get", "create", "update", "delete", "login")
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}; choose from {', '.join(OPERATIONS)}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of load")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("get=70,login=10,create=10,update=5,delete=5"))
+    parser.add_argument("--seed-orgs", type=int, default=50, help="organizations created before the run")
+    parser.add_argument("--mongodb-url", help="use a real MongoDB instead of mongomock-motor")
+    parser.add_argument("--alloc-samples", type=int, default=20, help="requests per operation traced with tracemalloc (0 disables)")
+    parser.add_argument("--seed", type=int, default=1)
+    add_baseline_arguments(parser)
+    return parser.parse_args()
+
+
+class TenantPool:
+    def __init__(self):
+        self._counter = itertools.count()
+        self._idle: List[Dict] = []
+
+    def new_tenant(self) -> Dict:
+        n = next(self._counter)
+        return {
+            "organization_name": f"LoadOrg{n}",
+            "email": f"admin{n}@load.example.com",
+            "password": "loadpass123",
+            "token": None,
+        }
+
+    def put(self, tenant: Dict) -> None:
+        self._idle.append(tenant)
+
+    def take(self) -> Optional[Dict]:
+        if not self._idle:
+            return None
+        index = random.randrange(len(self._idle))
+        self._idle[index], self._idle[-1] = self._idle[-1], self._idle[index]
+        return self._idle.pop()
+
+    def peek(self) -> Optional[Dict]:
+        return random.choice(self._idle) if self._idle else None
+
+
+class LoadRunner:
+    def __init__(self, client, pool: TenantPool):
+        self.client = client
+        self.pool = pool
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def _timed(self, operation: str, request, expected=(200, 201, 202)):
+        start = time.perf_counter()
+        response = await request
+        self.latencies[operation].append(time.perf_counter() - start)
+        if response.status_code not in expected:
+            self.errors[operation] += 1
+        return response
+
+    async def _token(self, tenant: Dict) -> str:
+        if tenant["token"] is None:
+            response = await self.client.post("/admin/login", json={"email": tenant["email"], "password": tenant["password"]})
+            tenant["token"] = response.json()["access_token"]
+        return tenant["token"]
+
+    async def create(self):
+        tenant = self.pool.new_tenant()
+        body = {key: tenant[key] for key in ("organization_name", "email", "password")}
+        response = await self._timed("create", self.client.post("/org/create", json=body))
+        if response.status_code == 201:
+            self.pool.put(tenant)
+
+    async def get(self):
+        tenant = self.pool.peek()
+        if tenant is None:
+            return await self.create()
+        await self._timed("get", self.client.get("/org/get", params={"organization_name": tenant["organization_name"]}))
+
+    async def login(self):
+        tenant = self.pool.peek()
+        if tenant is None:
+            return await self.create()
+        body = {"email": tenant["email"], "password": tenant["password"]}
+        await self._timed("login", self.client.post("/admin/login", json=body))
+
+    async def update(self):
+        tenant = self.pool.take()
+        if tenant is None:
+            return await self.create()
+        try:
+            headers = {"Authorization": f"Bearer {await self._token(tenant)}"}
+            renamed = self.pool.new_tenant()["organization_name"]
+            body = {"organization_name": renamed, "email": tenant["email"], "password": tenant["password"]}
+            response = await self._timed("update", self.client.put(
+                "/org/update",
+                params={"old_organization_name": tenant["organization_name"]},
+                json=body,
+                headers=headers,
+            ))
+            if response.status_code in (200, 202):
+                tenant["organization_name"] = renamed
+        finally:
+            self.pool.put(tenant)
+
+    async def delete(self):
+        tenant = self.pool.take()
+        if tenant is None:
+            return await self.create()
+        headers = {"Authorization": f"Bearer {await self._token(tenant)}"}
+        response = await self._timed("delete", self.client.delete(
+            "/org/delete",
+            params={"organization_name": tenant["organization_name"]},
+            headers=headers,
+        ))
+        if response.status_code not in (200, 202):
+            self.pool.put(tenant)
+
+    async def worker(self, schedule: List[str], deadline: float):
+        while time.perf_counter() < deadline:
+            await getattr(self, random.choice(schedule))()
+
+
+async def measure_allocations(runner: LoadRunner, mix: Dict[str, int], samples: int) -> Dict[str, float]:
+    # Sequential, so each traced peak belongs to exactly one request.
+    peaks = {}
+    tracemalloc.start()
+    try:
+        for operation in mix:
+            total = 0
+            for _ in range(samples):
+                tracemalloc.reset_peak()
+                baseline, _ = tracemalloc.get_traced_memory()
+                await getattr(runner, operation)()
+                _, peak = tracemalloc.get_traced_memory()
+                total += peak - baseline
+            peaks[operation] = total / samples / 1024
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+async def main(args) -> int:
+    from benchmarks._support import make_client, use_database
+    from app.database import Database
+    from app.services.job_worker import job_worker
+    from app.utils.password_handler import PasswordHandler
+
+    random.seed(args.seed)
+    await use_database(args.mongodb_url)
+    # Renames and deletes finish in background jobs; without workers, renamed
+    # tenants would stay mid-migration and reject further updates.
+    job_worker.start()
+    pool = TenantPool()
+
+    async with make_client() as client:
+        runner = LoadRunner(client, pool)
+        await asyncio.gather(*(runner.create() for _ in range(args.seed_orgs)))
+        runner.latencies.clear()
+        runner.errors.clear()
+
+        schedule = [name for name, weight in args.mix.items() for _ in range(weight)]
+        deadline = time.perf_counter() + args.duration
+        started = time.perf_counter()
+        await asyncio.gather(*(runner.worker(schedule, deadline) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+        latencies = dict(runner.latencies)
+        errors = dict(runner.errors)
+        allocations = await measure_allocations(runner, args.mix, args.alloc_samples) if args.alloc_samples else {}
+
+    results = {}
+    total = sum(len(samples) for samples in latencies.values())
+    print(f"concurrency={args.concurrency} duration={elapsed:.1f}s requests={total} throughput={total / elapsed:.1f} req/s")
+    print(f"{'operation':<10} {'count':>7} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'peak KiB':>9} {'errors':>7}")
+    for operation in OPERATIONS:
+        if operation not in latencies:
+            continue
+        stats = summarize(latencies[operation])
+        stats["throughput_rps"] = stats["count"] / elapsed
+        if operation in allocations:
+            stats["peak_kib_per_request"] = allocations[operation]
+        results[operation] = stats
+        print(
+            f"{operation:<10} {stats['count']:>7} {stats['throughput_rps']:>9.1f} {stats['p50_ms']:>9.2f} "
+            f"{stats['p95_ms']:>9.2f} {stats['p99_ms']:>9.2f} {allocations.get(operation, 0):>9.1f} "
+            f"{errors.get(operation, 0):>7}"
+        )
+
+    await job_worker.stop()
+    if args.mongodb_url:
+        await Database.client.drop_database(Database.get_master_db().name)
+        await Database.close_db()
+    PasswordHandler.shutdown_executor()
+    return report_baseline(args, results)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    configure_environment(args.mongodb_url)
+    raise SystemExit(asyncio.run(main(args)))
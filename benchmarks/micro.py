@@ -0,0 +1,61 @@
+"""Micro-benchmarks for PasswordHandler, JWTHandler and collection naming.
+
+    python -m benchmarks.micro
+    python -m benchmarks.micro --save-baseline bench_micro.json
+    python -m benchmarks.micro --compare bench_micro.json
+"""
+import argparse
+import timeit
+from benchmarks._support import add_baseline_arguments, report_baseline
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="timing rounds per benchmark; the best is kept")
+    add_baseline_arguments(parser)
+    return parser.parse_args()
+
+
+def measure(func, repeat: int) -> dict:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    return {"us_per_op": best * 1e6, "ops_per_sec": 1 / best}
+
+
+def main(args) -> int:
+    from app.config import get_settings
+    from app.services.organization_service import OrganizationService
+    from app.utils.jwt_handler import JWTHandler
+    from app.utils.password_handler import PasswordHandler
+
+    hashed = PasswordHandler.hash_password("benchpass123")
+    token = JWTHandler.create_access_token({"sub": "bench@example.com", "organization_name": "BenchCorp"})
+    settings = get_settings()
+    cache = JWTHandler._token_cache
+    backend = JWTHandler.backend
+
+    def jwt_decode_uncached():
+        cache.clear()
+        JWTHandler.decode_token(token)
+
+    benchmarks = {
+        "password.hash": lambda: PasswordHandler.hash_password("benchpass123"),
+        "password.verify": lambda: PasswordHandler.verify_password("benchpass123", hashed),
+        "jwt.encode": lambda: JWTHandler.create_access_token({"sub": "bench@example.com", "organization_name": "BenchCorp"}),
+        "jwt.backend_decode": lambda: backend.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]),
+        "jwt.decode_uncached": jwt_decode_uncached,
+        "jwt.decode_cached": lambda: JWTHandler.decode_token(token),
+        "org.generate_collection_name": lambda: OrganizationService._generate_collection_name("Tech Corp International"),
+    }
+
+    results = {}
+    for name, func in benchmarks.items():
+        results[name] = measure(func, args.repeat)
+        print(f"{name:<32} {results[name]['us_per_op']:>12.2f} us/op {results[name]['ops_per_sec']:>14.0f} ops/s")
+
+    return report_baseline(args, results)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(parse_args()))
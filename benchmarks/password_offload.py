@@ -0,0 +1,97 @@
+"""Probe latency of /health and /org/get while /admin/login is saturated.
+
+    python -m benchmarks.password_offload --workers 4
+    python -m benchmarks.password_offload --workers 0   # hash on the event loop
+
+Runs the app in-process against mongomock-motor, so any time the event loop
+spends inside PBKDF2 shows up directly as probe latency.
+"""
+import argparse
+import asyncio
+import os
+import time
+from collections import Counter
+from benchmarks._support import configure_environment
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4, help="PASSWORD_HASH_WORKERS (0 = run inline)")
+    parser.add_argument("--executor", choices=["thread", "process"], default="thread")
+    parser.add_argument("--max-pending", type=int, default=64)
+    parser.add_argument("--login-concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per phase")
+    parser.add_argument("--probe-interval", type=float, default=0.01)
+    return parser.parse_args()
+
+
+async def probe(client, path, params, deadline, interval, samples):
+    # Latency is measured from the scheduled send time, so a blocked event
+    # loop is counted even when it stalls the probe before it sends.
+    scheduled = time.perf_counter()
+    while scheduled < deadline:
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        await client.get(path, params=params)
+        samples.append(time.perf_counter() - scheduled)
+        scheduled += interval
+
+
+async def login_loop(client, deadline, statuses):
+    body = {"email": "bench@example.com", "password": "benchpass123"}
+    while time.perf_counter() < deadline:
+        response = await client.post("/admin/login", json=body)
+        statuses[response.status_code] += 1
+        if response.status_code == 503:
+            await asyncio.sleep(0.001)
+
+
+async def run_phase(client, args, with_logins):
+    deadline = time.perf_counter() + args.duration
+    health, org_get = [], []
+    statuses = Counter()
+
+    tasks = [
+        probe(client, "/health", None, deadline, args.probe_interval, health),
+        probe(client, "/org/get", {"organization_name": "BenchCorp"}, deadline, args.probe_interval, org_get),
+    ]
+    if with_logins:
+        tasks += [login_loop(client, deadline, statuses) for _ in range(args.login_concurrency)]
+
+    await asyncio.gather(*tasks)
+    return health, org_get, statuses
+
+
+async def main(args):
+    from benchmarks._support import make_client, summarize, use_database
+    from app.utils.password_handler import PasswordHandler
+
+    await use_database()
+    async with make_client() as client:
+        await client.post("/org/create", json={
+            "organization_name": "BenchCorp",
+            "email": "bench@example.com",
+            "password": "benchpass123",
+        })
+
+        print(f"executor={args.executor} workers={args.workers} login_concurrency={args.login_concurrency}")
+        for label, with_logins in (("idle", False), ("login-saturated", True)):
+            health, org_get, statuses = await run_phase(client, args, with_logins)
+            for name, samples in (("/health", health), ("/org/get", org_get)):
+                stats = summarize(samples)
+                print(
+                    f"  {label:<16} {name:<9} n={stats['count']:<6} "
+                    f"p50={stats['p50_ms']:7.2f}ms p95={stats['p95_ms']:7.2f}ms p99={stats['p99_ms']:7.2f}ms"
+                )
+            if with_logins:
+                print(f"  {label:<16} /admin/login statuses={dict(statuses)}")
+
+    PasswordHandler.shutdown_executor()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    configure_environment()
+    os.environ["PASSWORD_HASH_WORKERS"] = str(args.workers)
+    os.environ["PASSWORD_HASH_EXECUTOR"] = args.executor
+    os.environ["PASSWORD_HASH_MAX_PENDING"] = str(args.max_pending)
+    asyncio.run(main(args))
@@ -0,0 +1,114 @@
+"""Per-request CPU of GET /org/get: ORJSONResponse fast path vs response_model validation.
+
+    python -m benchmarks.response_cpu --requests 5000
+    python -m benchmarks.response_cpu --save-baseline bench_response.json
+
+Both routes run in the same app against mongomock-motor with warm caches. The
+"legacy" route is registered only here and reproduces the previous handler:
+the full organization document, OrganizationGet(**org), then response_model
+re-validation and the stdlib JSON encoder. CPU is process time, so the httpx
+client's own cost is included in both routes; the difference is what the
+fast path saves.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import time
+import timeit
+from benchmarks._support import add_baseline_arguments, configure_environment, report_baseline
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000, help="requests per route")
+    parser.add_argument("--orgs", type=int, default=50, help="organizations requested in rotation")
+    add_baseline_arguments(parser)
+    return parser.parse_args()
+
+
+def register_legacy_route(app) -> None:
+    from fastapi import HTTPException
+    from app.schemas.organization import OrganizationGet
+    from app.services.organization_service import OrganizationService
+
+    async def legacy_get_organization(organization_name: str):
+        org = await OrganizationService.get_organization(organization_name)
+        if not org:
+            raise HTTPException(status_code=404, detail="Organization not found")
+        return OrganizationGet(**org)
+
+    app.add_api_route("/bench/org/get-legacy", legacy_get_organization, response_model=OrganizationGet)
+
+
+async def cpu_per_request(client, path: str, names, requests: int) -> float:
+    for name in names:
+        response = await client.get(path, params={"organization_name": name})
+        assert response.status_code == 200, response.text
+
+    rotation = itertools.cycle(names)
+    start = time.process_time()
+    for _ in range(requests):
+        await client.get(path, params={"organization_name": next(rotation)})
+    return (time.process_time() - start) / requests
+
+
+def serialization_only(org) -> dict:
+    from fastapi.encoders import jsonable_encoder
+    from app.schemas.organization import OrganizationGet
+    import orjson
+
+    def legacy():
+        model = OrganizationGet(**org)
+        validated = OrganizationGet.model_validate(model.model_dump())
+        return json.dumps(jsonable_encoder(validated)).encode()
+
+    def fast():
+        return orjson.dumps(org)
+
+    results = {}
+    for name, func in (("serialize.legacy", legacy), ("serialize.orjson", fast)):
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        results[name] = {"us_per_op": min(timer.repeat(repeat=5, number=number)) / number * 1e6}
+    return results
+
+
+async def main(args) -> int:
+    from benchmarks._support import make_client, use_database
+    from app.main import app
+    from app.services.organization_service import VIEW_FIELDS, OrganizationService
+    from app.utils.password_handler import PasswordHandler
+
+    PasswordHandler.configure("pbkdf2_sha256", rounds=1000)
+    await use_database()
+    register_legacy_route(app)
+
+    names = [f"CpuOrg{i:04}" for i in range(args.orgs)]
+    for i, name in enumerate(names):
+        await OrganizationService.create_organization(name, f"cpu{i}@example.com", "cpupass123")
+
+    results = {}
+    async with make_client() as client:
+        for label, path in (("get.legacy", "/bench/org/get-legacy"), ("get.fast", "/org/get")):
+            cpu = await cpu_per_request(client, path, names, args.requests)
+            results[label] = {"cpu_us_per_request": cpu * 1e6}
+
+    org = await OrganizationService.get_organization(names[0])
+    results.update(serialization_only({key: org[key] for key in VIEW_FIELDS}))
+    PasswordHandler.shutdown_executor()
+
+    print(f"requests={args.requests} orgs={args.orgs}")
+    for label, stats in results.items():
+        value = stats.get("cpu_us_per_request", stats.get("us_per_op"))
+        print(f"  {label:<18} {value:>9.1f} us")
+    saved = results["get.legacy"]["cpu_us_per_request"] - results["get.fast"]["cpu_us_per_request"]
+    print(f"  fast path saves {saved:.1f} us CPU per request "
+          f"({saved / results['get.legacy']['cpu_us_per_request'] * 100:.0f}%)")
+    return report_baseline(args, results)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    configure_environment()
+    raise SystemExit(asyncio.run(main(args)))
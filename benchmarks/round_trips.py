@@ -0,0 +1,74 @@
+"""Per-call latency of OrganizationService flows at a fixed simulated MongoDB RTT.
+
+    python -m benchmarks.round_trips --rtt-ms 10
+
+Every mongomock collection call is delayed by --rtt-ms, so latency divided
+by the RTT approximates how many round trips sit on each flow's critical
+path. PBKDF2 is cut to 1000 rounds so hashing does not mask the database
+time.
+"""
+import argparse
+import asyncio
+import os
+import time
+from benchmarks._support import add_baseline_arguments, report_baseline, summarize
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rtt-ms", type=float, default=10.0)
+    parser.add_argument("--iterations", type=int, default=20)
+    add_baseline_arguments(parser)
+    return parser.parse_args()
+
+
+async def main(args) -> int:
+    from benchmarks._support import inject_latency, use_database
+    from app.services.name_index import name_index
+    from app.services.organization_service import OrganizationService
+    from app.utils.password_handler import PasswordHandler
+
+    PasswordHandler.configure("pbkdf2_sha256", rounds=1000)
+    await use_database()
+    await name_index.build()
+    inject_latency(args.rtt_ms / 1000)
+
+    samples = {"create": [], "get_miss": [], "view_miss": [], "update": [], "delete": []}
+    for i in range(args.iterations):
+        name, renamed, email = f"RttOrg{i}", f"RttOrgRenamed{i}", f"rtt{i}@example.com"
+
+        start = time.perf_counter()
+        await OrganizationService.create_organization(name, email, "rttpass123")
+        samples["create"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await OrganizationService.get_organization(f"Missing{i}")
+        samples["get_miss"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await OrganizationService.get_organization_view(f"Missing{i}")
+        samples["view_miss"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await OrganizationService.update_organization(name, renamed, email, "rttpass123", email)
+        samples["update"].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await OrganizationService.delete_organization(renamed, email)
+        samples["delete"].append(time.perf_counter() - start)
+
+    results = {}
+    print(f"rtt={args.rtt_ms:.1f}ms iterations={args.iterations}")
+    for flow, flow_samples in samples.items():
+        stats = summarize(flow_samples)
+        stats["round_trips"] = stats["p50_ms"] / args.rtt_ms
+        results[flow] = stats
+        print(f"  {flow:<9} p50={stats['p50_ms']:7.2f}ms p99={stats['p99_ms']:7.2f}ms ~{stats['round_trips']:.1f} RTTs")
+
+    return report_baseline(args, results)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
+    raise SystemExit(asyncio.run(main(args)))
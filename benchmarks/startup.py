@@ -0,0 +1,162 @@
+"""Measure cold start: import-time profile and time to the first request.
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 5 --request create
+    python -m benchmarks.startup --rtt-ms 20             # mongomock with simulated network latency
+    python -m benchmarks.startup --mongodb-url mongodb://localhost:27017   # real mongod
+    python -m benchmarks.startup --save-baseline bench_startup.json
+
+Every run is a fresh interpreter timed from spawn to the first response, in
+three modes: eager (defaults), fast (FAST_STARTUP) and lazy (FAST_STARTUP and
+MONGODB_LAZY_CONNECT). The import profile comes from python -X importtime,
+grouped by top-level package. Without --mongodb-url each child installs a
+mongomock-motor client in place of connect_db; that setup is not timed. Startup
+work is mostly round trips, so compare modes with --rtt-ms or a real server.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+from benchmarks._support import add_baseline_arguments, configure_environment, report_baseline
+
+MODES = {
+    "eager": {},
+    "fast": {"FAST_STARTUP": "true"},
+    "lazy": {"FAST_STARTUP": "true", "MONGODB_LAZY_CONNECT": "true"},
+}
+PHASES = ("interpreter", "import", "startup", "first_request")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="fresh processes per mode; the median is reported")
+    parser.add_argument("--request", choices=["get", "login", "create"], default="get", help="first request to send")
+    parser.add_argument("--modes", default=",".join(MODES), help="comma-separated subset of " + ", ".join(MODES))
+    parser.add_argument("--top", type=int, default=12, help="packages shown in the import profile")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="delay every mongomock call by this round trip")
+    parser.add_argument("--mongodb-url", help="use a real MongoDB instead of mongomock-motor")
+    parser.add_argument("--child", type=float, help=argparse.SUPPRESS)
+    add_baseline_arguments(parser)
+    return parser.parse_args()
+
+
+async def send_first_request(client, request: str):
+    if request == "get":
+        return await client.get("/org/get", params={"organization_name": "StartupProbe"})
+    if request == "login":
+        return await client.post("/admin/login", json={"email": "probe@startup.example.com", "password": "startup123"})
+    body = {"organization_name": f"Startup{os.getpid()}", "email": f"a{os.getpid()}@startup.example.com", "password": "startup123"}
+    return await client.post("/org/create", json=body)
+
+
+async def child(args) -> None:
+    # Runs in the spawned interpreter; args.child is the parent's time.monotonic() at spawn.
+    marks = {"spawned": args.child, "running": time.monotonic()}
+    from app.main import app
+    marks["imported"] = time.monotonic()
+
+    from benchmarks._support import inject_latency, make_client
+    from app.database import Database
+    if not args.mongodb_url:
+        from mongomock_motor import AsyncMongoMockClient
+
+        if args.rtt_ms:
+            inject_latency(args.rtt_ms / 1000)
+
+        async def connect_db(cls):
+            cls.client = AsyncMongoMockClient()
+
+        Database.connect_db = classmethod(connect_db)
+    marks["prepared"] = time.monotonic()
+
+    async with app.router.lifespan_context(app):
+        marks["started"] = time.monotonic()
+        async with make_client() as client:
+            response = await send_first_request(client, args.request)
+        marks["responded"] = time.monotonic()
+
+    print(json.dumps({
+        "status": response.status_code,
+        "interpreter": marks["running"] - marks["spawned"],
+        "import": marks["imported"] - marks["running"],
+        "startup": marks["started"] - marks["prepared"],
+        "first_request": marks["responded"] - marks["started"],
+    }))
+
+
+def child_env(mode: str, mongodb_url: Optional[str]) -> Dict[str, str]:
+    env = dict(os.environ, **MODES[mode])
+    if not mongodb_url:
+        # mongomock-motor does not implement hello, which transaction detection sends.
+        env.setdefault("MONGODB_USE_TRANSACTIONS", "false")
+    return env
+
+
+def run_child(args, mode: str) -> Dict:
+    command = [sys.executable, "-m", "benchmarks.startup", "--request", args.request]
+    if args.mongodb_url:
+        command += ["--mongodb-url", args.mongodb_url]
+    elif args.rtt_ms:
+        command += ["--rtt-ms", repr(args.rtt_ms)]
+    command += ["--child", repr(time.monotonic())]
+    result = subprocess.run(command, env=child_env(mode, args.mongodb_url), capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"{mode} run failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def import_profile(args) -> List:
+    # python -X importtime reports "self | cumulative | indented name" in microseconds.
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        env=child_env("eager", args.mongodb_url),
+        capture_output=True,
+        text=True,
+    )
+    by_package = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        by_package[name.strip().split(".")[0]] += int(self_us) / 1000
+    return sorted(by_package.items(), key=lambda item: item[1], reverse=True)
+
+
+def main(args) -> int:
+    results = {}
+
+    profile = import_profile(args)
+    total_ms = sum(ms for _, ms in profile)
+    results["import_profile"] = {"total_ms": total_ms}
+    print(f"import app.main: {total_ms:.0f}ms self time across {len(profile)} packages")
+    for package, ms in profile[:args.top]:
+        print(f"  {package:<24} {ms:>8.1f}ms {ms / total_ms * 100:>5.1f}%")
+
+    print(f"\nfirst request: {args.request}, median of {args.runs} fresh processes, rtt={args.rtt_ms:.1f}ms")
+    print(f"{'mode':<8} {'interp ms':>10} {'import ms':>10} {'startup ms':>11} {'request ms':>11} {'total ms':>9} {'status':>7}")
+    for mode in args.modes.split(","):
+        runs = [run_child(args, mode) for _ in range(args.runs)]
+        stats = {f"{phase}_ms": statistics.median(run[phase] for run in runs) * 1000 for phase in PHASES}
+        stats["total_ms"] = statistics.median(sum(run[phase] for phase in PHASES) for run in runs) * 1000
+        results[mode] = stats
+        print(
+            f"{mode:<8} {stats['interpreter_ms']:>10.1f} {stats['import_ms']:>10.1f} {stats['startup_ms']:>11.1f} "
+            f"{stats['first_request_ms']:>11.1f} {stats['total_ms']:>9.1f} {runs[-1]['status']:>7}"
+        )
+
+    return report_baseline(args, results)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    configure_environment(args.mongodb_url)
+    if args.child is not None:
+        asyncio.run(child(args))
+    else:
+        raise SystemExit(main(args))
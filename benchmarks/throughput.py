@@ -0,0 +1,234 @@
+"""Compare HTTP throughput of one server worker with N pre-forked workers.
+
+    python -m benchmarks.throughput                          # 1 worker vs one per core
+    python -m benchmarks.throughput --workers 1,2,4 --duration 15
+    python -m benchmarks.throughput --mix get=50,login=50 --client-processes 4
+    python -m benchmarks.throughput --mongodb-url mongodb://localhost:27017   # real mongod
+    python -m benchmarks.throughput --save-baseline bench_throughput.json
+
+For each worker count, python -m app.server is started on a free local port
+and driven over real HTTP keep-alive connections by --client-processes load
+generator processes, each running --concurrency requests at a time. Requests in
+the first --warmup seconds are not counted. The server is then sent SIGTERM and
+the time it takes to drain is reported. Load generators share the machine's
+cores with the server, so keep them few.
+
+Without --mongodb-url every worker has its own mongomock-motor database, seeded
+with the same organization at startup, so only get and login are offered.
+"""
+import argparse
+import asyncio
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+from benchmarks._support import add_baseline_arguments, configure_environment, report_baseline, summarize
+
+OPERATIONS = ("get", "login")
+SEED = {"organization_name": "Throughput", "email": "bench@throughput.example.com", "password": "throughput123"}
+
+
+def parse_mix(value: str) -> Dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}; choose from {', '.join(OPERATIONS)}")
+        mix[name] = int(weight or 1)
+    return mix
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", help="comma-separated worker counts (default: 1 and one per core)")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds of measured load per worker count")
+    parser.add_argument("--warmup", type=float, default=2.0, help="seconds of unmeasured load first")
+    parser.add_argument("--concurrency", type=int, default=32, help="requests in flight per client process")
+    parser.add_argument("--client-processes", type=int, default=2)
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("get=80,login=20"))
+    parser.add_argument("--mongodb-url", help="use a real MongoDB instead of mongomock-motor")
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    add_baseline_arguments(parser)
+    return parser.parse_args()
+
+
+def serve(args) -> int:
+    # Runs in the server subprocess: the launcher with an in-memory database per worker.
+    from app.server import main as run_server
+
+    if not args.mongodb_url:
+        from mongomock_motor import AsyncMongoMockClient
+        from app.database import Database
+        from app.services.organization_service import OrganizationService
+
+        async def connect_db(cls):
+            cls.client = AsyncMongoMockClient()
+            await OrganizationService.create_organization(**SEED)
+
+        Database.connect_db = classmethod(connect_db)
+    return run_server(argparse.Namespace(host="127.0.0.1", port=args.port, workers=int(args.workers)))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args, workers: int, port: int) -> subprocess.Popen:
+    command = [sys.executable, "-m", "benchmarks.throughput", "--serve", "--workers", str(workers), "--port", str(port)]
+    env = dict(os.environ, SERVER_ACCESS_LOG="false")
+    if args.mongodb_url:
+        command += ["--mongodb-url", args.mongodb_url]
+    else:
+        # mongomock-motor does not implement hello, which transaction detection sends.
+        env.setdefault("MONGODB_USE_TRANSACTIONS", "false")
+    return subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+
+async def wait_until_live(base_url: str, server: subprocess.Popen, timeout: float = 60.0) -> None:
+    import httpx
+
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            if server.poll() is not None:
+                raise RuntimeError(f"server exited during startup:\n{server.stderr.read()}")
+            try:
+                if (await client.get("/health/live")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("server did not become live in time")
+
+
+async def drive(base_url: str, mix: Dict[str, int], concurrency: int, warmup: float, duration: float) -> Tuple[Dict, Dict]:
+    import httpx
+
+    operations = [name for name, weight in mix.items() for _ in range(weight)]
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    measure_from = time.monotonic() + warmup
+    stop_at = measure_from + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        async def request(operation: str):
+            if operation == "get":
+                return await client.get("/org/get", params={"organization_name": SEED["organization_name"]})
+            return await client.post("/admin/login", json={"email": SEED["email"], "password": SEED["password"]})
+
+        async def worker():
+            while time.monotonic() < stop_at:
+                operation = random.choice(operations)
+                start = time.monotonic()
+                try:
+                    ok = (await request(operation)).status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if start >= measure_from:
+                    latencies[operation].append(time.monotonic() - start)
+                    if not ok:
+                        errors[operation] += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return dict(latencies), dict(errors)
+
+
+def run_client(base_url: str, mix: Dict[str, int], concurrency: int, warmup: float, duration: float) -> Tuple[Dict, Dict]:
+    return asyncio.run(drive(base_url, mix, concurrency, warmup, duration))
+
+
+async def seed_shared_database(base_url: str) -> None:
+    import httpx
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=30.0) as client:
+        response = await client.post("/org/create", json=SEED)
+        if response.status_code not in (201, 400):
+            raise RuntimeError(f"seeding failed: {response.status_code} {response.text}")
+
+
+def measure(args, workers: int) -> Dict[str, float]:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server(args, workers, port)
+    try:
+        asyncio.run(wait_until_live(base_url, server))
+        if args.mongodb_url:
+            asyncio.run(seed_shared_database(base_url))
+
+        with ProcessPoolExecutor(max_workers=args.client_processes) as pool:
+            futures = [
+                pool.submit(run_client, base_url, args.mix, args.concurrency, args.warmup, args.duration)
+                for _ in range(args.client_processes)
+            ]
+            outcomes = [future.result() for future in futures]
+    finally:
+        stopping = time.monotonic()
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=120)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+        drain_seconds = time.monotonic() - stopping
+
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    for client_latencies, client_errors in outcomes:
+        for operation, samples in client_latencies.items():
+            latencies[operation].extend(samples)
+        for operation, count in client_errors.items():
+            errors[operation] += count
+
+    samples = [sample for operation_samples in latencies.values() for sample in operation_samples]
+    stats = {
+        "throughput_rps": len(samples) / args.duration,
+        "errors": sum(errors.values()),
+        "drain_s": drain_seconds,
+        **{key: value for key, value in summarize(samples).items() if key != "count"},
+    }
+    for operation in OPERATIONS:
+        if latencies.get(operation):
+            stats[f"{operation}_p95_ms"] = summarize(latencies[operation])["p95_ms"]
+    return stats
+
+
+def main(args) -> int:
+    from app.server import available_cpus
+
+    cores = available_cpus()
+    counts = [int(count) for count in args.workers.split(",")] if args.workers else sorted({1, cores})
+    mix = ",".join(f"{name}={weight}" for name, weight in args.mix.items())
+    print(f"available cores: {cores}, mix: {mix}, {args.client_processes} client processes x {args.concurrency} concurrent")
+    if cores == 1:
+        print("Only one core is available; extra workers cannot add throughput here.")
+
+    results = {}
+    print(f"{'workers':>7} {'req/s':>9} {'speedup':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7} {'drain s':>8}")
+    for workers in counts:
+        stats = measure(args, workers)
+        results[f"workers_{workers}"] = stats
+        speedup = stats["throughput_rps"] / max(results[f"workers_{counts[0]}"]["throughput_rps"], 1e-9)
+        print(
+            f"{workers:>7} {stats['throughput_rps']:>9.1f} {speedup:>7.2f}x {stats['p50_ms']:>8.2f} "
+            f"{stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f} {stats['errors']:>7} {stats['drain_s']:>8.2f}"
+        )
+
+    return report_baseline(args, results)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    configure_environment(args.mongodb_url)
+    if args.serve:
+        raise SystemExit(serve(args))
+    raise SystemExit(main(args))
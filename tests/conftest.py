@@ -0,0 +1,63 @@
+import asyncio
+import os
+
+# Settings are read at import time; mongomock-motor has no hello for transaction detection.
+os.environ.setdefault("MONGODB_USE_TRANSACTIONS", "false")
+os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+os.environ.setdefault("USAGE_TRACKING_ENABLED", "false")
+
+import httpx
+import pytest
+from mongomock_motor import AsyncMongoMockClient
+from app.database import Database
+from app.main import app
+from app.services.name_index import name_index
+from app.services.organization_service import OrganizationService
+from app.services.revocation_list import revocation_list
+from app.utils.password_handler import PasswordHandler
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    PasswordHandler.configure("pbkdf2_sha256", rounds=1000)
+
+
+@pytest.fixture
+def run():
+    # One event loop per test; mongomock-motor clients are not bound to a loop.
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def database(run):
+    Database.client = AsyncMongoMockClient()
+    Database.shard_clients = {}
+    Database.supports_transactions = False
+    run(Database.ensure_indexes())
+    OrganizationService.clear_caches()
+    name_index.organizations.bloom = None
+    name_index.admin_emails.bloom = None
+    name_index._synced_at = None
+    name_index.organizations.forget_misses()
+    name_index.admin_emails.forget_misses()
+    revocation_list._revoked.clear()
+    yield Database
+    Database.client = None
+
+
+@pytest.fixture
+def client(database):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+async def create_and_login(client, organization_name: str, email: str, password: str = "secret123") -> dict:
+    response = await client.post(
+        "/org/create",
+        json={"organization_name": organization_name, "email": email, "password": password},
+    )
+    assert response.status_code == 201, response.text
+    response = await client.post("/admin/login", json={"email": email, "password": password})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
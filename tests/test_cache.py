@@ -0,0 +1,75 @@
+from app.services.organization_service import OrganizationService
+from app.utils import cache as cache_module
+from app.utils.cache import TTLCache
+from .conftest import create_and_login
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    cache = TTLCache(max_size=10, ttl_seconds=5)
+
+    cache.set("a", 1)
+    cache.set("b", 2, ttl_seconds=20)
+    assert cache.get("a") == 1
+    clock.now += 5
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.stats() == {"size": 1, "max_size": 10, "hits": 2, "misses": 1, "evictions": 0}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.evictions == 1
+
+
+def test_invalidate_and_disabled_cache():
+    cache = TTLCache(max_size=10, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.invalidate("a", "missing")
+    assert (cache.get("a"), cache.get("b")) == (None, 2)
+
+    disabled = TTLCache(max_size=0, ttl_seconds=60)
+    disabled.set("a", 1)
+    assert disabled.get("a") is None and len(disabled) == 0
+
+
+def test_rename_invalidates_cached_organization(client, run):
+    async def scenario():
+        headers = await create_and_login(client, "Lambda Corp", "admin@lambda.example.com")
+        org = await OrganizationService.get_organization("Lambda Corp")
+        hits = OrganizationService.cache_stats()["hits"]
+        assert await OrganizationService.get_organization("Lambda Corp") == org
+        assert OrganizationService.cache_stats()["hits"] == hits + 1
+
+        response = await client.put(
+            "/org/update",
+            params={"old_organization_name": "Lambda Corp"},
+            json={"organization_name": "Mu Corp", "email": "admin@lambda.example.com", "password": "secret456"},
+            headers=headers,
+        )
+        assert response.status_code == 202, response.text
+
+        assert await OrganizationService.get_organization("Lambda Corp") is None
+        renamed = await OrganizationService.get_organization("Mu Corp")
+        assert renamed["_id"] == org["_id"] and renamed["collection_name"] == "org_mu_corp"
+        response = await client.get("/org/get", params={"organization_name": "Lambda Corp"})
+        assert response.status_code == 404, response.text
+
+    run(scenario())
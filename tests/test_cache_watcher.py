@@ -0,0 +1,91 @@
+from datetime import datetime
+from app.database import db
+from app.services.cache_watcher import cache_watcher
+from app.services.name_index import name_index
+from app.services.organization_service import OrganizationService
+
+
+async def insert_from_other_worker(organization_name: str, email: str) -> None:
+    now = datetime.utcnow()
+    await db.get_master_db().organizations.insert_one(
+        {
+            "organization_name": organization_name,
+            "collection_name": f"org_{organization_name.lower()}",
+            "admin_email": email,
+            "created_at": now,
+            "updated_at": now,
+        }
+    )
+
+
+def test_poll_makes_other_workers_creates_visible(database, run):
+    async def scenario():
+        await name_index.build()
+        cache_watcher._version = None
+        await cache_watcher.poll_once()
+
+        await insert_from_other_worker("Zeta", "admin@zeta.example.com")
+        assert await OrganizationService.get_organization_view("Zeta") is None
+
+        await cache_watcher.poll_once()
+        org = await OrganizationService.get_organization_view("Zeta")
+        assert org is not None and org["admin_email"] == "admin@zeta.example.com"
+
+    run(scenario())
+
+
+def test_poll_forgets_cached_misses_without_filters(database, run):
+    async def scenario():
+        cache_watcher._version = None
+        await cache_watcher.poll_once()
+        assert await OrganizationService.get_organization_view("Theta") is None
+
+        await insert_from_other_worker("Theta", "admin@theta.example.com")
+        await cache_watcher.poll_once()
+        assert await OrganizationService.get_organization_view("Theta") is not None
+
+    run(scenario())
+
+
+def cached(organization_name: str) -> bool:
+    return OrganizationService._org_cache.get(organization_name) is not None
+
+
+def test_admin_change_evicts_the_admins_organization(database, run):
+    async def scenario():
+        await insert_from_other_worker("Zeta", "admin@zeta.example.com")
+        await insert_from_other_worker("Eta", "admin@eta.example.com")
+        await OrganizationService.get_organization("Zeta")
+        await OrganizationService.get_organization("Eta")
+        assert cached("Zeta") and cached("Eta")
+
+        cache_watcher.apply_change(
+            {
+                "operationType": "update",
+                "ns": {"coll": "admins"},
+                "fullDocument": {"email": "new@zeta.example.com", "organization_name": "Zeta"},
+            }
+        )
+        assert not cached("Zeta") and cached("Eta")
+        assert name_index.admin_emails.might_exist("new@zeta.example.com")
+
+    run(scenario())
+
+
+def test_rename_change_evicts_both_names(database, run):
+    async def scenario():
+        await insert_from_other_worker("Zeta", "admin@zeta.example.com")
+        await insert_from_other_worker("Eta", "admin@eta.example.com")
+        for name in ("Zeta", "Eta"):
+            await OrganizationService.get_organization(name)
+
+        cache_watcher.apply_change(
+            {
+                "operationType": "update",
+                "ns": {"coll": "organizations"},
+                "fullDocument": {"organization_name": "Eta", "renamed_from": "Zeta", "admin_email": "admin@zeta.example.com"},
+            }
+        )
+        assert not cached("Zeta") and not cached("Eta")
+
+    run(scenario())
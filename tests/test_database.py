@@ -0,0 +1,24 @@
+import pytest
+
+from app.database import Database
+
+
+def test_transaction_fallback_runs_writes_in_order_and_stops_at_first_failure(database, run):
+    calls = []
+
+    def write(name, fail=False):
+        async def run_write(session):
+            assert session is None
+            calls.append(name)
+            if fail:
+                raise ValueError(name)
+            return name
+
+        return run_write
+
+    assert run(Database.run_in_transaction(write("first"), write("second"))) == ["first", "second"]
+
+    calls.clear()
+    with pytest.raises(ValueError):
+        run(Database.run_in_transaction(write("first"), write("second", fail=True), write("third")))
+    assert calls == ["first", "second"]
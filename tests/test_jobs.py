@@ -0,0 +1,141 @@
+import asyncio
+from datetime import datetime, timedelta
+import pytest
+from bson import ObjectId
+from app.config import get_settings
+from app.database import db
+from app.services.job_service import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, JobService
+from app.services import job_worker as job_worker_module
+from app.services.job_worker import JobWorker
+
+settings = get_settings()
+
+
+@pytest.fixture
+def worker(database, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_MAX_RUNNING", 10)
+    monkeypatch.setattr(settings, "JOB_MAX_PER_TENANT", 1)
+    monkeypatch.setattr(settings, "JOB_MAX_ATTEMPTS", 2)
+    worker = JobWorker()
+    worker.worker_id = "test-worker"
+    return worker
+
+
+def register(monkeypatch, handler):
+    monkeypatch.setitem(job_worker_module.JOB_HANDLERS, "test", handler)
+
+
+async def job(job_id):
+    return await db.get_master_db().jobs.find_one({"_id": ObjectId(job_id)})
+
+
+def test_claims_oldest_job_and_respects_tenant_limit(worker, run):
+    async def scenario():
+        first = await JobService.enqueue("test", "tenant-a", "A", {})
+        second = await JobService.enqueue("test", "tenant-a", "A", {})
+        other = await JobService.enqueue("test", "tenant-b", "B", {})
+
+        claimed = await worker.claim()
+        assert str(claimed["_id"]) == first
+        assert (claimed["status"], claimed["owner"], claimed["attempts"]) == (JOB_RUNNING, "test-worker", 1)
+
+        # tenant-a already runs a job, so its second one waits behind tenant-b's.
+        claimed = await worker.claim()
+        assert str(claimed["_id"]) == other
+        assert await worker.claim() is None
+        assert (await JobService.get_job(second))["status"] == JOB_QUEUED
+
+    run(scenario())
+
+
+def test_running_job_heartbeats_progress(worker, run, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_HEARTBEAT_SECONDS", 0.01)
+    seen = []
+
+    async def handler(job, progress):
+        progress["total"] = 2
+        progress["done"] = 1
+        await asyncio.sleep(0.05)
+        seen.append(await db.get_master_db().jobs.find_one({"_id": job["_id"]}))
+        progress["done"] = 2
+
+    register(monkeypatch, handler)
+
+    async def scenario():
+        await JobService.enqueue("test", "tenant-a", "A", {})
+        claimed = await worker.claim()
+        await worker.run_job(claimed)
+
+        assert seen[0]["progress"] == {"done": 1, "total": 2}
+        assert seen[0]["heartbeat_at"] > claimed["heartbeat_at"]
+        finished = await job(claimed["_id"])
+        assert (finished["status"], finished["progress"]) == (JOB_SUCCEEDED, {"done": 2, "total": 2})
+        assert finished["finished_at"] is not None
+
+    run(scenario())
+
+
+def test_failed_job_is_retried_then_marked_failed(worker, run, monkeypatch):
+    async def handler(job, progress):
+        raise RuntimeError("boom")
+
+    register(monkeypatch, handler)
+
+    async def scenario():
+        job_id = await JobService.enqueue("test", "tenant-a", "A", {})
+        await worker.run_job(await worker.claim())
+        retried = await JobService.get_job(job_id)
+        assert (retried["status"], retried["attempts"], retried["error"]) == (JOB_QUEUED, 1, "boom")
+
+        await worker.run_job(await worker.claim())
+        failed = await JobService.get_job(job_id)
+        assert (failed["status"], failed["attempts"]) == (JOB_FAILED, 2)
+        assert await worker.claim() is None
+
+    run(scenario())
+
+
+def test_cancelled_job_is_requeued_without_spending_an_attempt(worker, run, monkeypatch):
+    started = asyncio.Event()
+
+    async def handler(job, progress):
+        started.set()
+        await asyncio.sleep(60)
+
+    register(monkeypatch, handler)
+
+    async def scenario():
+        job_id = await JobService.enqueue("test", "tenant-a", "A", {})
+        task = asyncio.create_task(worker.run_job(await worker.claim()))
+        await started.wait()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        requeued = await job(job_id)
+        assert (requeued["status"], requeued["owner"], requeued["attempts"]) == (JOB_QUEUED, None, 0)
+        assert worker.running == 0
+
+    run(scenario())
+
+
+def test_stale_jobs_are_requeued_or_failed(worker, run, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_STALE_SECONDS", 30)
+
+    async def scenario():
+        jobs = db.get_master_db().jobs
+        stale = datetime.utcnow() - timedelta(seconds=60)
+        retry_id = await JobService.enqueue("test", "tenant-a", "A", {})
+        exhausted_id = await JobService.enqueue("test", "tenant-b", "B", {})
+        live_id = await JobService.enqueue("test", "tenant-c", "C", {})
+        running = [(retry_id, stale, 1), (exhausted_id, stale, 2), (live_id, datetime.utcnow(), 1)]
+        for job_id, heartbeat_at, attempts in running:
+            await jobs.update_one(
+                {"_id": ObjectId(job_id)},
+                {"$set": {"status": JOB_RUNNING, "owner": "gone", "heartbeat_at": heartbeat_at, "attempts": attempts}},
+            )
+
+        await worker.requeue_stale_jobs()
+        statuses = [(await JobService.get_job(job_id))["status"] for job_id in (retry_id, exhausted_id, live_id)]
+        assert statuses == [JOB_QUEUED, JOB_FAILED, JOB_RUNNING]
+
+    run(scenario())
@@ -0,0 +1,34 @@
+from datetime import timedelta
+from app.utils.jwt_handler import JWTHandler
+
+
+def test_verified_token_is_decoded_once(monkeypatch):
+    JWTHandler._token_cache.clear()
+    decodes = []
+    decode = JWTHandler.backend.decode
+
+    def counting_decode(token, key, algorithms):
+        decodes.append(token)
+        return decode(token, key, algorithms)
+
+    monkeypatch.setattr(JWTHandler.backend, "decode", counting_decode)
+    token = JWTHandler.create_access_token({"sub": "admin@nu.example.com"})
+
+    first = JWTHandler.decode_token(token)
+    first["sub"] = "changed"
+    second = JWTHandler.decode_token(token)
+
+    assert second["sub"] == "admin@nu.example.com"
+    assert decodes == [token]
+    assert JWTHandler.cache_stats()["hits"] >= 1
+
+
+def test_invalid_and_expired_tokens_are_not_cached():
+    JWTHandler._token_cache.clear()
+    token = JWTHandler.create_access_token({"sub": "admin@nu.example.com"})
+    tampered = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+    expired = JWTHandler.create_access_token({"sub": "admin@nu.example.com"}, timedelta(seconds=-1))
+
+    assert JWTHandler.decode_token(tampered) is None
+    assert JWTHandler.decode_token(expired) is None
+    assert len(JWTHandler._token_cache) == 0
@@ -0,0 +1,39 @@
+import re
+
+from app.utils.metrics import MetricsRegistry
+
+
+def metric_types(text: str) -> dict:
+    return dict(re.findall(r"^# TYPE (\S+) (\S+)$", text, re.MULTILINE))
+
+
+def test_counter_callback_renders_as_counter():
+    registry = MetricsRegistry()
+    registry.counter_callback("widget_events_total", "Widget events.", ("event",), lambda: {("made",): 3})
+    registry.gauge_callback("widget_queue", "Widgets queued.", (), lambda: {(): 1})
+
+    text = registry.render()
+    assert metric_types(text) == {"widget_events_total": "counter", "widget_queue": "gauge"}
+    assert 'widget_events_total{event="made"} 3' in text
+
+
+def test_running_totals_are_exported_as_counters(client, run):
+    async def scenario():
+        response = await client.get("/metrics")
+        assert response.status_code == 200
+        types = metric_types(response.text)
+
+        for name in (
+            "app_cache_hits_total",
+            "app_cache_misses_total",
+            "app_cache_evictions_total",
+            "mongo_pool_events_total",
+            "name_filter_rejections_total",
+        ):
+            assert types[name] == "counter", name
+        assert types["app_cache_size"] == "gauge"
+        assert types["mongo_pool"] == "gauge"
+        assert all(name.endswith("_total") for name, kind in types.items() if kind == "counter")
+        assert 'mongo_pool_events_total{event="checkout_wait_seconds"}' in response.text
+
+    run(scenario())
@@ -0,0 +1,61 @@
+from app.services.name_index import NameFilter, name_index
+from app.services.organization_service import OrganizationService
+from app.utils.bloom import BloomFilter
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    members = [f"org-{i}" for i in range(2000)]
+    for key in members:
+        bloom.add(key)
+
+    assert all(key in bloom for key in members)
+    false_positives = sum(f"absent-{i}" in bloom for i in range(20000))
+    assert false_positives / 20000 < 0.03
+
+
+def test_negative_cache_and_bloom_rejections():
+    names = NameFilter("organization_name")
+    assert names.might_exist("Omicron")
+
+    names.record_lookup("Omicron", found=False)
+    assert not names.might_exist("Omicron")
+    names.add("Omicron")
+    assert names.might_exist("Omicron")
+
+    names.bloom = BloomFilter(capacity=100, error_rate=0.01)
+    names.add("Pi")
+    assert names.might_exist("Pi")
+    assert not names.might_exist("Rho")
+    assert names.stats()["bloom_rejections"] == 1
+
+
+def test_lookups_of_absent_names_skip_the_database(database, run, monkeypatch):
+    async def scenario():
+        await OrganizationService.create_organization("Sigma Corp", "admin@sigma.example.com", "secret123")
+        await name_index.build()
+
+        queries = []
+        # Motor collections share one class, so this counts organizations and admins lookups.
+        collection_class = type(database.get_master_db().organizations)
+        find_one = collection_class.find_one
+
+        def counting_find_one(self, *args, **kwargs):
+            queries.append(args[0])
+            return find_one(self, *args, **kwargs)
+
+        monkeypatch.setattr(collection_class, "find_one", counting_find_one)
+        assert not await OrganizationService.organization_exists("Tau Corp")
+        assert not await OrganizationService.admin_exists("admin@tau.example.com")
+        assert queries == []
+
+        OrganizationService.clear_caches()
+        assert await OrganizationService.organization_exists("Sigma Corp")
+        assert await OrganizationService.admin_exists("admin@sigma.example.com")
+        assert len(queries) == 2
+
+        # Names created after the build are added to the filters as they are written.
+        await OrganizationService.create_organization("Tau Corp", "admin@tau.example.com", "secret123")
+        assert await OrganizationService.organization_exists("Tau Corp")
+
+    run(scenario())
@@ -0,0 +1,39 @@
+from pymongo.errors import WriteError
+from app.database import Database, db
+from app.services.organization_service import OrganizationService
+
+
+class FailingCollection:
+    async def insert_one(self, document):
+        raise WriteError("collection is unavailable")
+
+
+def test_failed_metadata_insert_is_reported_per_item(database, run, monkeypatch):
+    get_org_collection = Database.get_org_collection
+
+    def org_collection(cls, collection_name, shard=None):
+        if collection_name == "org_kappa_broken":
+            return FailingCollection()
+        return get_org_collection(collection_name, shard)
+
+    monkeypatch.setattr(Database, "get_org_collection", classmethod(org_collection))
+
+    async def scenario():
+        items = [
+            {"organization_name": "Kappa Works", "email": "admin@kappa-works.example.com", "password": "secret123"},
+            {"organization_name": "Kappa Broken", "email": "admin@kappa-broken.example.com", "password": "secret123"},
+        ]
+        results = [result async for result in OrganizationService.bulk_create_organizations(items)]
+
+        assert [(result["organization_name"], result["status"]) for result in results] == [
+            ("Kappa Works", "created"),
+            ("Kappa Broken", "error"),
+        ]
+        assert results[1]["detail"] == "collection is unavailable"
+
+        master_db = db.get_master_db()
+        assert await master_db.organizations.count_documents({"organization_name": "Kappa Broken"}) == 0
+        assert await master_db.admins.count_documents({"email": "admin@kappa-broken.example.com"}) == 0
+        assert await master_db.organizations.count_documents({"organization_name": "Kappa Works"}) == 1
+
+    run(scenario())
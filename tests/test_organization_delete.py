@@ -0,0 +1,96 @@
+from app.database import db
+from app.services.job_worker import drop_collections_job, job_worker
+from app.services.organization_service import OrganizationService
+from .conftest import create_and_login
+
+
+async def run_queued_jobs():
+    job_worker.worker_id = "test"
+    while True:
+        job = await job_worker.claim()
+        if job is None:
+            return
+        await job_worker.run_job(job)
+
+
+def test_name_is_reserved_until_drop_job_finishes(client, run):
+    async def scenario():
+        old_headers = await create_and_login(client, "Alpha Corp", "old-admin@alpha.example.com")
+        response = await client.post("/tenant/documents", json={"documents": [{"owner": "old"}]}, headers=old_headers)
+        assert response.status_code == 201, response.text
+
+        response = await client.delete("/org/delete", params={"organization_name": "Alpha Corp"}, headers=old_headers)
+        assert response.status_code == 202, response.text
+        assert await OrganizationService.collection_name_taken("org_alpha_corp")
+
+        response = await client.post(
+            "/org/create",
+            json={"organization_name": "Alpha Corp", "email": "new-admin@alpha.example.com", "password": "secret123"},
+        )
+        assert response.status_code == 400, response.text
+
+        await run_queued_jobs()
+        assert not await OrganizationService.collection_name_taken("org_alpha_corp")
+
+        new_headers = await create_and_login(client, "Alpha Corp", "new-admin@alpha.example.com")
+        response = await client.get("/tenant/documents", headers=new_headers)
+        assert response.status_code == 200, response.text
+        assert response.json()["documents"] == []
+
+        response = await client.post("/tenant/documents", json={"documents": [{"owner": "new"}]}, headers=new_headers)
+        assert response.status_code == 201, response.text
+        await run_queued_jobs()
+        assert await db.get_org_collection("org_alpha_corp").count_documents({"owner": {"$exists": True}}) == 1
+
+    run(scenario())
+
+
+def test_bulk_create_skips_names_with_pending_drop(client, run):
+    async def scenario():
+        headers = await create_and_login(client, "Beta Corp", "admin@beta.example.com")
+        response = await client.delete("/org/delete", params={"organization_name": "Beta Corp"}, headers=headers)
+        assert response.status_code == 202, response.text
+
+        results = [
+            result
+            async for result in OrganizationService.bulk_create_organizations(
+                [{"organization_name": "Beta Corp", "email": "other@beta.example.com", "password": "secret123"}]
+            )
+        ]
+        assert [result["status"] for result in results] == ["error"]
+
+    run(scenario())
+
+
+def test_drop_job_skips_referenced_collection(database, run):
+    async def scenario():
+        await OrganizationService.create_organization("Gamma Corp", "admin@gamma.example.com", "secret123")
+        await db.get_org_collection("org_gamma_corp").insert_one({"kept": True})
+
+        progress = {"done": 0}
+        await drop_collections_job({"_id": "test", "params": {"collection_names": ["org_gamma_corp"]}}, progress)
+
+        assert progress == {"total": 1, "done": 1}
+        assert await db.get_org_collection("org_gamma_corp").count_documents({"kept": True}) == 1
+
+    run(scenario())
+
+
+def test_stale_token_cannot_reach_recreated_organization(client, run):
+    async def scenario():
+        old_headers = await create_and_login(client, "Delta Corp", "old-admin@delta.example.com")
+        response = await client.delete("/org/delete", params={"organization_name": "Delta Corp"}, headers=old_headers)
+        assert response.status_code == 202, response.text
+        await run_queued_jobs()
+
+        new_headers = await create_and_login(client, "Delta Corp", "new-admin@delta.example.com")
+        response = await client.post("/tenant/documents", json={"documents": [{"secret": True}]}, headers=new_headers)
+        assert response.status_code == 201, response.text
+
+        # The deleting session is kept so it can poll the job, but its token names the old organization.
+        response = await client.get("/tenant/documents", headers=old_headers)
+        assert response.status_code == 404, response.text
+        response = await client.post("/tenant/documents", json={"documents": [{"stale": True}]}, headers=old_headers)
+        assert response.status_code == 404, response.text
+
+    run(scenario())
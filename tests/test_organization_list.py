@@ -0,0 +1,46 @@
+from app.config import get_settings
+from .conftest import create_and_login
+
+settings = get_settings()
+
+OPERATOR_KEY = "operator-test-key"
+
+
+def test_tenant_admin_cannot_list_other_tenants(client, run, monkeypatch):
+    monkeypatch.setattr(settings, "OPERATOR_API_KEY", OPERATOR_KEY)
+
+    async def scenario():
+        await create_and_login(client, "Epsilon Corp", "admin@epsilon.example.com")
+        # Self-signup gives anyone an admin token; it must not open the listing.
+        headers = await create_and_login(client, "Snoop Corp", "admin@snoop.example.com")
+
+        for params in ({"admin_email": "admin@epsilon.example.com"}, {"format": "ndjson"}):
+            response = await client.get("/org/list", params=params)
+            assert response.status_code == 403, response.text
+            response = await client.get("/org/list", params=params, headers=headers)
+            assert response.status_code == 403, response.text
+            response = await client.get("/org/list", params=params, headers={"X-Operator-Key": "wrong"})
+            assert response.status_code == 403, response.text
+
+        response = await client.get(
+            "/org/list",
+            params={"fields": "organization_name,admin_email"},
+            headers={"X-Operator-Key": OPERATOR_KEY},
+        )
+        assert response.status_code == 200, response.text
+        assert response.json()["organizations"] == [
+            {"organization_name": "Epsilon Corp", "admin_email": "admin@epsilon.example.com"},
+            {"organization_name": "Snoop Corp", "admin_email": "admin@snoop.example.com"},
+        ]
+
+    run(scenario())
+
+
+def test_list_is_closed_without_operator_key(client, run, monkeypatch):
+    monkeypatch.setattr(settings, "OPERATOR_API_KEY", None)
+
+    async def scenario():
+        response = await client.get("/org/list", headers={"X-Operator-Key": ""})
+        assert response.status_code == 403, response.text
+
+    run(scenario())
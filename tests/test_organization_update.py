@@ -0,0 +1,87 @@
+import asyncio
+from app.database import db
+from app.services.organization_service import OrganizationService
+from .conftest import create_and_login
+
+
+def test_concurrent_renames_to_one_name_leave_loser_untouched(client, run):
+    async def scenario():
+        alpha = await create_and_login(client, "Alpha", "a@alpha.example.com")
+        beta = await create_and_login(client, "Beta", "b@beta.example.com")
+        hashes = {admin["email"]: admin["hashed_password"] async for admin in db.get_master_db().admins.find({})}
+
+        responses = await asyncio.gather(
+            client.put(
+                "/org/update",
+                params={"old_organization_name": "Alpha"},
+                json={"organization_name": "Gamma", "email": "a@alpha.example.com", "password": "newsecret1"},
+                headers=alpha,
+            ),
+            client.put(
+                "/org/update",
+                params={"old_organization_name": "Beta"},
+                json={"organization_name": "Gamma", "email": "b@beta.example.com", "password": "newsecret2"},
+                headers=beta,
+            ),
+        )
+        assert sorted(response.status_code for response in responses) == [202, 400], [r.text for r in responses]
+        assert "New organization name already exists" in [r.json()["detail"] for r in responses if r.status_code == 400]
+        if responses[0].status_code == 202:
+            winner, loser, loser_email = "a@alpha.example.com", "Beta", "b@beta.example.com"
+        else:
+            winner, loser, loser_email = "b@beta.example.com", "Alpha", "a@alpha.example.com"
+
+        master_db = db.get_master_db()
+        gamma = await master_db.organizations.find_one({"organization_name": "Gamma"})
+        assert gamma["admin_email"] == winner
+        assert await master_db.organizations.count_documents({"organization_name": loser}) == 1
+        admin = await master_db.admins.find_one({"email": loser_email})
+        assert admin["organization_name"] == loser
+        assert admin["hashed_password"] == hashes[loser_email]
+        assert not await OrganizationService.admin_belongs_to(loser_email, "Gamma")
+
+    run(scenario())
+
+
+def test_failed_admin_update_restores_renamed_organization(client, run):
+    async def scenario():
+        alpha = await create_and_login(client, "Alpha", "a@alpha.example.com")
+        await create_and_login(client, "Beta", "b@beta.example.com")
+
+        # The admin update hits the unique email index after the rename committed.
+        response = await client.put(
+            "/org/update",
+            params={"old_organization_name": "Alpha"},
+            json={"organization_name": "Delta", "email": "b@beta.example.com", "password": "newsecret1"},
+            headers=alpha,
+        )
+        assert response.status_code == 400, response.text
+        assert response.json()["detail"] == "Admin email already registered"
+
+        master_db = db.get_master_db()
+        alpha_org = await master_db.organizations.find_one({"organization_name": "Alpha"})
+        assert alpha_org["collection_name"] == "org_alpha"
+        assert alpha_org["admin_email"] == "a@alpha.example.com"
+        assert "migrating_from" not in alpha_org and "renamed_from" not in alpha_org
+        assert await master_db.organizations.count_documents({"organization_name": "Delta"}) == 0
+        assert await master_db.jobs.count_documents({}) == 0
+        assert await OrganizationService.admin_belongs_to("a@alpha.example.com", "Alpha")
+
+    run(scenario())
+
+
+def test_delete_of_organization_deleted_meanwhile_leaves_admins(client, run):
+    async def scenario():
+        await create_and_login(client, "Alpha", "a@alpha.example.com")
+        org = await OrganizationService.get_organization("Alpha")
+        master_db = db.get_master_db()
+        await master_db.organizations.delete_one({"organization_name": "Alpha"})
+
+        # The cached organization still passes the checks; the delete must not match.
+        assert await OrganizationService.get_organization("Alpha") == org
+        result = await OrganizationService.delete_organization("Alpha", "a@alpha.example.com")
+        assert result == {"deleted": False, "job_id": None}
+        assert await master_db.admins.count_documents({"email": "a@alpha.example.com"}) == 1
+        assert await master_db.jobs.count_documents({}) == 0
+
+    run(scenario())
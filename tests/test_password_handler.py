@@ -0,0 +1,69 @@
+import pytest
+
+from app.database import db
+from app.services.auth_service import AuthService
+from app.utils.password_handler import PasswordHandler, build_context
+from .conftest import create_and_login
+
+
+@pytest.fixture
+def restore_policy():
+    yield
+    PasswordHandler.configure("pbkdf2_sha256", rounds=1000)
+
+
+def test_needs_rehash_follows_the_policy(restore_policy):
+    weak = PasswordHandler.hash_password("secret123")
+    assert not PasswordHandler.needs_rehash(weak)
+
+    PasswordHandler.configure("pbkdf2_sha256", rounds=2000)
+    assert PasswordHandler.needs_rehash(weak)
+    assert PasswordHandler.verify_password("secret123", weak)
+    assert not PasswordHandler.needs_rehash(PasswordHandler.hash_password("secret123"))
+
+
+def test_other_schemes_verify_but_need_rehash():
+    legacy = build_context("scrypt", rounds=10).hash("secret123")
+    assert PasswordHandler.verify_password("secret123", legacy)
+    assert PasswordHandler.needs_rehash(legacy)
+
+
+def test_unknown_scheme_is_rejected():
+    with pytest.raises(ValueError):
+        build_context("md5_crypt")
+
+
+def test_login_rehashes_to_the_current_policy(client, run, restore_policy):
+    async def scenario():
+        await create_and_login(client, "Omega Corp", "admin@omega.example.com")
+        await AuthService.wait_for_rehashes()
+        admins = db.get_master_db().admins
+        old_hash = (await admins.find_one({"email": "admin@omega.example.com"}))["hashed_password"]
+
+        PasswordHandler.configure("pbkdf2_sha256", rounds=2000)
+        response = await client.post(
+            "/admin/login", json={"email": "admin@omega.example.com", "password": "secret123"}
+        )
+        assert response.status_code == 200, response.text
+        await AuthService.wait_for_rehashes()
+
+        new_hash = (await admins.find_one({"email": "admin@omega.example.com"}))["hashed_password"]
+        assert new_hash != old_hash
+        assert not PasswordHandler.needs_rehash(new_hash)
+        assert PasswordHandler.verify_password("secret123", new_hash)
+
+    run(scenario())
+
+
+def test_rehash_keeps_a_password_changed_meanwhile(database, run):
+    async def scenario():
+        admins = db.get_master_db().admins
+        stale_hash = PasswordHandler.hash_password("secret123")
+        current_hash = PasswordHandler.hash_password("changed123")
+        await admins.insert_one({"email": "admin@omega.example.com", "hashed_password": current_hash})
+        admin = await admins.find_one({"email": "admin@omega.example.com"})
+
+        assert not await AuthService.rehash_password({**admin, "hashed_password": stale_hash}, "secret123")
+        assert (await admins.find_one({"_id": admin["_id"]}))["hashed_password"] == current_hash
+
+    run(scenario())
@@ -0,0 +1,103 @@
+import pytest
+from app.config import get_settings
+from app.utils import rate_limiter as rate_limiter_module
+from app.utils.rate_limiter import InMemoryRateLimitBackend, RateLimiter, parse_limit
+
+settings = get_settings()
+
+
+@pytest.mark.parametrize("enabled", [True, False])
+def test_login_with_invalid_body_is_rejected_by_validation(client, run, monkeypatch, enabled):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", enabled)
+
+    async def scenario():
+        response = await client.post("/admin/login")
+        assert response.status_code == 422, response.text
+        response = await client.post("/admin/login", content=b"not json", headers={"Content-Type": "application/json"})
+        assert response.status_code == 422, response.text
+
+    run(scenario())
+
+
+def test_parse_limit():
+    assert parse_limit("10/minute") == (10.0, 10.0 / 60)
+    assert parse_limit("") is None
+    for value in ("10/fortnight", "0/second", "ten/minute"):
+        with pytest.raises(ValueError):
+            parse_limit(value)
+
+
+def test_bucket_refills_over_time(run, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(rate_limiter_module.time, "monotonic", lambda: now[0])
+    backend = InMemoryRateLimitBackend(max_keys=10)
+
+    async def scenario():
+        assert [await backend.acquire("k", 2, 1.0) for _ in range(2)] == [0.0, 0.0]
+        assert await backend.acquire("k", 2, 1.0) == pytest.approx(1.0)
+        now[0] += 0.5
+        assert await backend.acquire("k", 2, 1.0) == pytest.approx(0.5)
+        now[0] += 0.5
+        assert await backend.acquire("k", 2, 1.0) == 0.0
+        # Other keys have buckets of their own.
+        assert await backend.acquire("other", 2, 1.0) == 0.0
+
+    run(scenario())
+
+
+def test_least_recently_used_bucket_is_evicted(run):
+    backend = InMemoryRateLimitBackend(max_keys=2)
+
+    async def scenario():
+        for key in ("a", "b", "a", "c"):
+            await backend.acquire(key, 1, 1.0)
+        assert backend.stats() == {"backend": "memory", "keys": 2, "max_keys": 2, "evictions": 1}
+
+    run(scenario())
+
+
+def test_login_is_throttled_per_email(client, run, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(RateLimiter, "backend", InMemoryRateLimitBackend(max_keys=100))
+    monkeypatch.setitem(RateLimiter.limits, "login_ip", parse_limit("100/minute"))
+    monkeypatch.setitem(RateLimiter.limits, "login_email", parse_limit("2/minute"))
+
+    async def scenario():
+        credentials = {"email": "Admin@Xi.example.com", "password": "wrong-password"}
+        statuses = [(await client.post("/admin/login", json=credentials)).status_code for _ in range(2)]
+        assert statuses == [401, 401]
+
+        # Case and surrounding spaces do not open a new bucket.
+        response = await client.post("/admin/login", json={**credentials, "email": " admin@xi.example.com"})
+        assert response.status_code == 429, response.text
+        assert int(response.headers["Retry-After"]) == 30
+
+        response = await client.post("/admin/login", json={**credentials, "email": "other@xi.example.com"})
+        assert response.status_code == 401, response.text
+
+    run(scenario())
+
+
+def test_create_is_throttled_per_email(client, run, monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(RateLimiter, "backend", InMemoryRateLimitBackend(max_keys=100))
+    monkeypatch.setitem(RateLimiter.limits, "create_ip", parse_limit("100/minute"))
+    monkeypatch.setitem(RateLimiter.limits, "create_email", parse_limit("2/minute"))
+
+    async def scenario():
+        body = {"email": "admin@xi.example.com", "password": "secret123"}
+        response = await client.post("/org/create", json={**body, "organization_name": "Xi Corp"})
+        assert response.status_code == 201, response.text
+        response = await client.post("/org/create", json={**body, "organization_name": "Xi Two"})
+        assert response.status_code == 400, response.text
+
+        # The IP bucket still has room; the email bucket is empty.
+        response = await client.post("/org/create", json={**body, "organization_name": "Xi Three"})
+        assert response.status_code == 429, response.text
+
+        response = await client.post(
+            "/org/create", json={**body, "email": "other@xi.example.com", "organization_name": "Xi Three"}
+        )
+        assert response.status_code == 201, response.text
+
+    run(scenario())
@@ -0,0 +1,63 @@
+import re
+from app.config import get_settings
+from app.database import Database, db
+from app.services.organization_service import OrganizationService
+from app.services.reconciler import TenantReconciler
+
+settings = get_settings()
+
+
+class NameFilteringDatabase:
+    # mongomock's listCollections does not support $gt on name (and a filtered
+    # listing still shows dropped collections); apply the filter here and record
+    # the filters the reconciler sends.
+    def __init__(self, database, filters):
+        self._database = database
+        self._filters = filters
+
+    def __getitem__(self, name):
+        return self._database[name]
+
+    async def list_collection_names(self, filter):
+        self._filters.append(filter)
+        names = await self._database.list_collection_names()
+        return [name for name in names if re.match(filter["name"]["$regex"], name) and name > filter["name"]["$gt"]]
+
+
+def test_orphans_are_dropped_after_grace_period(database, run, monkeypatch):
+    filters = []
+    get_shard_db = Database.get_shard_db
+    monkeypatch.setattr(
+        Database,
+        "get_shard_db",
+        classmethod(lambda cls, shard=None: NameFilteringDatabase(get_shard_db(shard), filters)),
+    )
+    monkeypatch.setattr(settings, "RECONCILE_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "RECONCILE_GRACE_SECONDS", 60.0)
+    reconciler = TenantReconciler()
+
+    async def collection_names():
+        return sorted(name for name in await db.get_master_db().list_collection_names() if name.startswith("org_"))
+
+    async def scenario():
+        await OrganizationService.create_organization("Iota Corp", "admin@iota.example.com", "secret123")
+        await db.get_org_collection("org_orphan_a").insert_one({})
+        await db.get_org_collection("org_orphan_b").insert_one({})
+
+        # Two passes cover every name once; the orphans are only candidates yet.
+        await reconciler.drop_orphaned_collections()
+        await reconciler.drop_orphaned_collections()
+        assert filters == [
+            {"name": {"$gt": "", "$regex": "^org_"}},
+            {"name": {"$gt": "org_orphan_a", "$regex": "^org_"}},
+        ]
+        assert reconciler.stats()["orphan_candidates"] == 2
+        assert await collection_names() == ["org_iota_corp", "org_orphan_a", "org_orphan_b"]
+
+        monkeypatch.setattr(settings, "RECONCILE_GRACE_SECONDS", 0.0)
+        await reconciler.drop_orphaned_collections()
+        await reconciler.drop_orphaned_collections()
+        assert reconciler.orphans_dropped == 2
+        assert await collection_names() == ["org_iota_corp"]
+
+    run(scenario())
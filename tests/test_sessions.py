@@ -0,0 +1,88 @@
+from app.services.revocation_list import revocation_list
+from .conftest import create_and_login
+
+
+async def login(client, email: str, password: str = "secret123") -> dict:
+    response = await client.post("/admin/login", json={"email": email, "password": password})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def bearer(tokens: dict) -> dict:
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+def test_logout_revokes_access_and_refresh_tokens(client, run):
+    async def scenario():
+        await create_and_login(client, "Omega Corp", "admin@omega.example.com")
+        tokens = await login(client, "admin@omega.example.com")
+
+        response = await client.post("/admin/logout", headers=bearer(tokens))
+        assert response.status_code == 200, response.text
+
+        response = await client.get("/usage", headers=bearer(tokens))
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Token has been revoked"
+        response = await client.post("/admin/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 401, response.text
+
+    run(scenario())
+
+
+def test_refresh_rotates_and_reuse_revokes_the_session(client, run):
+    async def scenario():
+        await create_and_login(client, "Omega Corp", "admin@omega.example.com")
+        tokens = await login(client, "admin@omega.example.com")
+
+        response = await client.post("/admin/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 200, response.text
+        refreshed = response.json()
+        assert refreshed["refresh_token"] != tokens["refresh_token"]
+        assert (await client.get("/usage", headers=bearer(refreshed))).status_code == 200
+
+        # The replaced refresh token was copied: the whole session ends.
+        response = await client.post("/admin/refresh", json={"refresh_token": tokens["refresh_token"]})
+        assert response.status_code == 401, response.text
+        assert (await client.get("/usage", headers=bearer(refreshed))).status_code == 401
+        response = await client.post("/admin/refresh", json={"refresh_token": refreshed["refresh_token"]})
+        assert response.status_code == 401, response.text
+
+    run(scenario())
+
+
+def test_update_revokes_other_sessions_of_the_organization(client, run):
+    async def scenario():
+        await create_and_login(client, "Omega Corp", "admin@omega.example.com")
+        other_tenant = await create_and_login(client, "Alef Corp", "admin@alef.example.com")
+        current = await login(client, "admin@omega.example.com")
+        other_device = await login(client, "admin@omega.example.com")
+
+        response = await client.put(
+            "/org/update",
+            params={"old_organization_name": "Omega Corp"},
+            json={"organization_name": "Omega Corp", "email": "admin@omega.example.com", "password": "changed123"},
+            headers=bearer(current),
+        )
+        assert response.status_code == 200, response.text
+
+        assert (await client.get("/usage", headers=bearer(current))).status_code == 200
+        assert (await client.get("/usage", headers=bearer(other_device))).status_code == 401
+        assert (await client.get("/usage", headers=other_tenant)).status_code == 200
+
+    run(scenario())
+
+
+def test_revocations_reach_other_processes_through_sync(client, run):
+    async def scenario():
+        await create_and_login(client, "Omega Corp", "admin@omega.example.com")
+        tokens = await login(client, "admin@omega.example.com")
+        assert (await client.post("/admin/logout", headers=bearer(tokens))).status_code == 200
+
+        # A process that has not seen the revocation learns it from the database.
+        revocation_list._revoked.clear()
+        revocation_list._synced_at = None
+        assert (await client.get("/usage", headers=bearer(tokens))).status_code == 200
+        await revocation_list.sync()
+        assert (await client.get("/usage", headers=bearer(tokens))).status_code == 401
+
+    run(scenario())
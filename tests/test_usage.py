@@ -0,0 +1,77 @@
+import pytest
+from app.api import dependencies, usage
+from app.config import get_settings
+from app.services.usage_tracker import QuotaExceeded, UsageTracker
+from .conftest import create_and_login
+
+settings = get_settings()
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    monkeypatch.setattr(settings, "USAGE_TRACKING_ENABLED", True)
+    tracker = UsageTracker()
+    monkeypatch.setattr(dependencies, "usage_tracker", tracker)
+    monkeypatch.setattr(usage, "usage_tracker", tracker)
+    return tracker
+
+
+def test_daily_request_quota_is_enforced_per_organization(client, run, tracker, monkeypatch):
+    monkeypatch.setattr(settings, "USAGE_DAILY_REQUEST_QUOTA", 3)
+
+    async def scenario():
+        upsilon = await create_and_login(client, "Upsilon Corp", "admin@upsilon.example.com")
+        phi = await create_and_login(client, "Phi Corp", "admin@phi.example.com")
+
+        statuses = [(await client.get("/tenant/documents", headers=upsilon)).status_code for _ in range(4)]
+        assert statuses == [200, 200, 200, 429]
+        response = await client.get("/usage", headers=upsilon)
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) > 0
+
+        response = await client.get("/usage", headers=phi)
+        assert response.status_code == 200, response.text
+        assert response.json()["requests"] == 1 and response.json()["request_quota"] == 3
+
+    run(scenario())
+
+
+def test_flushed_counts_are_shared_without_double_counting(database, run, tracker):
+    other_process = UsageTracker()
+
+    async def scenario():
+        for _ in range(2):
+            tracker.record("org-1", "Chi Corp")
+        await tracker.flush()
+        await other_process.sync()
+        assert other_process.requests_today("org-1") == 2
+
+        other_process.record("org-1", "Chi Corp")
+        await other_process.flush()
+        await tracker.sync()
+        await other_process.sync()
+        assert tracker.requests_today("org-1") == 3
+        assert other_process.requests_today("org-1") == 3
+
+    run(scenario())
+
+
+def test_storage_quota_blocks_writes(client, run, tracker, monkeypatch):
+    monkeypatch.setattr(settings, "USAGE_STORAGE_QUOTA_BYTES", 1000)
+
+    async def scenario():
+        headers = await create_and_login(client, "Psi Corp", "admin@psi.example.com")
+        organization_id = (await client.get("/usage", headers=headers)).json()["organization_id"]
+
+        response = await client.post("/tenant/documents", json={"documents": [{"a": 1}]}, headers=headers)
+        assert response.status_code == 201, response.text
+
+        tracker._storage[organization_id] = 1000
+        response = await client.post("/tenant/documents", json={"documents": [{"a": 2}]}, headers=headers)
+        assert response.status_code == 403, response.text
+        response = await client.get("/tenant/documents", headers=headers)
+        assert response.status_code == 200, response.text
+        with pytest.raises(QuotaExceeded):
+            tracker.check_storage(organization_id)
+
+    run(scenario())